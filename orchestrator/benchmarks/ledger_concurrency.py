@@ -0,0 +1,156 @@
+"""
+Concurrency stress benchmark for the ORDAE ledger
+Starts several writer processes that append to one ledger at the same time
+(with small segments so rotation happens under contention), then checks that
+every entry landed exactly once and that the index points at the right lines
+
+Usage: python -m orchestrator.benchmarks.ledger_concurrency [--processes 8] [--entries 250] [--backend both]
+"""
+import multiprocessing
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+def open_ledger(backend: str, directory: Path, segment_bytes: int):
+    """Ledger of the given backend rooted in a scratch directory"""
+    if backend == "sqlite":
+        from orchestrator.tools.ledger_sqlite import SQLiteLedger
+        return SQLiteLedger(db_path=directory / "ledger.sqlite")
+    from orchestrator.tools.ledger import JSONLLedger
+    # Retention is disabled so every appended entry must still be present
+    return JSONLLedger(directory=directory / "ledger", segment_max_bytes=segment_bytes, max_segments=1_000_000)
+
+def make_entry(writer: int, sequence: int, payload_bytes: int) -> Dict[str, Any]:
+    """Ledger entry shaped like remember's, tagged with its writer and sequence number"""
+    return {
+        "version": 2,
+        "iteration": sequence,
+        "timestamp": datetime.now().isoformat(),
+        "run_id": f"writer-{writer}",
+        "decision": {"lane": "stress", "task": f"writer_{writer}", "target_university": None},
+        "evaluation": {"success": sequence % 2 == 0},
+        "payload": "x" * payload_bytes
+    }
+
+def writer_process(backend: str, directory: str, segment_bytes: int, writer: int, entries: int,
+                   payload_bytes: int, read_every: int, start_event) -> None:
+    """Append `entries` entries as fast as possible, reading the ledger now and then"""
+    ledger = open_ledger(backend, Path(directory), segment_bytes)
+    start_event.wait()
+    for sequence in range(entries):
+        ledger.append(make_entry(writer, sequence, payload_bytes))
+        if read_every and sequence % read_every == 0:
+            ledger.count()
+            ledger.tail(3)
+
+def verify(backend: str, directory: Path, segment_bytes: int, processes: int, entries: int) -> Dict[str, Any]:
+    """Count lost, duplicated and mis-indexed entries using a fresh ledger instance"""
+    ledger = open_ledger(backend, directory, segment_bytes)
+    expected = {(f"writer-{writer}", sequence) for writer in range(processes) for sequence in range(entries)}
+
+    seen: Dict[tuple, int] = {}
+    for entry in ledger.iter_entries():
+        key = (entry.get("run_id"), entry.get("iteration"))
+        seen[key] = seen.get(key, 0) + 1
+
+    misindexed = 0
+    for record in ledger.index():
+        entry = ledger.read(record)
+        if entry is None or (entry.get("run_id"), entry.get("iteration")) != (record.get("run_id"), record.get("iteration")):
+            misindexed += 1
+
+    return {
+        "stored": sum(seen.values()),
+        "indexed": ledger.count(),
+        "lost": len(expected - set(seen)),
+        "duplicated": sum(count - 1 for count in seen.values() if count > 1),
+        "misindexed": misindexed
+    }
+
+def run_backend(backend: str, processes: int, entries: int, payload_bytes: int, segment_bytes: int,
+                read_every: int) -> Dict[str, Any]:
+    """Run one stress round against a fresh scratch ledger"""
+    with tempfile.TemporaryDirectory(prefix=f"ordae-ledger-{backend}-") as scratch:
+        directory = Path(scratch)
+        start_event = multiprocessing.Event()
+        workers = [
+            multiprocessing.Process(
+                target=writer_process,
+                args=(backend, scratch, segment_bytes, writer, entries, payload_bytes, read_every, start_event)
+            )
+            for writer in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        started = time.perf_counter()
+        start_event.set()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+        result = verify(backend, directory, segment_bytes, processes, entries)
+        if backend == "jsonl":
+            result["segments"] = len(open_ledger(backend, directory, segment_bytes).segments())
+        result.update({
+            "backend": backend,
+            "seconds": elapsed,
+            "failed_writers": sum(1 for worker in workers if worker.exitcode != 0)
+        })
+        return result
+
+def main(
+    processes: int = typer.Option(8, "--processes", min=1, help="Concurrent writer processes"),
+    entries: int = typer.Option(250, "--entries", min=1, help="Entries appended by each writer"),
+    backend: str = typer.Option("both", "--backend", help="jsonl, sqlite or both"),
+    payload_bytes: int = typer.Option(512, "--payload-bytes", help="Padding per entry"),
+    segment_bytes: int = typer.Option(64 * 1024, "--segment-bytes", help="JSONL segment size (small to force rotation)"),
+    read_every: int = typer.Option(25, "--read-every", help="Each writer reads count/tail every N appends (0 = never)")
+):
+    """Stress concurrent ledger writers and verify no entries are lost"""
+    backends = ["jsonl", "sqlite"] if backend == "both" else [backend]
+    results: List[Dict[str, Any]] = [
+        run_backend(name, processes, entries, payload_bytes, segment_bytes, read_every) for name in backends
+    ]
+
+    total = processes * entries
+    table = Table(title=f"Ledger concurrency: {processes} writers x {entries} entries")
+    table.add_column("Backend")
+    table.add_column("Stored", justify="right")
+    table.add_column("Indexed", justify="right")
+    table.add_column("Lost", justify="right")
+    table.add_column("Duplicated", justify="right")
+    table.add_column("Misindexed", justify="right")
+    table.add_column("Segments", justify="right")
+    table.add_column("Entries/s", justify="right")
+    for result in results:
+        table.add_row(
+            result["backend"],
+            str(result["stored"]),
+            str(result["indexed"]),
+            str(result["lost"]),
+            str(result["duplicated"]),
+            str(result["misindexed"]),
+            str(result.get("segments", "-")),
+            f"{total / result['seconds']:.0f}"
+        )
+    console.print(table)
+
+    failed = [
+        result["backend"] for result in results
+        if result["lost"] or result["duplicated"] or result["misindexed"] or result["failed_writers"]
+        or result["stored"] != total or result["indexed"] != total
+    ]
+    if failed:
+        console.print(f"❌ Ledger corruption under concurrency: {', '.join(failed)}")
+        raise typer.Exit(code=1)
+    console.print(f"✅ All {total} entries stored exactly once per backend")
+
+if __name__ == "__main__":
+    typer.run(main)
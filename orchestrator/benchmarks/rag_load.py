@@ -0,0 +1,90 @@
+"""
+Cold-load benchmark for the RAG knowledge base
+Builds a synthetic rag/ tree by copying each university of the real one under
+many ids, compiles its bundle, then loads every university's context in fresh
+processes with the bundle enabled and disabled and compares the load times
+
+Usage: python -m orchestrator.benchmarks.rag_load [--universities 200] [--repeat 5]
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from orchestrator.tools.rag_bundle import compile_bundle
+
+console = Console()
+
+# Run in a fresh interpreter: imports are done before timing starts
+LOAD_SCRIPT = """
+import sys, time
+from orchestrator.tools.rag_loader import RAGLoader, rag_cache
+ids = sys.argv[1].split(",")
+started = time.perf_counter()
+loader = RAGLoader()
+for university_id in ids:
+    loader.get_university_context(university_id)
+print(time.perf_counter() - started, rag_cache.stats()["bundle_loads"])
+"""
+
+def make_rag_tree(source: Path, target: Path, universities: int) -> List[str]:
+    """Copy every university (and its program catalog) of source under `universities` synthetic ids"""
+    templates = sorted(path.name for path in (source / "universities").iterdir() if path.is_dir())
+    ids = []
+    for number in range(universities):
+        template = templates[number % len(templates)]
+        university_id = f"{template}{number:04d}"
+        shutil.copytree(source / "universities" / template, target / "universities" / university_id)
+        catalog = source / "program_catalog" / f"{template}_programs.yaml"
+        if catalog.exists():
+            (target / "program_catalog").mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(catalog, target / "program_catalog" / f"{university_id}_programs.yaml")
+        ids.append(university_id)
+    return ids
+
+def cold_load(workdir: Path, ids: List[str], bundle: bool) -> tuple:
+    """Seconds to load all contexts in a fresh process, and how many files came from the bundle"""
+    env = {**os.environ, "ORDAE_RAG_BUNDLE": "true" if bundle else "false",
+           "PYTHONPATH": os.pathsep.join([str(Path.cwd()), os.environ.get("PYTHONPATH", "")])}
+    result = subprocess.run([sys.executable, "-c", LOAD_SCRIPT, ",".join(ids)], cwd=workdir, env=env,
+                            capture_output=True, text=True, check=True)
+    seconds, bundle_loads = result.stdout.split()[-2:]
+    return float(seconds), int(bundle_loads)
+
+def main(
+    universities: int = typer.Option(200, "--universities", min=1, help="Synthetic universities in the knowledge base"),
+    repeat: int = typer.Option(5, "--repeat", min=1, help="Cold loads per path (median is reported)")
+):
+    """Compare cold-load time of the compiled RAG bundle against parsing YAML"""
+    with tempfile.TemporaryDirectory(prefix="ordae-rag-") as scratch:
+        workdir = Path(scratch)
+        ids = make_rag_tree(Path.cwd() / "rag", workdir / "rag", universities)
+        compiled = compile_bundle(workdir / "rag", workdir / "orchestrator" / "memory" / "rag_bundle")
+        if compiled["errors"]:
+            console.print(f"❌ RAG sources do not compile: {compiled['errors'][0]}")
+            raise typer.Exit(code=1)
+
+        results = {}
+        for label, bundle in (("YAML", False), ("Bundle", True)):
+            runs = [cold_load(workdir, ids, bundle) for _ in range(repeat)]
+            results[label] = (statistics.median(seconds for seconds, _ in runs), runs[0][1])
+
+    table = Table(title=f"RAG cold load: {universities} universities, {compiled['files']} files")
+    table.add_column("Path")
+    table.add_column("Median ms", justify="right")
+    table.add_column("Files from bundle", justify="right")
+    for label, (seconds, bundle_loads) in results.items():
+        table.add_row(label, f"{seconds * 1000:.1f}", str(bundle_loads))
+    console.print(table)
+    console.print(f"⚡ Bundle is {results['YAML'][0] / results['Bundle'][0]:.1f}x faster "
+                  f"({compiled['bundle_bytes'] / 1024:.0f} KB bundle from {compiled['source_bytes'] / 1024:.0f} KB of YAML)")
+
+if __name__ == "__main__":
+    typer.run(main)
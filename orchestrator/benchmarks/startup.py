@@ -0,0 +1,71 @@
+"""
+Startup benchmark for the ORDAE CLI
+Measures `python -X importtime` for orchestrator.graph and wall time of
+`graph --help`, and fails when either exceeds its budget
+
+Usage: python -m orchestrator.benchmarks.startup [--import-budget 0.5] [--help-budget 1.0]
+"""
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+def measure_import_time(module: str) -> List[Tuple[str, int, int]]:
+    """Run python -X importtime and return (module, self_us, cumulative_us) rows"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+def measure_command(args: List[str], repeat: int) -> float:
+    """Best-of-N wall time of a CLI invocation in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(
+    import_budget: float = typer.Option(0.5, "--import-budget", help="Max seconds to import orchestrator.graph"),
+    help_budget: float = typer.Option(1.0, "--help-budget", help="Max seconds for `graph --help`"),
+    top: int = typer.Option(10, "--top", help="Slowest imports to list"),
+    repeat: int = typer.Option(3, "--repeat", min=1, help="Runs per measurement (best is reported)")
+):
+    """Check ORDAE startup cost against its budget"""
+    rows = measure_import_time("orchestrator.graph")
+    import_seconds = next(cumulative for name, _, cumulative in rows if name == "orchestrator.graph") / 1e6
+    help_seconds = measure_command(["-m", "orchestrator.graph", "--help"], repeat)
+
+    table = Table(title=f"Slowest imports under orchestrator.graph (top {top})")
+    table.add_column("Module")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:top]:
+        table.add_row(name, f"{self_us / 1000:.1f}", f"{cumulative_us / 1000:.1f}")
+    console.print(table)
+
+    within_budget = import_seconds <= import_budget and help_seconds <= help_budget
+    console.print(f"📦 import orchestrator.graph: {import_seconds:.3f}s (budget {import_budget:.2f}s)")
+    console.print(f"❓ graph --help: {help_seconds:.3f}s (budget {help_budget:.2f}s)")
+    if not within_budget:
+        console.print("❌ Startup budget exceeded")
+        raise typer.Exit(code=1)
+    console.print("✅ Startup within budget")
+
+if __name__ == "__main__":
+    typer.run(main)
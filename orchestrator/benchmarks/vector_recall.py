@@ -0,0 +1,105 @@
+"""
+Recall benchmark for the local vector index
+Builds one index per storage dtype from the same synthetic, clustered
+embeddings and compares its top-k with exact float32 search, along with
+disk size, cold open time (map + first query) and query latency
+
+Usage: python -m orchestrator.benchmarks.vector_recall [--rows 20000] [--dimension 1536] [--k 10]
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+import numpy as np
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from orchestrator.tools.local_vector_index import LocalVectorIndex, VECTOR_FILES, normalize_rows
+
+console = Console()
+
+def make_vectors(rows: int, dimension: int, clusters: int, seed: int = 0) -> np.ndarray:
+    """Unit vectors scattered around random centers, closer to real embeddings than uniform noise"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimension)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, rows)] + 0.6 * rng.standard_normal((rows, dimension)).astype(np.float32)
+    return normalize_rows(vectors)
+
+def exact_top_k(vectors: np.ndarray, queries: np.ndarray, k: int) -> List[set]:
+    """Ground truth: float32 brute-force cosine top-k ids"""
+    scores = vectors @ queries.T
+    return [set(np.argsort(scores[:, column])[::-1][:k].tolist()) for column in range(len(queries))]
+
+def run_dtype(dtype: str, vectors: np.ndarray, queries: np.ndarray, truth: List[set], k: int,
+              ivf_threshold: int) -> Dict[str, Any]:
+    """Index `vectors` as `dtype` in a scratch directory and measure it against the ground truth"""
+    with tempfile.TemporaryDirectory(prefix=f"ordae-vectors-{dtype}-") as scratch:
+        directory = Path(scratch)
+        writer = LocalVectorIndex(directory, ivf_threshold=ivf_threshold, dtype=dtype)
+        for start in range(0, len(vectors), 10000):
+            batch = vectors[start:start + 10000]
+            writer.add([str(row) for row in range(start, start + len(batch))], batch,
+                       [{"row": row} for row in range(start, start + len(batch))])
+        disk_bytes = sum(path.stat().st_size for path in directory.iterdir() if path.suffix != ".lock")
+
+        # Cold open: a fresh instance maps the files and answers one query
+        started = time.perf_counter()
+        index = LocalVectorIndex(directory, ivf_threshold=ivf_threshold)
+        index.search(queries[0], k)
+        open_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = [index.search(query, k)[0] for query in queries]
+        query_seconds = (time.perf_counter() - started) / len(queries)
+
+        hits = sum(len(expected & {int(memory_id) for memory_id, _, _ in found}) for expected, found in zip(truth, results))
+        return {
+            "dtype": dtype,
+            "recall": hits / (k * len(queries)),
+            "disk_bytes": disk_bytes,
+            "open_seconds": open_seconds,
+            "query_seconds": query_seconds
+        }
+
+def main(
+    rows: int = typer.Option(20000, "--rows", min=1, help="Vectors in the index"),
+    dimension: int = typer.Option(1536, "--dimension", min=2, help="Vector dimension"),
+    queries: int = typer.Option(100, "--queries", min=1, help="Query vectors"),
+    k: int = typer.Option(10, "--k", min=1, help="Neighbours per query"),
+    clusters: int = typer.Option(64, "--clusters", min=1, help="Synthetic topic clusters"),
+    ivf: bool = typer.Option(False, "--ivf", help="Search through the IVF quantizer instead of exact scans"),
+    min_recall: float = typer.Option(0.9, "--min-recall", help="Fail when a quantized dtype recalls less")
+):
+    """Measure recall of quantized local vector storage against exact float32 search"""
+    vectors = make_vectors(rows, dimension, clusters)
+    query_vectors = make_vectors(queries, dimension, clusters, seed=1)
+    truth = exact_top_k(vectors, query_vectors, k)
+    ivf_threshold = 1 if ivf else rows + 1
+
+    results = [run_dtype(dtype, vectors, query_vectors, truth, k, ivf_threshold) for dtype in VECTOR_FILES]
+
+    table = Table(title=f"Local vector recall@{k}: {rows} x {dimension} ({'IVF' if ivf else 'exact'})")
+    table.add_column("Dtype")
+    table.add_column("Recall", justify="right")
+    table.add_column("Disk MB", justify="right")
+    table.add_column("Cold open ms", justify="right")
+    table.add_column("Query ms", justify="right")
+    for result in results:
+        table.add_row(
+            result["dtype"],
+            f"{result['recall']:.3f}",
+            f"{result['disk_bytes'] / 1e6:.1f}",
+            f"{result['open_seconds'] * 1000:.1f}",
+            f"{result['query_seconds'] * 1000:.2f}"
+        )
+    console.print(table)
+
+    failed = [result["dtype"] for result in results if result["recall"] < min_recall]
+    if failed:
+        console.print(f"❌ Recall below {min_recall}: {', '.join(failed)}")
+        raise typer.Exit(code=1)
+    console.print(f"✅ All storage dtypes recall at least {min_recall}")
+
+if __name__ == "__main__":
+    typer.run(main)
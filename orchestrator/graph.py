@@ -3,21 +3,38 @@
 PersonaOps ORDAE Graph - Main orchestrator for AI-First OPM system
 """
 import json
+import asyncio
+from contextlib import nullcontext
 import typer
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
-from langgraph.graph import StateGraph, END
-from typing import Dict, Any, TypedDict
+from typing import Annotated, Dict, Any, List, Optional, TypedDict
 
 from .nodes.observe import observe
-from .nodes.remember import remember
+from .nodes.remember import remember, memory_writer
 from .nodes.decide import decide
-from .nodes.act import act
+from .nodes.act import act, aact, act_university, aact_university, merge_university_actions
 from .nodes.evaluate import evaluate
+from .tools.checkpoint import new_run_id, open_checkpointer, open_async_checkpointer, persona_progress
+from .tools.watcher import InputWatcher, classify_changes
+from .tools.tracing import tracer, traced_node
 
 console = Console()
 
+# Used when strategic objectives do not set constraints.max_iterations
+DEFAULT_MAX_ITERATIONS = 10
+
+# Parallel act branches allowed at once in fan-out mode
+DEFAULT_MAX_CONCURRENCY = 4
+
+def merge_university_results(left: List[Dict[str, Any]], right: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reducer for fan-out results - keyed by university so re-sent state does not duplicate"""
+    merged = {result["university"]: result for result in left or []}
+    for result in right or []:
+        merged[result["university"]] = result
+    return list(merged.values())
+
 class ORDAEState(TypedDict):
     """State structure for ORDAE loop"""
     snapshot: Dict[str, Any]
@@ -25,56 +42,342 @@ class ORDAEState(TypedDict):
     actions: Dict[str, Any]
     evaluation: Dict[str, Any]
     iteration: int
+    run_id: str
+    # Set when a checkpointer persists the run; act then journals finished personas for --resume
+    checkpointed: bool
+    # Universities whose personas watch mode found stale; observe reports them missing for one iteration
+    stale_universities: List[str]
+    university_results: Annotated[List[Dict[str, Any]], merge_university_results]
+
+def route_decision(state: Dict[str, Any]):
+    """Dispatch every university that needs personas to its own act branch"""
+    from langgraph.types import Send
+    
+    decision = state.get("decision", {})
+    university_config = state.get("snapshot", {}).get("university_config")
+    
+    if decision.get("lane") == "university_onboarding" and university_config:
+        return [
+            Send("act_university", {
+                "university": uni,
+                "university_config": university_config,
+                "run_id": state.get("run_id"),
+                "iteration": state.get("iteration", 1),
+                "checkpointed": state.get("checkpointed", False)
+            })
+            for uni in decision.get("target_universities", [])
+        ]
+    return "act"
 
-def create_ordae_graph():
-    """Create the ORDAE workflow graph"""
+def create_ordae_graph(fan_out: bool = False, checkpointer=None, use_async: bool = False):
+    """
+    Create the ORDAE workflow graph
+    
+    remember runs last, so each ledger entry holds the iteration's own decision,
+    actions and evaluation. With fan_out, university onboarding runs one act branch
+    per pending university and the branches are joined before evaluate. A checkpointer persists state after
+    every node so an interrupted run can be resumed. use_async registers the async
+    act nodes; such a graph must be driven with ainvoke.
+    """
+    # langgraph dominates import time, so only pay for it when a graph is built
+    from langgraph.graph import StateGraph, END
+    
     workflow = StateGraph(ORDAEState)
     
-    # Add nodes
-    workflow.add_node("observe", observe)
-    workflow.add_node("remember", remember)
-    workflow.add_node("decide", decide)
-    workflow.add_node("act", act)
-    workflow.add_node("evaluate", evaluate)
+    # Add nodes (each wrapped in a tracing span)
+    workflow.add_node("observe", traced_node("observe", observe))
+    workflow.add_node("remember", traced_node("remember", remember))
+    workflow.add_node("decide", traced_node("decide", decide))
+    workflow.add_node("act", traced_node("act", aact if use_async else act))
+    workflow.add_node("evaluate", traced_node("evaluate", evaluate))
     
     # Define edges
     workflow.set_entry_point("observe")
-    workflow.add_edge("observe", "remember")
-    workflow.add_edge("remember", "decide")
-    workflow.add_edge("decide", "act")
+    workflow.add_edge("observe", "decide")
+    if fan_out:
+        workflow.add_node("act_university", traced_node("act_university", aact_university if use_async else act_university))
+        workflow.add_node("merge_university_actions", traced_node("merge_university_actions", merge_university_actions))
+        workflow.add_conditional_edges("decide", route_decision, ["act", "act_university"])
+        workflow.add_edge("act_university", "merge_university_actions")
+        workflow.add_edge("merge_university_actions", "evaluate")
+    else:
+        workflow.add_edge("decide", "act")
     workflow.add_edge("act", "evaluate")
-    workflow.add_edge("evaluate", END)
+    workflow.add_edge("evaluate", "remember")
+    workflow.add_edge("remember", END)
+    
+    return workflow.compile(checkpointer=checkpointer)
+
+def get_max_iterations(snapshot: Dict[str, Any], default: int = DEFAULT_MAX_ITERATIONS) -> int:
+    """Read the max_iterations constraint from the observed strategic objectives"""
+    objectives = snapshot.get("strategic_objectives") or {}
+    max_iterations = objectives.get("constraints", {}).get("max_iterations")
+    return max_iterations if max_iterations else default
+
+def next_iteration_state(result: Dict[str, Any]) -> ORDAEState:
+    """Carry decision, actions and evaluation of a finished iteration into the next one"""
+    return ORDAEState(
+        snapshot={},
+        decision=result.get("decision", {}),
+        actions=result.get("actions", {}),
+        evaluation=result.get("evaluation", {}),
+        iteration=result.get("iteration", 1) + 1,
+        run_id=result.get("run_id", ""),
+        checkpointed=result.get("checkpointed", False),
+        stale_universities=[],
+        university_results=[]
+    )
+
+def observed_missing(result: Dict[str, Any]) -> List[str]:
+    """Missing components observe reported at the start of a finished iteration"""
+    return result.get("snapshot", {}).get("missing_components", [])
+
+def ordae_loop_finished(result: Dict[str, Any], iterations: Optional[int] = None, first_iteration: int = 1,
+                        previous_missing: Optional[List[str]] = None) -> bool:
+    """
+    Check whether a finished iteration ends the loop
+    Iteration budgets are counted from first_iteration. An iteration changed nothing
+    when act created no files, or when it observed the same gaps as the one before
+    (previous_missing), i.e. the previous iteration's work did not close any
+    """
+    iteration = result.get("iteration", 1)
+    completed = iteration - first_iteration + 1
+    missing_components = observed_missing(result)
+    if not missing_components:
+        console.print(f"🏁 Converged after {iteration} iteration(s) - no missing components")
+        return True
+    if not result.get("actions", {}).get("files_created") or missing_components == previous_missing:
+        console.print(f"⏸️  Stopping after {completed} iteration(s) - no progress, still missing: {', '.join(missing_components)}")
+        return True
+    
+    limit = get_max_iterations(result.get("snapshot", {}))
+    if iterations is not None:
+        limit = min(iterations, limit)
+    if completed >= limit:
+        console.print(f"⏹️  Stopping after {completed} iteration(s) - still missing: {', '.join(missing_components)}")
+        return True
+    return False
+
+def run_ordae_loop(graph, initial_state: ORDAEState, iterations: Optional[int] = None,
+                   config: Optional[Dict[str, Any]] = None, first_iteration: int = 1,
+                   previous_missing: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Run the compiled ORDAE graph repeatedly in-process
+
+    Stops once observe reports no missing components, when an iteration made no
+    progress (created no files, or left the same components missing), when the requested
+    number of iterations has run, or when the objective's max_iterations constraint is reached.
+    """
+    state = initial_state
+    while True:
+        console.print(Panel(f"🔁 ORDAE Iteration {state['iteration']}", style="blue"))
+        with tracer.span("iteration", iteration=state["iteration"]):
+            result = graph.invoke(state, config=config)
+        if ordae_loop_finished(result, iterations, first_iteration, previous_missing):
+            return result
+        previous_missing = observed_missing(result)
+        state = next_iteration_state(result)
+
+def resume_ordae_loop(graph, config: Dict[str, Any], iterations: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Continue a checkpointed run from its last completed node, then keep looping
+    """
+    checkpoint = graph.get_state(config)
+    if not checkpoint.values:
+        raise ValueError(f"No checkpoint found for run {config['configurable']['thread_id']}")
+    
+    result = checkpoint.values
+    if checkpoint.next:
+        console.print(Panel(f"⏯️  Resuming iteration {result.get('iteration', 1)} at {', '.join(checkpoint.next)}", style="blue"))
+        # Passing None continues the interrupted iteration instead of starting a new one
+        result = graph.invoke(None, config=config)
+    
+    if ordae_loop_finished(result, iterations):
+        return result
+    return run_ordae_loop(graph, next_iteration_state(result), iterations, config,
+                          previous_missing=observed_missing(result))
+
+def watch_ordae_loop(graph, initial_state: ORDAEState, config: Dict[str, Any], watcher: InputWatcher,
+                     iterations: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Long-running daemon: converge once, then re-run whenever watched inputs change
+    Each burst starts a new iteration of the run and runs at most `iterations` iterations
+    (default: until converged), stopping early once an iteration changes nothing. Universities
+    whose RAG sources changed or whose persona files were deleted are rebuilt; bursts that
+    only edit existing persona files run nothing. The compiled graph, clients and parsed
+    configs stay warm between runs
+    """
+    state = initial_state
+    result: Dict[str, Any] = {}
+    try:
+        while True:
+            result = run_ordae_loop(graph, state, iterations, config, first_iteration=state["iteration"])
+            state = next_iteration_state(result)
+            university_config = result.get("snapshot", {}).get("university_config") or {}
+            university_ids = [uni.get("id") for uni in university_config.get("universities", []) if uni.get("id")]
+            
+            # Files the run wrote itself must not trigger the next run
+            watcher.rebaseline()
+            while True:
+                console.print("👀 Waiting for input changes (Ctrl+C to stop)...")
+                changed = watcher.wait_for_changes()
+                console.print(f"📂 {len(changed)} input file(s) changed: {', '.join(Path(path).name for path in changed[:5])}")
+                stale, other = classify_changes(changed, university_ids)
+                if stale or other:
+                    break
+                # Hand edits to existing personas need no rebuild
+                watcher.rebaseline()
+                console.print("✅ Only existing persona files were edited - nothing to re-run")
+            state["stale_universities"] = sorted(stale)
+            if stale:
+                console.print(f"♻️  Rebuilding personas for: {', '.join(sorted(stale))}")
+    except KeyboardInterrupt:
+        console.print("🛑 Watch mode stopped")
+    return result
+
+async def arun_ordae_loop(graph, initial_state: ORDAEState, iterations: Optional[int] = None,
+                          config: Optional[Dict[str, Any]] = None,
+                          previous_missing: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Async counterpart of run_ordae_loop for graphs built with use_async"""
+    state = initial_state
+    while True:
+        console.print(Panel(f"🔁 ORDAE Iteration {state['iteration']}", style="blue"))
+        with tracer.span("iteration", iteration=state["iteration"]):
+            result = await graph.ainvoke(state, config=config)
+        if ordae_loop_finished(result, iterations, previous_missing=previous_missing):
+            return result
+        previous_missing = observed_missing(result)
+        state = next_iteration_state(result)
+
+async def aresume_ordae_loop(graph, config: Dict[str, Any], iterations: Optional[int] = None) -> Dict[str, Any]:
+    """Async counterpart of resume_ordae_loop"""
+    checkpoint = await graph.aget_state(config)
+    if not checkpoint.values:
+        raise ValueError(f"No checkpoint found for run {config['configurable']['thread_id']}")
+    
+    result = checkpoint.values
+    if checkpoint.next:
+        console.print(Panel(f"⏯️  Resuming iteration {result.get('iteration', 1)} at {', '.join(checkpoint.next)}", style="blue"))
+        result = await graph.ainvoke(None, config=config)
+    
+    if ordae_loop_finished(result, iterations):
+        return result
+    return await arun_ordae_loop(graph, next_iteration_state(result), iterations, config,
+                                 previous_missing=observed_missing(result))
+
+def run_sync(initial_state: ORDAEState, config: Dict[str, Any], iterations: Optional[int],
+             fan_out: bool, checkpoint: bool, resume: Optional[str],
+             watcher: Optional[InputWatcher] = None) -> Dict[str, Any]:
+    """Build the graph (with a checkpointer when enabled) and run the loop"""
+    with open_checkpointer() if checkpoint or resume else nullcontext() as checkpointer:
+        if resume and checkpointer is None:
+            raise typer.BadParameter("--resume needs langgraph-checkpoint-sqlite installed")
+        graph = create_ordae_graph(fan_out=fan_out, checkpointer=checkpointer)
+        initial_state["checkpointed"] = checkpointer is not None
+        if checkpointer is not None:
+            console.print(f"🧷 Run id: {initial_state['run_id']} (resume with --resume {initial_state['run_id']})")
+        
+        if watcher is not None:
+            return watch_ordae_loop(graph, initial_state, config, watcher, iterations)
+        if resume:
+            return resume_ordae_loop(graph, config, iterations)
+        return run_ordae_loop(graph, initial_state, iterations, config)
+
+async def run_async(initial_state: ORDAEState, config: Dict[str, Any], iterations: Optional[int],
+                    fan_out: bool, checkpoint: bool, resume: Optional[str]) -> Dict[str, Any]:
+    """Build the async graph (with an async checkpointer when enabled) and run the loop"""
+    if not (checkpoint or resume):
+        graph = create_ordae_graph(fan_out=fan_out, use_async=True)
+        return await arun_ordae_loop(graph, initial_state, iterations, config)
     
-    return workflow.compile()
+    async with open_async_checkpointer() as checkpointer:
+        if resume and checkpointer is None:
+            raise typer.BadParameter("--resume needs langgraph-checkpoint-sqlite installed")
+        graph = create_ordae_graph(fan_out=fan_out, checkpointer=checkpointer, use_async=True)
+        initial_state["checkpointed"] = checkpointer is not None
+        if checkpointer is not None:
+            console.print(f"🧷 Run id: {initial_state['run_id']} (resume with --resume {initial_state['run_id']})")
+        if resume:
+            return await aresume_ordae_loop(graph, config, iterations)
+        return await arun_ordae_loop(graph, initial_state, iterations, config)
 
-def main(run: bool = typer.Option(False, "--run", help="Run the ORDAE loop")):
+def main(
+    run: bool = typer.Option(False, "--run", help="Run the ORDAE loop"),
+    iterations: Optional[int] = typer.Option(None, "--iterations", min=1, help="Run up to N ORDAE iterations in one process (per burst with --watch)"),
+    until_converged: bool = typer.Option(False, "--until-converged", help="Iterate until no components are missing or an iteration makes no progress (bounded by max_iterations)"),
+    fan_out: bool = typer.Option(False, "--fan-out", help="Onboard all pending universities in parallel act branches"),
+    max_concurrency: int = typer.Option(DEFAULT_MAX_CONCURRENCY, "--max-concurrency", min=1, help="Parallel act branches in fan-out mode"),
+    checkpoint: bool = typer.Option(False, "--checkpoint/--no-checkpoint", help="Persist state after every node so the run can be resumed"),
+    resume: Optional[str] = typer.Option(None, "--resume", help="Continue a checkpointed run from its last completed step"),
+    use_async: bool = typer.Option(False, "--async", help="Run the async graph with concurrent I/O inside nodes"),
+    watch: bool = typer.Option(False, "--watch", help="Keep running and re-run the loop when persona_data/ or rag/ change"),
+    poll_interval: float = typer.Option(1.0, "--poll-interval", help="Seconds between scans when filesystem notifications are unavailable"),
+    debounce: float = typer.Option(2.0, "--debounce", help="Quiet period in seconds before a burst of changes triggers a run"),
+    trace: bool = typer.Option(True, "--trace/--no-trace", help="Record per-node timing spans and print a summary")
+):
     """Main entry point for PersonaOps orchestrator"""
-    if not run:
+    if not run and iterations is None and not until_converged and resume is None and not watch:
         console.print(Panel("PersonaOps ORDAE System Ready", style="green"))
         console.print("Use --run flag to execute the ORDAE loop")
+        console.print("Use --iterations N or --until-converged to keep looping in-process")
+        console.print("Use --checkpoint to make a run resumable, --resume RUN_ID to continue it")
+        console.print("Use --watch to re-run the loop whenever inputs change")
         return
     
     console.print(Panel("🚀 Starting PersonaOps ORDAE Loop", style="bold blue"))
     
+    run_id = resume or new_run_id()
+    
     # Initialize state
     initial_state = ORDAEState(
         snapshot={},
         decision={},
         actions={},
         evaluation={},
-        iteration=1
+        iteration=1,
+        run_id=run_id,
+        checkpointed=False,
+        stale_universities=[],
+        university_results=[]
     )
     
-    # Create and run graph
-    graph = create_ordae_graph()
+    config: Dict[str, Any] = {"configurable": {"thread_id": run_id}}
+    if fan_out:
+        config["max_concurrency"] = max_concurrency
+    
+    # A plain --run keeps the original single-pass behaviour; a plain --watch converges on every burst
+    if until_converged:
+        iterations = None
+    elif iterations is None and not watch:
+        iterations = 1
+    
+    if watch and (use_async or resume):
+        raise typer.BadParameter("--watch cannot be combined with --async or --resume")
+    watcher = InputWatcher(poll_interval=poll_interval, debounce=debounce) if watch else None
+    if trace:
+        tracer.start(run_id)
     
     try:
-        result = graph.invoke(initial_state)
+        if use_async:
+            result = asyncio.run(run_async(initial_state, config, iterations, fan_out, checkpoint, resume))
+        else:
+            result = run_sync(initial_state, config, iterations, fan_out, checkpoint, resume, watcher)
         console.print(Panel("✅ ORDAE Loop Completed Successfully", style="green"))
         console.print(f"Final state: {json.dumps(result, indent=2)}")
     except Exception as e:
         console.print(Panel(f"❌ ORDAE Loop Failed: {str(e)}", style="red"))
         raise
+    finally:
+        # Ledger writes run behind the loop; make sure they land before reporting
+        memory_writer.flush()
+        persona_progress.close()
+        tracer.print_summary()
+        from .tools.rag_loader import rag_cache
+        stats = rag_cache.stats()
+        console.print(f"📚 RAG cache: {stats['hits']} hits, {stats['misses']} misses "
+                      f"({stats['hit_rate']:.0%} hit rate, {stats['bundle_loads']} from bundle), "
+                      f"{stats['invalidations']} reloaded, {stats['evictions']} evicted, "
+                      f"{stats['entries']} files cached")
 
 if __name__ == "__main__":
     typer.run(main)
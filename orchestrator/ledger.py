@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+PersonaOps ledger CLI - progress and history queries over the ORDAE ledger
+
+Usage: python -m orchestrator.ledger stats [--lane LANE] [--university UNI]
+       python -m orchestrator.ledger report [--period day|week|month] [--json PATH] [--csv DIR]
+       python -m orchestrator.ledger reindex
+       python -m orchestrator.ledger gc-blobs [--grace-seconds 3600]
+"""
+from pathlib import Path
+from typing import Any, Optional
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from .tools.blob_store import SWEEP_GRACE_SECONDS, blob_store, referenced_blobs
+from .tools.ledger import entry_fields, ledger
+from .tools.ledger_analytics import LedgerReport
+
+console = Console()
+app = typer.Typer(help="Query the ORDAE memory ledger")
+
+@app.callback()
+def main():
+    """PersonaOps ORDAE ledger tools"""
+
+@app.command()
+def stats(
+    lane: Optional[str] = typer.Option(None, "--lane", help="Count iterations spent on this lane"),
+    university: Optional[str] = typer.Option(None, "--university", help="Count iterations targeting this university")
+):
+    """Show entry counts, success rate and per-lane totals"""
+    summary = ledger.stats()
+    console.print(f"📒 Ledger backend: {type(ledger).__name__}")
+    console.print(f"🔢 Entries: {summary['entries']} ({summary['successful']} successful, {summary['success_rate']:.0%})")
+    if summary["entries"]:
+        console.print(f"🕒 From {summary['first_timestamp']} to {summary['last_timestamp']}")
+    
+    if lane or university:
+        iterations = ledger.iterations_for(lane=lane, university=university)
+        console.print(f"🎯 Iterations for lane={lane or '*'} university={university or '*'}: {iterations}")
+        return
+    
+    table = Table(title="Iterations by lane")
+    table.add_column("Lane")
+    table.add_column("Task")
+    table.add_column("University")
+    table.add_column("Entries", justify="right")
+    table.add_column("Success rate", justify="right")
+    for group in ledger.lane_stats():
+        table.add_row(
+            group["lane"] or "-",
+            group["task"] or "-",
+            group["target_university"] or "-",
+            str(group["entries"]),
+            f"{group['successes'] / group['entries']:.0%}" if group["entries"] else "-"
+        )
+    console.print(table)
+
+def _seconds(value: Optional[float]) -> str:
+    return f"{value:.1f}" if value is not None else "-"
+
+@app.command()
+def report(
+    period: str = typer.Option("day", "--period", help="Trend bucket: day, week or month"),
+    window: int = typer.Option(7, "--window", min=1, help="Periods in the rolling success rate"),
+    since: Optional[str] = typer.Option(None, "--since", help="Only entries at or after this ISO timestamp"),
+    until: Optional[str] = typer.Option(None, "--until", help="Only entries before this ISO timestamp"),
+    lane: Optional[str] = typer.Option(None, "--lane", help="Only entries for this lane"),
+    university: Optional[str] = typer.Option(None, "--university", help="Only entries targeting this university"),
+    max_gap: float = typer.Option(3600.0, "--max-gap", help="Longest gap (s) between entries of a run counted as a duration"),
+    scan_segments: bool = typer.Option(False, "--scan-segments", help="Read full entries instead of the index"),
+    json_path: Optional[Path] = typer.Option(None, "--json", help="Write the report to this JSON file"),
+    csv_dir: Optional[Path] = typer.Option(None, "--csv", help="Write lanes/decisions/trends CSVs to this directory")
+):
+    """Stream the ledger into success rates, decision distribution and duration trends"""
+    try:
+        analysis = LedgerReport(period=period, window=window, max_gap=max_gap)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+
+    # Both sources are streamed record by record; the index holds every field the report needs
+    records: Any = (entry_fields(entry) for entry in ledger.iter_entries()) if scan_segments else ledger.iter_records()
+    for record in records:
+        timestamp = record.get("timestamp") or ""
+        if (since and timestamp < since) or (until and timestamp >= until):
+            continue
+        if (lane and record.get("lane") != lane) or (university and record.get("target_university") != university):
+            continue
+        analysis.add(record)
+
+    summary = analysis.summary()
+    console.print(f"📒 Ledger backend: {type(ledger).__name__}")
+    console.print(f"🔢 Entries: {summary['entries']} ({summary['successful']} successful, {summary['success_rate']:.0%})")
+    if not summary["entries"]:
+        return
+    console.print(f"🕒 From {summary['first_timestamp']} to {summary['last_timestamp']}")
+    console.print(f"⏱️  Mean iteration duration: {_seconds(summary['mean_duration_s'])}s over {summary['timed_iterations']} timed iterations")
+
+    table = Table(title="Success rate by lane")
+    table.add_column("Lane")
+    table.add_column("Task")
+    table.add_column("University")
+    table.add_column("Entries", justify="right")
+    table.add_column("Success rate", justify="right")
+    table.add_column("Mean (s)", justify="right")
+    table.add_column("Max (s)", justify="right")
+    for row in analysis.lane_rows():
+        table.add_row(
+            row["lane"] or "-",
+            row["task"] or "-",
+            row["target_university"] or "-",
+            str(row["entries"]),
+            f"{row['success_rate']:.0%}",
+            _seconds(row["mean_duration_s"]),
+            _seconds(row["max_duration_s"])
+        )
+    console.print(table)
+
+    table = Table(title="Decision distribution")
+    table.add_column("Lane")
+    table.add_column("Task")
+    table.add_column("Count", justify="right")
+    table.add_column("Share", justify="right")
+    for row in analysis.decision_rows():
+        table.add_row(row["lane"] or "-", row["task"] or "-", str(row["count"]), f"{row['share']:.0%}")
+    console.print(table)
+
+    table = Table(title=f"Trend by {period} (rolling window {window})")
+    table.add_column("Period")
+    table.add_column("Entries", justify="right")
+    table.add_column("Success rate", justify="right")
+    table.add_column("Rolling", justify="right")
+    table.add_column("Mean (s)", justify="right")
+    for row in analysis.trend_rows():
+        table.add_row(
+            row["period"],
+            str(row["entries"]),
+            f"{row['success_rate']:.0%}",
+            f"{row['rolling_success_rate']:.0%}",
+            _seconds(row["mean_duration_s"])
+        )
+    console.print(table)
+
+    if json_path:
+        console.print(f"💾 Report written to {analysis.write_json(json_path)}")
+    if csv_dir:
+        for path in analysis.write_csv(csv_dir):
+            console.print(f"💾 CSV written to {path}")
+
+@app.command()
+def reindex():
+    """Rebuild the ledger index (and per-lane totals) from the stored entries"""
+    ledger.rebuild_index()
+    summary = ledger.stats()
+    console.print(f"🔁 Reindexed {summary['entries']} entries ({type(ledger).__name__})")
+
+@app.command("gc-blobs")
+def gc_blobs(
+    grace_seconds: float = typer.Option(SWEEP_GRACE_SECONDS, "--grace-seconds", min=0, help="Keep blobs written or reused this recently")
+):
+    """Delete snapshot blobs no retained ledger entry references (e.g. after segments expired)"""
+    removed = blob_store.sweep(referenced_blobs(ledger.iter_entries()), grace_seconds)
+    console.print(f"🧹 Removed {removed} unreferenced blobs from {blob_store.directory}")
+
+if __name__ == "__main__":
+    app()
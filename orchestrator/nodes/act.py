@@ -4,13 +4,33 @@ Director Agent (Act) - Issues concrete build/test/deploy instructions
 import json
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from rich.console import Console
-from ..tools.rag_loader import RAGLoader
+from ..tools.rag_loader import rag_loader
 from ..tools.supabase_client import supabase_integration
+from ..tools.checkpoint import persona_progress
+from ..tools.tracing import tracer
 
 console = Console()
 
+# Concurrent Supabase inserts / file writes per university in the async graph
+DEFAULT_IO_CONCURRENCY = 8
+
+def write_output(path: Path, content: str) -> None:
+    """Write a generated file; every write the director makes goes through here so it is counted as I/O"""
+    path.write_text(content)
+    tracer.count("io")
+
+def journal_run_id(state: Dict[str, Any]) -> Optional[str]:
+    """Run id to journal persona progress under; only checkpointed runs can be resumed"""
+    return state.get("run_id") if state.get("checkpointed") else None
+
+def persona_persisted(persona_id: str, action: str, persona_data_dir: Path) -> bool:
+    """Whether a journaled persona still exists; deleted persona files are created again"""
+    if action.startswith("Created persona in Supabase"):
+        return True
+    return (persona_data_dir / f"{persona_id}.json").exists()
+
 def act(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Execute actions based on strategic decision
@@ -24,6 +44,7 @@ def act(state: Dict[str, Any]) -> Dict[str, Any]:
     
     cmds = []
     actions_taken = []
+    per_university = {}
     
     if lane == "university_onboarding" and task == "create_university_personas":
         # Create personas for specific university
@@ -31,8 +52,10 @@ def act(state: Dict[str, Any]) -> Dict[str, Any]:
         university_config = state.get("snapshot", {}).get("university_config")
         
         if target_university and university_config:
-            personas_created = create_university_personas(target_university, university_config)
+            personas_created = create_university_personas(target_university, university_config, journal_run_id(state),
+                                                          state.get("iteration", 1))
             actions_taken.extend(personas_created)
+            per_university[target_university] = len(personas_created)
             cmds.extend([
                 f"# university_onboarding_{target_university}",
                 f"echo 'Created {len(personas_created)} personas for {target_university}'"
@@ -94,7 +117,7 @@ export default function Attribution() {
     </main>
   );
 }'''
-            attribution_file.write_text(attribution_content)
+            write_output(attribution_file, attribution_content)
             actions_taken.append(f"Created attribution page: {attribution_file}")
             console.print(f"✅ Created {attribution_file}")
         
@@ -143,7 +166,7 @@ Career changers respond better to LinkedIn messaging focused on "transformation"
 ---
 *Generated by PersonaOps ORDAE System*
 '''
-            ab_plan_file.write_text(ab_plan_content)
+            write_output(ab_plan_file, ab_plan_content)
             actions_taken.append(f"Created AB testing plan: {ab_plan_file}")
             console.print(f"✅ Created {ab_plan_file}")
         
@@ -159,6 +182,8 @@ Career changers respond better to LinkedIn messaging focused on "transformation"
         "files_created": actions_taken,
         "status": "completed" if actions_taken else "no_action_needed"
     }
+    if per_university:
+        actions["per_university"] = per_university
     
     console.print(f"🎬 Executed {len(actions_taken)} actions")
     for action in actions_taken:
@@ -167,130 +192,324 @@ Career changers respond better to LinkedIn messaging focused on "transformation"
     state["actions"] = actions
     return state
 
-def create_university_personas(university_id: str, university_config: dict) -> list:
-    """Create personas for university programs using RAG data and store in Supabase"""
-    console.print(f"🎓 Creating personas for {university_id} university...")
+def act_university(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fan-out branch of the Director Agent - creates personas for a single university
+    Receives a Send payload from the graph and reports into university_results
+    """
+    university_id = payload["university"]
+    personas_created = create_university_personas(university_id, payload["university_config"], journal_run_id(payload),
+                                                  payload.get("iteration", 1))
+    return {
+        "university_results": [{
+            "university": university_id,
+            "files_created": personas_created
+        }]
+    }
+
+def build_university_actions(decision: Dict[str, Any], personas_by_university: Dict[str, list]) -> Dict[str, Any]:
+    """Build one actions record from the personas created for each target university"""
+    cmds = []
+    actions_taken = []
+    per_university = {}
+    for uni in decision.get("target_universities", []):
+        personas_created = personas_by_university.get(uni, [])
+        actions_taken.extend(personas_created)
+        per_university[uni] = len(personas_created)
+        cmds.extend([
+            f"# university_onboarding_{uni}",
+            f"echo 'Created {len(personas_created)} personas for {uni}'"
+        ])
     
-    repo_root = Path.cwd()
-    persona_data_dir = repo_root / "persona_data"
-    persona_data_dir.mkdir(exist_ok=True)
+    return {
+        "lane": decision.get("lane", ""),
+        "task": decision.get("task", ""),
+        "commands": cmds,
+        "files_created": actions_taken,
+        "per_university": per_university,
+        "status": "completed" if actions_taken else "no_action_needed"
+    }
+
+def merge_university_actions(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Join the fan-out branches into a single actions record for the Critic Agent
+    """
+    decision = state.get("decision", {})
+    targets = decision.get("target_universities", [])
     
-    # Load RAG data for the university
-    rag_loader = RAGLoader()
-    rag_data = {
+    # Results from earlier iterations can linger in the reducer; keep this decision's only
+    personas_by_university = {
+        result["university"]: result.get("files_created", [])
+        for result in state.get("university_results", [])
+        if result.get("university") in targets
+    }
+    
+    state["actions"] = build_university_actions(decision, personas_by_university)
+    console.print(f"🎬 Merged {len(targets)} university branches - {len(state['actions']['files_created'])} actions")
+    return state
+
+async def aact(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Async Director Agent used by the async graph
+    University onboarding overlaps its I/O; other lanes run the sync act in a worker thread
+    """
+    decision = state.get("decision", {})
+    university_config = state.get("snapshot", {}).get("university_config")
+    
+    if decision.get("lane") != "university_onboarding" or not university_config:
+        return await asyncio.to_thread(act, state)
+    
+    console.print("⚡ [bold red]Director Agent:[/bold red] Taking action (async)...")
+    
+    # The serial act only handles the first pending university
+    target_university = decision.get("target_university")
+    personas_created = await acreate_university_personas(target_university, university_config, journal_run_id(state),
+                                                         state.get("iteration", 1))
+    
+    state["actions"] = build_university_actions(
+        {**decision, "target_universities": [target_university]},
+        {target_university: personas_created}
+    )
+    console.print(f"🎬 Executed {len(personas_created)} actions")
+    return state
+
+async def aact_university(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Async fan-out branch of the Director Agent
+    """
+    university_id = payload["university"]
+    personas_created = await acreate_university_personas(university_id, payload["university_config"], journal_run_id(payload),
+                                                         payload.get("iteration", 1))
+    return {
+        "university_results": [{
+            "university": university_id,
+            "files_created": personas_created
+        }]
+    }
+
+def load_university_rag_data(university_id: str) -> dict:
+    """Load the RAG knowledge base sections used to enhance personas (cached process-wide)"""
+    return {
         'brand_guidelines': rag_loader.load_university_brand_guidelines(university_id),
         'voice_tone': rag_loader.load_university_voice_tone(university_id),
         'messaging': rag_loader.load_university_messaging(university_id),
         'programs': rag_loader.load_program_catalog(university_id)
     }
+
+def find_university(university_config: dict, university_id: str) -> dict:
+    """Find a university entry in the config, None when it is not configured"""
+    for uni in university_config.get("universities", []):
+        if uni.get("id") == university_id:
+            return uni
+    return None
+
+def iter_persona_specs(university: dict):
+    """Yield (program, persona_type) for every persona a university should have"""
+    for program in university.get("programs", []):
+        console.print(f"📚 Processing program: {program.get('name')}")
+        for persona_type in program.get("target_personas", []):
+            yield program, persona_type
+
+def build_persona_data(university: dict, program: dict, persona_type: str,
+                       university_config: dict, rag_data: dict) -> dict:
+    """Build the persona record for one program/persona type, enhanced with RAG data"""
+    university_id = university.get("id")
+    program_id = program.get("id")
+    persona_id = f"{university_id}_{program_id}_{persona_type}"
+    
+    # Get persona template from config
+    persona_template = university_config.get("persona_templates", {}).get(persona_type, {})
+    
+    # Create enhanced persona data with RAG integration
+    persona_data = {
+        "id": persona_id,
+        "university": {
+            "id": university_id,
+            "name": university.get("name")
+        },
+        "program": {
+            "id": program_id,
+            "name": program.get("name"),
+            "enrollment_goal": program.get("enrollment_goals", 100)
+        },
+        "persona_type": persona_type,
+        "demographics": persona_template.get("demographics", {}),
+        "motivations": persona_template.get("motivations", []),
+        "pain_points": persona_template.get("pain_points", []),
+        "preferred_channels": persona_template.get("channels", []),
+        "behavior_patterns": {
+            "research_phase_duration": "2-4 weeks",
+            "decision_factors": [
+                "program_reputation",
+                "flexibility", 
+                "cost",
+                "career_outcomes"
+            ],
+            "content_preferences": [
+                "case_studies",
+                "alumni_testimonials", 
+                "program_details"
+            ]
+        },
+        "conversion_triggers": {
+            "primary": "application_deadline_approaching",
+            "secondary": [
+                "scholarship_availability",
+                "peer_recommendations",
+                "career_advancement_urgency"
+            ]
+        },
+        "attribution_data": {
+            "typical_touchpoints": 7,
+            "conversion_timeline": "30-60 days",
+            "high_value_channels": persona_template.get("channels", [])[:2]
+        },
+        "created_by": "ordae_system",
+        "created_at": str(Path.cwd()),
+        "data_completeness": 0.85
+    }
+    
+    # Enhance with RAG data if available
+    if rag_data:
+        persona_data = enhance_persona_with_rag(persona_data, rag_data, program_id, persona_type)
+    
+    return persona_data
+
+def persist_persona(persona_data: dict, persona_data_dir: Path, org_uuid: str = None) -> str:
+    """Store a persona in Supabase if connected, otherwise save to file; returns the action taken"""
+    persona_id = persona_data["id"]
+    persona_file = persona_data_dir / f"{persona_id}.json"
+    
+    if supabase_integration.is_connected() and org_uuid:
+        supabase_persona_id = supabase_integration.create_persona(persona_data, "ordae-system", org_uuid)
+        if supabase_persona_id:
+            console.print(f"✅ Created persona in Supabase: {persona_id}")
+            return f"Created persona in Supabase: {persona_id}"
+        
+        # Fallback to file storage
+        write_output(persona_file, json.dumps(persona_data, indent=2))
+        console.print(f"⚠️  Created persona file as fallback: {persona_id}")
+        return f"Created persona file (Supabase failed): {persona_file}"
+    
+    # Save persona to file as fallback
+    write_output(persona_file, json.dumps(persona_data, indent=2))
+    console.print(f"✅ Created persona file: {persona_id}")
+    return f"Created persona file: {persona_file}"
+
+def create_university_personas(university_id: str, university_config: dict, run_id: str = None,
+                               iteration: int = 1) -> list:
+    """
+    Create personas for university programs using RAG data and store in Supabase
+    With a run_id, every finished persona is journaled under the iteration and skipped
+    when that iteration resumes, as long as its persona file still exists
+    """
+    console.print(f"🎓 Creating personas for {university_id} university...")
+    
+    repo_root = Path.cwd()
+    persona_data_dir = repo_root / "persona_data"
+    persona_data_dir.mkdir(exist_ok=True)
+    
+    # Load RAG data for the university
+    rag_data = load_university_rag_data(university_id)
     
     actions_taken = []
     
     # Find the university in config
-    university = None
-    for uni in university_config.get("universities", []):
-        if uni.get("id") == university_id:
-            university = uni
-            break
-    
+    university = find_university(university_config, university_id)
     if not university:
         console.print(f"❌ University {university_id} not found in config")
         return actions_taken
     
+    # Personas finished before this iteration was interrupted
+    completed = {
+        persona_id: action
+        for persona_id, action in (persona_progress.completed(run_id, iteration, university_id) if run_id else {}).items()
+        if persona_persisted(persona_id, action, persona_data_dir)
+    }
+    if completed:
+        console.print(f"⏯️  Resuming {university_id}: {len(completed)} personas already created")
+    
     # Ensure organization exists in Supabase and get UUID
     org_uuid = None
     if supabase_integration.is_connected():
         org_uuid = supabase_integration.create_organization_if_not_exists(university)
     
     # Create personas for each program
-    for program in university.get("programs", []):
-        program_id = program.get("id")
-        program_name = program.get("name")
-        target_personas = program.get("target_personas", [])
-        
-        console.print(f"📚 Processing program: {program_name}")
+    for program, persona_type in iter_persona_specs(university):
+        persona_id = f"{university_id}_{program.get('id')}_{persona_type}"
+        if persona_id in completed:
+            actions_taken.append(completed[persona_id])
+            continue
         
-        for persona_type in target_personas:
-            persona_id = f"{university_id}_{program_id}_{persona_type}"
-            persona_file = persona_data_dir / f"{persona_id}.json"
-            
-            # Get persona template from config
-            persona_template = university_config.get("persona_templates", {}).get(persona_type, {})
-            
-            # Create enhanced persona data with RAG integration
-            persona_data = {
-                "id": persona_id,
-                "university": {
-                    "id": university_id,
-                    "name": university.get("name")
-                },
-                "program": {
-                    "id": program_id,
-                    "name": program_name,
-                    "enrollment_goal": program.get("enrollment_goals", 100)
-                },
-                "persona_type": persona_type,
-                "demographics": persona_template.get("demographics", {}),
-                "motivations": persona_template.get("motivations", []),
-                "pain_points": persona_template.get("pain_points", []),
-                "preferred_channels": persona_template.get("channels", []),
-                "behavior_patterns": {
-                    "research_phase_duration": "2-4 weeks",
-                    "decision_factors": [
-                        "program_reputation",
-                        "flexibility", 
-                        "cost",
-                        "career_outcomes"
-                    ],
-                    "content_preferences": [
-                        "case_studies",
-                        "alumni_testimonials", 
-                        "program_details"
-                    ]
-                },
-                "conversion_triggers": {
-                    "primary": "application_deadline_approaching",
-                    "secondary": [
-                        "scholarship_availability",
-                        "peer_recommendations",
-                        "career_advancement_urgency"
-                    ]
-                },
-                "attribution_data": {
-                    "typical_touchpoints": 7,
-                    "conversion_timeline": "30-60 days",
-                    "high_value_channels": persona_template.get("channels", [])[:2]
-                },
-                "created_by": "ordae_system",
-                "created_at": str(Path.cwd()),
-                "data_completeness": 0.85
-            }
+        with tracer.span("persona", persona_id=persona_id):
+            persona_data = build_persona_data(university, program, persona_type, university_config, rag_data)
+            action = persist_persona(persona_data, persona_data_dir, org_uuid)
+            actions_taken.append(action)
             
-            # Enhance with RAG data if available
-            if rag_data:
-                persona_data = enhance_persona_with_rag(persona_data, rag_data, program_id, persona_type)
-            
-            # Store in Supabase if connected, otherwise save to file
-            if supabase_integration.is_connected() and org_uuid:
-                supabase_persona_id = supabase_integration.create_persona(persona_data, "ordae-system", org_uuid)
-                if supabase_persona_id:
-                    actions_taken.append(f"Created persona in Supabase: {persona_id}")
-                    console.print(f"✅ Created persona in Supabase: {persona_id}")
-                else:
-                    # Fallback to file storage
-                    with open(persona_file, 'w') as f:
-                        json.dump(persona_data, f, indent=2)
-                    actions_taken.append(f"Created persona file (Supabase failed): {persona_file}")
-                    console.print(f"⚠️  Created persona file as fallback: {persona_id}")
-            else:
-                # Save persona to file as fallback
-                with open(persona_file, 'w') as f:
-                    json.dump(persona_data, f, indent=2)
-                actions_taken.append(f"Created persona file: {persona_file}")
-                console.print(f"✅ Created persona file: {persona_id}")
+            if run_id:
+                persona_progress.record(run_id, iteration, university_id, persona_id, action)
     
     return actions_taken
 
+async def acreate_university_personas(university_id: str, university_config: dict, run_id: str = None,
+                                      iteration: int = 1, max_concurrency: int = DEFAULT_IO_CONCURRENCY) -> list:
+    """
+    Async variant of create_university_personas
+    RAG reads, the organization lookup and every persona insert/write run concurrently
+    in worker threads, bounded by a semaphore of max_concurrency
+    """
+    console.print(f"🎓 Creating personas for {university_id} university (async)...")
+    
+    repo_root = Path.cwd()
+    persona_data_dir = repo_root / "persona_data"
+    persona_data_dir.mkdir(exist_ok=True)
+    
+    university = find_university(university_config, university_id)
+    if not university:
+        console.print(f"❌ University {university_id} not found in config")
+        return []
+    
+    async def load_organization():
+        if not supabase_integration.is_connected():
+            return None
+        return await asyncio.to_thread(supabase_integration.create_organization_if_not_exists, university)
+    
+    # RAG YAML reads, the progress journal and the organization round-trip overlap
+    rag_data, journaled, org_uuid = await asyncio.gather(
+        asyncio.to_thread(load_university_rag_data, university_id),
+        asyncio.to_thread(persona_progress.completed, run_id, iteration, university_id) if run_id else asyncio.sleep(0, {}),
+        load_organization()
+    )
+    completed = {
+        persona_id: action for persona_id, action in journaled.items()
+        if persona_persisted(persona_id, action, persona_data_dir)
+    }
+    if completed:
+        console.print(f"⏯️  Resuming {university_id}: {len(completed)} personas already created")
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    def persist_and_record(persona_data: dict) -> str:
+        action = persist_persona(persona_data, persona_data_dir, org_uuid)
+        if run_id:
+            persona_progress.record(run_id, iteration, university_id, persona_data["id"], action)
+        return action
+    
+    async def create_one(program: dict, persona_type: str) -> str:
+        persona_id = f"{university_id}_{program.get('id')}_{persona_type}"
+        if persona_id in completed:
+            return completed[persona_id]
+        async with semaphore:
+            with tracer.span("persona", persona_id=persona_id):
+                persona_data = build_persona_data(university, program, persona_type, university_config, rag_data)
+                return await asyncio.to_thread(persist_and_record, persona_data)
+    
+    # gather keeps the config order of personas in the returned actions
+    return list(await asyncio.gather(*[
+        create_one(program, persona_type)
+        for program, persona_type in iter_persona_specs(university)
+    ]))
+
 def enhance_persona_with_rag(persona_data: dict, rag_data: dict, program_id: str, persona_type: str) -> dict:
     """Enhance persona data with RAG knowledge base information"""
     
@@ -410,8 +629,7 @@ Comprehensive campaign optimization based on persona analysis and university pro
 *Generated by PersonaOps ORDAE System*
 """
     
-    with open(campaign_strategy_file, 'w') as f:
-        f.write(strategy_content)
+    write_output(campaign_strategy_file, strategy_content)
     
     actions_taken.append(f"Created campaign strategy: {campaign_strategy_file}")
     
@@ -23,18 +23,32 @@ def decide(state: Dict[str, Any]) -> Dict[str, Any]:
         universities = strategic_objectives.get("universities", [])
         persona_analysis = snapshot.get("persona_data", {}).get("completeness_analysis", {})
         
-        # Find first university that needs personas
-        for uni in universities:
-            if f"personas_for_{uni}" in missing_components:
-                decision = {
-                    "lane": "university_onboarding",
-                    "task": "create_university_personas",
-                    "target_university": uni,
-                    "reasoning": f"Strategic objective: Create personas for {uni} university programs"
-                }
-                console.print(f"🎓 Decision: University onboarding - Create personas for {uni}")
-                state["decision"] = decision
-                return state
+        # Collect every university that needs personas; the serial act node handles
+        # the first one, the fan-out graph dispatches all of them in parallel
+        pending = [uni for uni in universities if f"personas_for_{uni}" in missing_components]
+        if pending:
+            uni = pending[0]
+            decision = {
+                "lane": "university_onboarding",
+                "task": "create_university_personas",
+                "target_university": uni,
+                "target_universities": pending,
+                "reasoning": f"Strategic objective: Create personas for {uni} university programs"
+            }
+            console.print(f"🎓 Decision: University onboarding - Create personas for {', '.join(pending)}")
+            state["decision"] = decision
+            return state
+        
+        # Every mission needs the attribution page observe checks for
+        if "attribution_page" in missing_components:
+            decision = {
+                "lane": "product",
+                "task": "build_attribution_page",
+                "reasoning": "All university personas created - attribution page missing"
+            }
+            console.print("🏗️  Decision: Product lane - Build attribution page")
+            state["decision"] = decision
+            return state
         
         # If all universities have personas, move to campaign optimization
         decision = {
@@ -39,6 +39,21 @@ def evaluate(state: Dict[str, Any]) -> Dict[str, Any]:
             evaluation["validation_results"].append("❌ Attribution page creation failed")
             evaluation["recommendations"].append("Retry attribution page creation with error handling")
     
+    # Validate university onboarding outcomes (serial or fan-out)
+    elif decision.get("lane") == "university_onboarding":
+        per_university = actions.get("per_university", {})
+        
+        for uni, persona_count in per_university.items():
+            if persona_count:
+                evaluation["validation_results"].append(f"✅ Created {persona_count} personas for {uni}")
+            else:
+                evaluation["validation_results"].append(f"❌ No personas created for {uni}")
+                evaluation["recommendations"].append(f"Retry persona creation for {uni}")
+        
+        evaluation["success"] = bool(per_university) and all(per_university.values())
+        if evaluation["success"]:
+            evaluation["next_iteration_focus"] = "campaign_optimization"
+    
     # Validate marketing lane outcomes  
     elif decision.get("lane") == "marketing":
         repo_root = Path.cwd()
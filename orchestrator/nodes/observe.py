@@ -1,10 +1,11 @@
 """
 Analyst Agent (Observe) - Reads persona_data and app repo, detects missing pieces
 """
-import json
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 from rich.console import Console
+from ..tools.manifest import observe_manifest
 
 console = Console()
 
@@ -19,40 +20,37 @@ def observe(state: Dict[str, Any]) -> Dict[str, Any]:
     persona_data_dir = repo_root / "persona_data"
     app_dir = repo_root / "src"
     
-    # Check persona data
-    persona_files = []
-    if persona_data_dir.exists():
-        persona_files = list(persona_data_dir.glob("*.json")) + list(persona_data_dir.glob("*.yaml"))
+    # Check persona data - one (manifest-cached) listing serves every existence check below
+    persona_dir_entries = observe_manifest.list_dir(persona_data_dir)
+    persona_dir_names = set(persona_dir_entries)
+    persona_files = (
+        [name for name in persona_dir_entries if name.endswith(".json")] +
+        [name for name in persona_dir_entries if name.endswith(".yaml")]
+    )
     
     # Check for strategic objectives
-    objectives_file = persona_data_dir / "strategic_objectives.json"
     strategic_objectives = None
-    if objectives_file.exists():
-        with open(objectives_file, 'r') as f:
-            strategic_objectives = json.load(f)
+    if "strategic_objectives.json" in persona_dir_names:
+        strategic_objectives = observe_manifest.load_json(persona_data_dir / "strategic_objectives.json")
     
     # Check university configuration
-    university_config_file = persona_data_dir / "university_config.json"
     university_config = None
-    if university_config_file.exists():
-        with open(university_config_file, 'r') as f:
-            university_config = json.load(f)
-    
-    # Check app structure
-    app_has_attribution_page = False
-    if app_dir.exists():
-        pages_dir = app_dir / "pages"
-        if pages_dir.exists():
-            attribution_files = list(pages_dir.glob("*attribution*"))
-            app_has_attribution_page = len(attribution_files) > 0
+    if "university_config.json" in persona_dir_names:
+        university_config = observe_manifest.load_json(persona_data_dir / "university_config.json")
+    
+    # Check app structure (act writes the page as Attribution.tsx)
+    app_has_attribution_page = any(
+        "attribution" in name.lower() for name in observe_manifest.list_dir(app_dir / "pages")
+    )
     
     # Check for existing AB plans
-    ab_plan_exists = False
-    if persona_data_dir.exists():
-        ab_plan_exists = (persona_data_dir / "AB_PLAN.md").exists()
+    ab_plan_exists = "AB_PLAN.md" in persona_dir_names
+    
+    # Feedback from the previous iteration's Critic Agent (empty on the first iteration)
+    previous_evaluation = state.get("evaluation") or {}
     
     # Analyze persona completeness
-    persona_analysis = analyze_persona_completeness(persona_data_dir, university_config)
+    persona_analysis = analyze_persona_completeness(persona_data_dir, university_config, persona_dir_names)
     
     snapshot = {
         "timestamp": str(Path.cwd()),
@@ -61,7 +59,7 @@ def observe(state: Dict[str, Any]) -> Dict[str, Any]:
         "persona_data": {
             "directory_exists": persona_data_dir.exists(),
             "file_count": len(persona_files),
-            "files": [f.name for f in persona_files],
+            "files": persona_files,
             "completeness_analysis": persona_analysis
         },
         "repo_state": {
@@ -69,16 +67,23 @@ def observe(state: Dict[str, Any]) -> Dict[str, Any]:
             "app_has_attribution_page": app_has_attribution_page,
             "ab_plan_exists": ab_plan_exists
         },
+        "previous_evaluation": {
+            "success": previous_evaluation.get("success", False),
+            "next_iteration_focus": previous_evaluation.get("next_iteration_focus", ""),
+            "recommendations": previous_evaluation.get("recommendations", [])
+        } if previous_evaluation else {},
         "missing_components": []
     }
     
     # Identify missing components based on strategic objectives
+    # (watch mode marks universities whose RAG sources changed or persona files were deleted as stale)
+    stale_universities = set(state.get("stale_universities") or [])
     if strategic_objectives:
         mission = strategic_objectives.get("mission")
         if mission == "autonomous_university_onboarding":
             universities = strategic_objectives.get("universities", [])
             for uni in universities:
-                if not persona_analysis.get(uni, {}).get("personas_created", False):
+                if uni in stale_universities or not persona_analysis.get(uni, {}).get("personas_created", False):
                     snapshot["missing_components"].append(f"personas_for_{uni}")
     
     if not persona_data_dir.exists():
@@ -90,21 +95,33 @@ def observe(state: Dict[str, Any]) -> Dict[str, Any]:
     if not ab_plan_exists and strategic_objectives and strategic_objectives.get("mission") != "autonomous_university_onboarding":
         snapshot["missing_components"].append("ab_testing_plan")
     
+    # Persist listings and parsed configs for the next run
+    observe_manifest.save()
+    
     console.print(f"📊 Found {len(persona_files)} persona files")
     console.print(f"🎯 Strategic objectives: {strategic_objectives.get('mission') if strategic_objectives else 'None'}")
     console.print(f"🏗️  Attribution page exists: {app_has_attribution_page}")
     console.print(f"📋 AB plan exists: {ab_plan_exists}")
+    if previous_evaluation:
+        console.print(f"🔁 Previous iteration success: {previous_evaluation.get('success', False)}")
     
     state["snapshot"] = snapshot
     return state
 
-def analyze_persona_completeness(persona_data_dir: Path, university_config: dict) -> dict:
-    """Analyze completeness of personas for each university"""
+def analyze_persona_completeness(persona_data_dir: Path, university_config: dict,
+                                 existing_files: Optional[Set[str]] = None) -> dict:
+    """
+    Analyze completeness of personas for each university
+    Existence checks are set lookups against one directory listing
+    """
     analysis = {}
     
     if not university_config:
         return analysis
     
+    if existing_files is None:
+        existing_files = set(os.listdir(persona_data_dir)) if persona_data_dir.is_dir() else set()
+    
     for university in university_config.get("universities", []):
         uni_id = university["id"]
         analysis[uni_id] = {
@@ -118,8 +135,7 @@ def analyze_persona_completeness(persona_data_dir: Path, university_config: dict
             target_personas = program.get("target_personas", [])
             
             for persona_type in target_personas:
-                persona_file = persona_data_dir / f"{uni_id}_{program_id}_{persona_type}.json"
-                if persona_file.exists():
+                if f"{uni_id}_{program_id}_{persona_type}.json" in existing_files:
                     analysis[uni_id]["personas_created"] = True
                     if program_id not in analysis[uni_id]["programs_covered"]:
                         analysis[uni_id]["programs_covered"].append(program_id)
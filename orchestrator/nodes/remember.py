@@ -1,57 +1,75 @@
 """
-Memory Layer (Remember) - Stores snapshots in ledger.json
+Memory Layer (Remember) - Appends finished iterations to the ledger through a write-behind queue
 """
-import json
-from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 from rich.console import Console
+from ..tools.config import get_setting
+from ..tools.ledger import ENTRY_VERSION, ledger
+from ..tools.blob_store import blob_store
+from ..tools.memory_writer import MemoryWriter
 
 console = Console()
 
-def remember(state: Dict[str, Any]) -> Dict[str, Any]:
+def compact_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Store current snapshot and decisions in persistent memory ledger
+    Replace large snapshot sub-objects with content-addressed blob references
+    Unchanged configs map to the same blob, so only what changed is written
     """
-    console.print("💾 [bold green]Memory Layer:[/bold green] Recording snapshot...")
+    if not snapshot:
+        return snapshot
     
-    repo_root = Path.cwd()
-    memory_dir = repo_root / "orchestrator" / "memory"
-    memory_dir.mkdir(parents=True, exist_ok=True)
+    compact = dict(snapshot)
+    for key in ("university_config", "strategic_objectives"):
+        if compact.get(key) is not None:
+            compact[key] = blob_store.put(compact[key])
     
-    ledger_path = memory_dir / "ledger.json"
+    persona_data = compact.get("persona_data")
+    if persona_data and "files" in persona_data:
+        compact["persona_data"] = {**persona_data, "files": blob_store.put(persona_data["files"])}
+    return compact
+
+def write_entries(entries: List[Dict[str, Any]]) -> None:
+    """
+    Memory writer sink: move large snapshot parts into blobs, append the batch
+    to the ledger and, with ORDAE_VECTOR_MEMORY enabled, embed it into vector memory
+    Only a ledger failure fails the batch, so a retried batch is never appended twice
+    """
+    records = ledger.append_many([{**entry, "snapshot": compact_snapshot(entry["snapshot"])} for entry in entries])
+    console.print(f"📝 Recorded {len(records)} entries in ledger ({ledger.location(records[-1])})")
     
-    # Load existing ledger or create new one
-    ledger = []
-    if ledger_path.exists():
+    if get_setting("ORDAE_VECTOR_MEMORY", "false").lower() in ("1", "true", "yes"):
+        from ..tools.vector_memory_store import vector_memory_store
         try:
-            with open(ledger_path, 'r') as f:
-                ledger = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            ledger = []
+            vector_memory_store.store_memories(entries)
+        except Exception as e:
+            console.print(f"⚠️ Vector memory write failed ({e}); restore it with `python -m orchestrator.vectors backfill-from-ledger`")
+
+# Global instance
+memory_writer = MemoryWriter(write_entries)
+
+def remember(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Store the finished iteration (snapshot, decision, actions, evaluation) in the memory ledger
+    Runs after evaluate; writes happen behind the loop: the entry is queued and the loop continues immediately
+    """
+    console.print("💾 [bold green]Memory Layer:[/bold green] Recording iteration...")
     
-    # Create new entry
+    # Create new entry; nodes replace these values rather than mutating them, so the writer can read them later
     entry = {
+        "version": ENTRY_VERSION,
         "timestamp": datetime.now().isoformat(),
         "iteration": state.get("iteration", 1),
+        "run_id": state.get("run_id"),
         "snapshot": state.get("snapshot", {}),
         "decision": state.get("decision", {}),
         "actions": state.get("actions", {}),
         "evaluation": state.get("evaluation", {})
     }
     
-    # Add to ledger
-    ledger.append(entry)
-    
-    # Keep only last 50 entries to prevent bloat
-    if len(ledger) > 50:
-        ledger = ledger[-50:]
-    
-    # Save ledger
-    with open(ledger_path, 'w') as f:
-        json.dump(ledger, f, indent=2)
+    # Append-only: cost does not grow with the ledger, retention is handled by segment rotation
+    memory_writer.submit(entry)
     
-    console.print(f"📝 Recorded entry #{len(ledger)} in ledger")
-    console.print(f"💿 Ledger location: {ledger_path}")
+    console.print(f"📝 Queued iteration {entry['iteration']} for the ledger ({memory_writer.pending()} pending)")
     
     return state
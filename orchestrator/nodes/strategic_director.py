@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 from typing import Dict, Any, List
 from rich.console import Console
+from ..tools.ledger import ledger
 
 console = Console()
 
@@ -97,17 +98,14 @@ class StrategicDirector:
         with open(self.objectives_file, 'r') as f:
             objectives = json.load(f)
             
-        # Check memory ledger for progress
-        ledger_file = self.repo_root / "orchestrator" / "memory" / "ledger.json"
-        progress = {"objectives": objectives, "iterations_completed": 0, "success_rate": 0}
+        # Check memory ledger for progress - answered from the ledger index, no entry is parsed
+        stats = ledger.stats()
+        progress = {
+            "objectives": objectives,
+            "iterations_completed": stats["entries"],
+            "success_rate": stats["success_rate"]
+        }
         
-        if ledger_file.exists():
-            with open(ledger_file, 'r') as f:
-                ledger = json.load(f)
-                progress["iterations_completed"] = len(ledger)
-                successful_iterations = sum(1 for entry in ledger if entry.get("evaluation", {}).get("success", False))
-                progress["success_rate"] = successful_iterations / len(ledger) if ledger else 0
-                
         return progress
 
 def initialize_strategic_mission(mission_type: str, **kwargs) -> Dict[str, Any]:
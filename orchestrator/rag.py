@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+PersonaOps RAG CLI - compile and inspect the RAG knowledge-base bundle
+
+Usage: python -m orchestrator.rag compile [--check]
+       python -m orchestrator.rag status
+"""
+import os
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from .tools.rag_bundle import compile_bundle, get_rag_dir, iter_sources, RAGBundle
+
+console = Console()
+app = typer.Typer(help="Compile and inspect the RAG knowledge base")
+
+@app.callback()
+def main():
+    """PersonaOps RAG knowledge-base tools"""
+
+@app.command("compile")
+def compile_command(
+    check: bool = typer.Option(False, "--check", help="Only validate the sources, do not write the bundle")
+):
+    """Validate every YAML file under rag/ and write the parsed bundle plus its source-hash manifest"""
+    result = compile_bundle(write=not check)
+    for error in result["errors"]:
+        console.print(f"❌ {error}")
+    if result["errors"]:
+        console.print(f"❌ {len(result['errors'])} problems in {result['files']} files; bundle not written")
+        raise typer.Exit(code=1)
+    if check:
+        console.print(f"✅ {result['files']} RAG files valid")
+        return
+    console.print(f"✅ Compiled {result['files']} RAG files ({result['source_bytes'] / 1024:.0f} KB of YAML) "
+                  f"into {result['bundle_bytes'] / 1024:.0f} KB")
+    console.print(f"💿 Bundle location: {result['bundle_path']}")
+
+@app.command()
+def status():
+    """Show which sources the bundle can serve and which will be parsed from YAML"""
+    rag_dir = get_rag_dir()
+    bundle = RAGBundle()
+    table = Table(title="RAG bundle")
+    table.add_column("Source")
+    table.add_column("State")
+    fresh = 0
+    for path in iter_sources(rag_dir):
+        found, _ = bundle.lookup(path, os.stat(path))
+        fresh += 1 if found else 0
+        table.add_row(path.relative_to(rag_dir).as_posix(), "bundled" if found else "[yellow]YAML (stale or new)[/yellow]")
+    console.print(table)
+    if not bundle.enabled:
+        console.print("⚠️  Bundle disabled by ORDAE_RAG_BUNDLE")
+    console.print(f"📦 {fresh} sources served from the bundle")
+
+if __name__ == "__main__":
+    app()
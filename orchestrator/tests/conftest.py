@@ -0,0 +1,62 @@
+"""
+Shared fixtures: an isolated workspace the ORDAE graph can run in
+"""
+import json
+import pytest
+
+from orchestrator.graph import ORDAEState
+from orchestrator.nodes import act, observe, remember
+from orchestrator.tools.checkpoint import PersonaProgress
+from orchestrator.tools.manifest import FileManifest
+from orchestrator.tools.memory_writer import MemoryWriter
+
+UNIVERSITY_CONFIG = {
+    "universities": [
+        {"id": uni, "name": uni.upper(), "programs": [
+            {"id": "mba", "name": "MBA", "target_personas": ["career_changer", "executive"]}
+        ]}
+        for uni in ("asu", "msu")
+    ],
+    "persona_templates": {}
+}
+
+@pytest.fixture
+def make_state():
+    """Factory for a fresh graph input state"""
+    def initial_state(run_id="run-1", iteration=1, checkpointed=False) -> ORDAEState:
+        return ORDAEState(
+            snapshot={}, decision={}, actions={}, evaluation={}, iteration=iteration, run_id=run_id,
+            checkpointed=checkpointed, stale_universities=[], university_results=[]
+        )
+    return initial_state
+
+@pytest.fixture
+def university_config():
+    return UNIVERSITY_CONFIG
+
+@pytest.fixture
+def recorded():
+    """Entries remember hands to the memory writer in a workspace"""
+    return []
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch, recorded):
+    """A university onboarding mission in tmp_path, with the nodes' stores moved there"""
+    persona_dir = tmp_path / "persona_data"
+    persona_dir.mkdir()
+    (persona_dir / "strategic_objectives.json").write_text(json.dumps({
+        "mission": "autonomous_university_onboarding",
+        "universities": ["asu", "msu"],
+        "constraints": {"max_iterations": 5}
+    }))
+    (persona_dir / "university_config.json").write_text(json.dumps(UNIVERSITY_CONFIG))
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(observe, "observe_manifest", FileManifest(tmp_path / "observe_manifest.json"))
+    monkeypatch.setattr(act, "persona_progress", PersonaProgress(tmp_path / "checkpoints.sqlite"))
+    monkeypatch.setattr(act, "load_university_rag_data", lambda university_id: {})
+    monkeypatch.setattr(act.supabase_integration, "is_connected", lambda: False)
+
+    monkeypatch.setenv("ORDAE_MEMORY_WRITE_BEHIND", "false")
+    monkeypatch.setattr(remember, "memory_writer", MemoryWriter(recorded.extend, spill_path=tmp_path / "spill.jsonl"))
+    return tmp_path
@@ -0,0 +1,28 @@
+"""
+Tests that every file the director writes is counted as I/O in the trace
+"""
+import pytest
+
+from orchestrator.nodes import act
+from orchestrator.tools.tracing import Tracer
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "persona_data").mkdir()
+    tracer = Tracer()
+    tracer.start("run-1", trace_dir=tmp_path / "traces")
+    monkeypatch.setattr(act, "tracer", tracer)
+    return tracer
+
+@pytest.mark.parametrize("lane, task, written", [
+    ("product", "build_attribution_page", "src/pages/Attribution.tsx"),
+    ("marketing", "plan_ab_for_first_persona", "persona_data/AB_PLAN.md"),
+    ("marketing", "optimize_university_campaigns", "persona_data/UNIVERSITY_CAMPAIGN_STRATEGY.md"),
+])
+def test_director_writes_are_counted(tracer, tmp_path, lane, task, written):
+    state = {"decision": {"lane": lane, "task": task}, "snapshot": {"university_config": {"universities": []}}}
+    with tracer.span("node:act") as span:
+        act.act(state)
+    assert (tmp_path / written).exists()
+    assert span["counts"] == {"io": 1}
@@ -0,0 +1,55 @@
+"""
+Tests for the async ORDAE graph and the concurrent persona writes inside act
+"""
+import asyncio
+import threading
+import time
+
+from orchestrator.graph import arun_ordae_loop, create_ordae_graph, run_ordae_loop
+from orchestrator.nodes import act
+
+def test_async_graph_matches_the_sync_graph(workspace, recorded, make_state, tmp_path_factory, monkeypatch):
+    result = asyncio.run(arun_ordae_loop(create_ordae_graph(fan_out=True, use_async=True), make_state()))
+    async_entries = [(entry["iteration"], entry["decision"]["task"], entry["actions"]["status"]) for entry in recorded]
+
+    other = tmp_path_factory.mktemp("sync")
+    (other / "persona_data").mkdir()
+    for name in ("strategic_objectives.json", "university_config.json"):
+        (other / "persona_data" / name).write_text((workspace / "persona_data" / name).read_text())
+    monkeypatch.chdir(other)
+    recorded.clear()
+    sync_result = run_ordae_loop(create_ordae_graph(fan_out=True), make_state())
+
+    assert async_entries == [(entry["iteration"], entry["decision"]["task"], entry["actions"]["status"])
+                             for entry in recorded]
+    assert result["snapshot"]["missing_components"] == sync_result["snapshot"]["missing_components"] == []
+    assert sorted(path.name for path in (workspace / "persona_data").iterdir()) == \
+        sorted(path.name for path in (other / "persona_data").iterdir())
+
+def test_persona_writes_overlap_within_the_bound(workspace, university_config, monkeypatch):
+    persist = act.persist_persona
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def slow_persist(persona_data, persona_data_dir, org_uuid=None):
+        with lock:
+            in_flight.append(persona_data["id"])
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(persona_data["id"])
+        return persist(persona_data, persona_data_dir, org_uuid)
+
+    monkeypatch.setattr(act, "persist_persona", slow_persist)
+    config = {**university_config, "universities": [{
+        "id": "asu", "name": "ASU",
+        "programs": [{"id": f"p{n}", "name": f"P{n}", "target_personas": ["a", "b"]} for n in range(3)]
+    }]}
+    actions = asyncio.run(act.acreate_university_personas("asu", config, max_concurrency=2))
+
+    assert max(peak) == 2
+    # Results keep the config order
+    assert [action.rsplit("/", 1)[-1] for action in actions] == [
+        f"asu_p{n}_{persona}.json" for n in range(3) for persona in ("a", "b")
+    ]
@@ -0,0 +1,86 @@
+"""
+Tests for the content-addressed blob store and snapshot compaction
+"""
+import os
+import time
+import pytest
+
+from orchestrator.nodes import remember
+from orchestrator.tools.blob_store import BlobStore, is_blob_ref, referenced_blobs
+
+CONFIG = {"universities": [{"id": "asu", "programs": ["mba"]}]}
+
+@pytest.fixture
+def blobs(tmp_path):
+    return BlobStore(directory=tmp_path / "blobs")
+
+def blob_files(blobs):
+    return sorted(blobs.directory.glob("*/*.json"))
+
+def age(path, seconds=7200):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+def test_equal_content_is_stored_once(blobs):
+    ref = blobs.put(CONFIG)
+    # Key order does not change the address
+    assert blobs.put({"universities": [{"programs": ["mba"], "id": "asu"}]}) == ref
+    assert is_blob_ref(ref)
+    assert len(blob_files(blobs)) == 1
+    assert blobs.put({"universities": []}) != ref
+
+def test_resolve_returns_private_copies(blobs):
+    entry = {"snapshot": {"university_config": blobs.put(CONFIG)}, "iteration": 1}
+    resolved = blobs.resolve(entry)
+    assert resolved == {"snapshot": {"university_config": CONFIG}, "iteration": 1}
+    resolved["snapshot"]["university_config"]["universities"].clear()
+    assert blobs.resolve(entry)["snapshot"]["university_config"] == CONFIG
+
+def test_lazy_view_loads_blobs_on_access(blobs, monkeypatch):
+    entry = {"snapshot": {"university_config": blobs.put(CONFIG), "missing_components": []}}
+    loads = []
+    get = blobs.get
+    monkeypatch.setattr(blobs, "get", lambda ref: loads.append(ref) or get(ref))
+
+    view = blobs.lazy(entry)
+    assert view["snapshot"]["missing_components"] == []
+    assert loads == []
+    assert view["snapshot"]["university_config"] == CONFIG
+    assert view.get("snapshot").get("university_config") == CONFIG
+    assert len(loads) == 1
+
+def test_sweep_keeps_referenced_and_recent_blobs(blobs):
+    kept = blobs.put(CONFIG)
+    orphan = blobs.put({"universities": []})
+    recent = blobs.put({"universities": ["new"]})
+    for path in blob_files(blobs):
+        age(path)
+    os.utime(blobs._path(recent["$blob"].split(":", 1)[1]))
+
+    assert blobs.sweep(referenced_blobs([{"snapshot": {"university_config": kept}}])) == 1
+    assert len(blob_files(blobs)) == 2
+    with pytest.raises(FileNotFoundError):
+        blobs.get(orphan)
+    assert blobs.get(kept) == CONFIG
+
+def test_reused_blob_is_refreshed_against_sweep(blobs):
+    ref = blobs.put(CONFIG)
+    [path] = blob_files(blobs)
+    age(path)
+    blobs.put({"universities": [{"id": "asu", "programs": ["mba"]}]})
+    assert blobs.sweep(set()) == 0
+    assert blobs.get(ref) == CONFIG
+
+def test_compact_snapshot_round_trips(blobs, monkeypatch):
+    monkeypatch.setattr(remember, "blob_store", blobs)
+    snapshot = {
+        "university_config": CONFIG,
+        "strategic_objectives": {"mission": "onboarding"},
+        "persona_data": {"file_count": 2, "files": ["a.json", "b.json"]},
+        "missing_components": ["attribution_page"]
+    }
+    compact = remember.compact_snapshot(snapshot)
+    assert is_blob_ref(compact["university_config"]) and is_blob_ref(compact["persona_data"]["files"])
+    assert compact["missing_components"] == ["attribution_page"]
+    assert blobs.resolve(compact) == snapshot
+    assert remember.compact_snapshot({}) == {}
@@ -0,0 +1,77 @@
+"""
+Tests for checkpoint retention and the checkpointer's connection lifetime
+"""
+import sqlite3
+import pytest
+
+from orchestrator.tools.checkpoint import open_checkpointer, prune_checkpoints
+
+pytest.importorskip("langgraph.checkpoint.sqlite")
+
+def save_checkpoint(saver, thread_id):
+    from langgraph.checkpoint.base import empty_checkpoint
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    saver.put(config, empty_checkpoint(), {}, {})
+
+def thread_ids(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return sorted(row[0] for row in conn.execute("SELECT DISTINCT thread_id FROM checkpoints"))
+    finally:
+        conn.close()
+
+def test_open_checkpointer_prunes_expired_runs(tmp_path, monkeypatch):
+    db_path = tmp_path / "checkpoints.sqlite"
+    with open_checkpointer(db_path) as saver:
+        for thread_id in ("20200101-000000-aaaaaa", "29990101-000000-bbbbbb", "my-thread"):
+            save_checkpoint(saver, thread_id)
+
+    monkeypatch.setenv("ORDAE_CHECKPOINT_TTL_DAYS", "14")
+    with open_checkpointer(db_path):
+        pass
+    # Only ids in the run-id format are dated; others are kept
+    assert thread_ids(db_path) == ["29990101-000000-bbbbbb", "my-thread"]
+
+def test_zero_ttl_keeps_everything(tmp_path):
+    db_path = tmp_path / "checkpoints.sqlite"
+    with open_checkpointer(db_path) as saver:
+        save_checkpoint(saver, "20200101-000000-aaaaaa")
+        assert prune_checkpoints(saver.conn, ttl_days=0) == 0
+    assert thread_ids(db_path) == ["20200101-000000-aaaaaa"]
+
+def test_prune_before_first_use_is_a_no_op(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "checkpoints.sqlite"))
+    assert prune_checkpoints(conn, ttl_days=1) == 0
+
+def test_open_checkpointer_closes_its_connection(tmp_path):
+    with open_checkpointer(tmp_path / "checkpoints.sqlite") as saver:
+        conn = saver.conn
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+def test_interrupted_run_resumes_at_the_unfinished_node(workspace, recorded, make_state, monkeypatch):
+    from orchestrator.graph import create_ordae_graph, resume_ordae_loop
+    from orchestrator.nodes import act
+
+    create = act.create_university_personas
+    calls = []
+
+    def interrupted_once(*args, **kwargs):
+        calls.append(args[0])
+        if len(calls) == 1:
+            raise RuntimeError("killed")
+        return create(*args, **kwargs)
+
+    monkeypatch.setattr(act, "create_university_personas", interrupted_once)
+    config = {"configurable": {"thread_id": "run-1"}}
+    with open_checkpointer(workspace / "graph.sqlite") as saver:
+        graph = create_ordae_graph(checkpointer=saver)
+        with pytest.raises(RuntimeError):
+            graph.invoke(make_state(checkpointed=True), config=config)
+        assert graph.get_state(config).next == ("act",)
+
+        result = resume_ordae_loop(graph, config, iterations=1)
+    assert calls == ["asu", "asu"]
+    assert result["iteration"] == 1
+    assert result["actions"]["per_university"] == {"asu": 2}
+    assert [entry["iteration"] for entry in recorded] == [1]
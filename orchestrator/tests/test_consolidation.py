@@ -0,0 +1,137 @@
+"""
+Tests for memory consolidation on both ledger backends
+Run with: python -m pytest -q orchestrator/tests
+"""
+from datetime import datetime
+import pytest
+
+from orchestrator.tools.blob_store import BlobStore
+from orchestrator.tools.consolidation import EpisodeStore, MemoryConsolidator, episode_metadata
+from orchestrator.tools.ledger import JSONLLedger
+from orchestrator.tools.ledger_sqlite import SQLiteLedger
+
+NOW = datetime(2026, 10, 17)
+CUTOFF = "2026-09-17T00:00:00"
+
+@pytest.fixture(params=["jsonl", "sqlite"])
+def ledger_backend(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteLedger(db_path=tmp_path / "ledger.sqlite")
+    # One entry per segment, so every entry but the newest sits in a sealed segment
+    return JSONLLedger(directory=tmp_path / "ledger", segment_max_bytes=1)
+
+@pytest.fixture
+def blobs(tmp_path):
+    return BlobStore(directory=tmp_path / "blobs")
+
+@pytest.fixture
+def consolidator(tmp_path, ledger_backend, blobs):
+    return MemoryConsolidator(EpisodeStore(tmp_path / "episodes.json"), ledger_backend=ledger_backend, blobs=blobs)
+
+def make_entry(blobs, iteration, timestamp, success=True, version=2):
+    entry = {
+        "iteration": iteration,
+        "timestamp": timestamp,
+        "run_id": "run-1",
+        "snapshot": {"strategic_objectives": blobs.put({"mission": "onboarding"})},
+        "decision": {"lane": "university_onboarding", "task": "create_personas", "target_university": "asu"},
+        "actions": {"files_created": []},
+        "evaluation": {"success": success}
+    }
+    if version > 1:
+        entry["version"] = version
+    return entry
+
+def fill(ledger_backend, blobs, **kwargs):
+    """Three entries before the cutoff and one after it"""
+    ledger_backend.append_many([
+        make_entry(blobs, 1, "2026-08-01T10:00:00", success=False, **kwargs),
+        make_entry(blobs, 2, "2026-08-02T10:00:00", **kwargs),
+        make_entry(blobs, 3, "2026-08-03T10:00:00", **kwargs),
+        make_entry(blobs, 4, "2026-10-16T10:00:00", **kwargs)
+    ])
+
+def run(consolidator, **kwargs):
+    return consolidator.run(iterations_ttl_days=30, episodes_ttl_days=0, vectors=False, now=NOW, **kwargs)
+
+def test_records_before_returns_entries_older_than_cutoff(ledger_backend, blobs):
+    fill(ledger_backend, blobs)
+    assert [record["iteration"] for record in ledger_backend.records_before(CUTOFF)] == [1, 2, 3]
+    assert ledger_backend.records_before("2026-08-01T00:00:00") == []
+
+def test_consolidates_and_removes_old_entries(consolidator, ledger_backend, blobs):
+    fill(ledger_backend, blobs)
+    stats = run(consolidator)
+
+    assert stats["entries_consolidated"] == 3
+    assert stats["entries_removed"] == 3
+    assert ledger_backend.count() == 1
+    [episode] = consolidator.episode_store.episodes()
+    assert (episode["mission"], episode["target_university"], episode["period"]) == ("onboarding", "asu", "2026-08")
+    assert (episode["iterations"], episode["successes"], episode["failures"], episode["unknown"]) == (3, 2, 1, 0)
+    assert episode["lanes"] == {"university_onboarding": 3}
+
+def test_dry_run_changes_nothing(consolidator, ledger_backend, blobs):
+    fill(ledger_backend, blobs)
+    stats = run(consolidator, dry_run=True)
+
+    assert stats["entries_consolidated"] == 3
+    assert stats["entries_removed"] == 0
+    assert ledger_backend.count() == 4
+    assert not consolidator.episode_store.path.exists()
+
+def test_rerun_after_failed_removal_does_not_fold_twice(consolidator, ledger_backend, blobs, monkeypatch):
+    fill(ledger_backend, blobs)
+    # Episodes are saved, then the run stops before the ledger entries go
+    monkeypatch.setattr(ledger_backend, "remove", lambda records: 0)
+    run(consolidator)
+    assert len(consolidator.episode_store.load()["folded"]) == 3
+    monkeypatch.undo()
+
+    stats = run(consolidator)
+    assert stats["entries_consolidated"] == 0
+    assert stats["entries_already_folded"] == 3
+    assert stats["entries_removed"] == 3
+    [episode] = consolidator.episode_store.episodes()
+    assert episode["iterations"] == 3
+
+def test_late_entry_older_than_folded_ones_is_still_folded(consolidator, ledger_backend, blobs, monkeypatch):
+    fill(ledger_backend, blobs)
+    monkeypatch.setattr(ledger_backend, "remove", lambda records: 0)
+    run(consolidator)
+    monkeypatch.undo()
+
+    # Another writer appends an entry timestamped before the ones already folded
+    ledger_backend.append_many([
+        make_entry(blobs, 5, "2026-08-02T12:00:00"),
+        make_entry(blobs, 6, "2026-10-16T11:00:00")
+    ])
+    stats = run(consolidator)
+    assert stats["entries_already_folded"] == 3
+    assert stats["entries_consolidated"] == 1
+    assert stats["entries_removed"] == 4
+    [episode] = consolidator.episode_store.episodes()
+    assert episode["iterations"] == 4
+    # Keys of removed records are let go by the next run
+    run(consolidator)
+    assert consolidator.episode_store.load()["folded"] == []
+
+def test_store_saved_with_a_watermark_is_migrated(consolidator, ledger_backend, blobs):
+    fill(ledger_backend, blobs)
+    consolidator.episode_store.save({"watermark": "2026-08-02T10:00:00", "episodes": {}})
+    stats = run(consolidator)
+    assert (stats["entries_already_folded"], stats["entries_consolidated"]) == (2, 1)
+    assert "watermark" not in consolidator.episode_store.load()
+
+def test_legacy_entries_fold_with_unknown_outcome(consolidator, ledger_backend, blobs):
+    fill(ledger_backend, blobs, version=1)
+    stats = run(consolidator)
+
+    assert stats["entries_unknown_outcome"] == 3
+    [episode] = consolidator.episode_store.episodes()
+    # Their decision belongs to another iteration, so it attributes nothing
+    assert episode["target_university"] == "none"
+    assert (episode["iterations"], episode["successes"], episode["failures"], episode["unknown"]) == (3, 0, 0, 3)
+    assert episode["lanes"] == {"unknown": 3}
+    assert set(episode["representatives"]) == {"first"}
+    assert "success" not in episode_metadata(episode)
@@ -0,0 +1,76 @@
+"""
+Tests for the persistent embedding cache and its use by VectorMemoryStore
+"""
+import itertools
+import pytest
+
+from orchestrator.tools import embedding_cache as cache_module
+from orchestrator.tools import vector_memory_store as store_module
+from orchestrator.tools.embedding_cache import EmbeddingCache
+from orchestrator.tools.embeddings import EmbeddingProvider
+from orchestrator.tools.vector_memory_store import VectorMemoryStore
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing time, so recency never ties"""
+    ticks = itertools.count(1)
+    monkeypatch.setattr(cache_module.time, "time", lambda: float(next(ticks)))
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return EmbeddingCache(db_path=tmp_path / "embedding_cache.sqlite", max_entries=20)
+
+def test_round_trip_and_counters(cache, tmp_path):
+    assert cache.get("model-a", "h1") is None
+    cache.put("model-a", "h1", [0.5, -0.25, 1.0])
+    assert cache.get("model-a", "h1") == [0.5, -0.25, 1.0]
+    # Vectors are keyed by model as well as text
+    assert cache.get_many("model-b", ["h1"]) == {}
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 2)
+    # Counters are shared through the database
+    other = EmbeddingCache(db_path=tmp_path / "embedding_cache.sqlite")
+    assert (other.stats()["total_hits"], other.stats()["hits"]) == (1, 0)
+
+def test_least_recently_used_are_evicted(cache):
+    cache.put_many("model-a", [(f"h{n}", [float(n)]) for n in range(20)])
+    # h0-h4 were used since; h5 onwards are the oldest
+    cache.get_many("model-a", [f"h{n}" for n in range(5)])
+    cache.put_many("model-a", [(f"new{n}", [1.0]) for n in range(3)])
+
+    kept = cache.get_many("model-a", [f"h{n}" for n in range(20)])
+    assert cache.stats()["entries"] <= 20
+    assert all(f"h{n}" in kept for n in range(5))
+    assert "h5" not in kept
+    assert len(cache.get_many("model-a", [f"new{n}" for n in range(3)])) == 3
+
+class CountingProvider(EmbeddingProvider):
+    """Remote-like provider recording what it was asked to embed"""
+
+    model = "counting-2"
+    dimension = 2
+    cacheable = True
+
+    def __init__(self):
+        self.requests = []
+
+    def embed(self, texts):
+        self.requests.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+def make_store(provider):
+    store = VectorMemoryStore()
+    store._embedding_provider, store._initialized = provider, True
+    return store
+
+def test_store_only_embeds_uncached_texts_once(cache, monkeypatch):
+    monkeypatch.setattr(store_module, "embedding_cache", cache)
+    provider = CountingProvider()
+    assert make_store(provider)._create_embeddings(["a", "bb", "a"]) == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    assert provider.requests == [["a", "bb"]]
+
+    # Another process (store) reuses the cached vectors
+    other = CountingProvider()
+    assert make_store(other)._create_embeddings(["bb", "ccc"]) == [[2.0, 1.0], [3.0, 1.0]]
+    assert other.requests == [["ccc"]]
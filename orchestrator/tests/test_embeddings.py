@@ -0,0 +1,62 @@
+"""
+Tests for the local embedding providers and provider selection
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+from orchestrator.tools.embeddings import (HashingEmbeddingProvider, OpenAIEmbeddingProvider, create_embedding_provider,
+                                           hashing_embedding)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TEXT = "lane: university_onboarding task: create_university_personas target_university: asu"
+
+def test_hashing_embeddings_are_unit_length_and_deterministic():
+    vector = hashing_embedding(TEXT)
+    assert vector.shape == (512,) and vector.dtype == np.float32
+    assert np.linalg.norm(vector) == pytest.approx(1.0, abs=1e-6)
+    assert np.array_equal(vector, hashing_embedding(TEXT))
+
+def test_hashing_embeddings_match_across_processes():
+    # Python's str hash is salted per process; the provider must not depend on it
+    code = ("import json; from orchestrator.tools.embeddings import hashing_embedding; "
+            f"print(json.dumps(hashing_embedding({TEXT!r}, 64).tolist()))")
+    env = {**os.environ, "PYTHONHASHSEED": "12345", "PYTHONPATH": str(REPO_ROOT)}
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+    assert json.loads(output) == hashing_embedding(TEXT, 64).tolist()
+
+def test_similar_states_score_higher_than_unrelated_ones():
+    similar = hashing_embedding(TEXT.replace("asu", "msu"))
+    unrelated = hashing_embedding("attribution dashboard build failed npm run preview")
+    query = hashing_embedding(TEXT)
+    assert query @ similar > query @ unrelated
+
+def test_provider_names_its_space_and_skips_empty_texts():
+    provider = HashingEmbeddingProvider(dimension=128)
+    assert (provider.model, provider.dimension, provider.cacheable) == ("hashing-128", 128, False)
+    vector, empty = provider.embed([TEXT, "  --  "])
+    assert len(vector) == 128
+    assert empty is None
+
+def test_provider_selection(monkeypatch):
+    monkeypatch.delenv("ORDAE_EMBEDDING_PROVIDER", raising=False)
+    monkeypatch.setenv("ORDAE_HASHING_DIMENSION", "64")
+    assert create_embedding_provider(None).model == "hashing-64"
+
+    client = object()
+    assert isinstance(create_embedding_provider(client), OpenAIEmbeddingProvider)
+    monkeypatch.setenv("ORDAE_EMBEDDING_PROVIDER", "hashing")
+    assert create_embedding_provider(client).model == "hashing-64"
+
+    monkeypatch.setenv("ORDAE_EMBEDDING_PROVIDER", "openai")
+    with pytest.raises(ValueError):
+        create_embedding_provider(None)
+    monkeypatch.setenv("ORDAE_EMBEDDING_MODEL", "text-embedding-3-large")
+    assert create_embedding_provider(client).dimension == 3072
+    monkeypatch.setenv("ORDAE_EMBEDDING_PROVIDER", "word2vec")
+    with pytest.raises(ValueError):
+        create_embedding_provider(client)
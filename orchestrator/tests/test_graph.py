@@ -0,0 +1,55 @@
+"""
+Tests for the ORDAE graph: per-university fan-out, its reducer and the in-process loop
+"""
+from orchestrator.graph import (create_ordae_graph, merge_university_results, route_decision,
+                                run_ordae_loop)
+from orchestrator.nodes.act import merge_university_actions
+
+ONBOARDING = {"lane": "university_onboarding", "task": "create_university_personas",
+              "target_university": "asu", "target_universities": ["asu", "msu"]}
+
+def test_reducer_keeps_one_result_per_university():
+    left = [{"university": "asu", "files_created": ["old"]}]
+    right = [{"university": "msu", "files_created": ["b"]}, {"university": "asu", "files_created": ["a"]}]
+    assert merge_university_results(left, right) == [
+        {"university": "asu", "files_created": ["a"]}, {"university": "msu", "files_created": ["b"]}
+    ]
+    assert merge_university_results(None, None) == []
+
+def test_route_sends_one_branch_per_pending_university(make_state, university_config):
+    state = {**make_state(iteration=2), "decision": ONBOARDING, "snapshot": {"university_config": university_config}}
+    sends = route_decision(state)
+    assert [send.node for send in sends] == ["act_university", "act_university"]
+    assert [send.arg["university"] for send in sends] == ["asu", "msu"]
+    assert all(send.arg["iteration"] == 2 for send in sends)
+
+def test_route_falls_back_to_serial_act():
+    assert route_decision({"decision": {"lane": "product"}, "snapshot": {}}) == "act"
+    assert route_decision({"decision": ONBOARDING, "snapshot": {}}) == "act"
+
+def test_merge_ignores_results_left_from_earlier_decisions():
+    state = {
+        "decision": {**ONBOARDING, "target_universities": ["msu"]},
+        "university_results": [{"university": "asu", "files_created": ["stale"]},
+                               {"university": "msu", "files_created": ["m1", "m2"]}]
+    }
+    actions = merge_university_actions(state)["actions"]
+    assert actions["files_created"] == ["m1", "m2"]
+    assert actions["per_university"] == {"msu": 2}
+    assert actions["status"] == "completed"
+
+def test_fan_out_onboards_every_university_in_one_iteration(workspace, recorded, make_state):
+    result = create_ordae_graph(fan_out=True).invoke(make_state())
+    assert result["actions"]["per_university"] == {"asu": 2, "msu": 2}
+    assert len(list((workspace / "persona_data").glob("*_mba_*.json"))) == 4
+    assert [entry["decision"]["task"] for entry in recorded] == ["create_university_personas"]
+
+def test_serial_loop_runs_until_converged(workspace, recorded, make_state):
+    result = run_ordae_loop(create_ordae_graph(), make_state())
+    # One university per iteration, then the attribution page; the iteration that observes nothing missing ends it
+    assert [entry["decision"].get("target_university") or entry["decision"]["task"] for entry in recorded] == [
+        "asu", "msu", "build_attribution_page", "optimize_university_campaigns"
+    ]
+    assert [entry["iteration"] for entry in recorded] == [1, 2, 3, 4]
+    assert result["snapshot"]["missing_components"] == []
+    assert (workspace / "src" / "pages" / "Attribution.tsx").exists()
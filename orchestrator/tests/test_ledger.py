@@ -0,0 +1,97 @@
+"""
+Tests for the JSONL ledger (segments, legacy import, tail recovery, retention) and
+the queries both ledger backends share
+"""
+import json
+import pytest
+
+from orchestrator.tools.ledger import INDEX_FILE, JSONLLedger
+from orchestrator.tools.ledger_sqlite import SQLiteLedger
+
+def make_entry(iteration, timestamp=None, lane="marketing"):
+    return {
+        "version": 2,
+        "iteration": iteration,
+        "timestamp": timestamp or f"2026-10-{iteration:02d}T10:00:00",
+        "run_id": "run-1",
+        "snapshot": {},
+        "decision": {"lane": lane, "task": f"{lane}_task", "target_university": "asu"},
+        "actions": {},
+        "evaluation": {"success": iteration % 2 == 0}
+    }
+
+@pytest.fixture(params=["jsonl", "sqlite"])
+def any_ledger(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteLedger(db_path=tmp_path / "ledger.sqlite")
+    return JSONLLedger(directory=tmp_path / "ledger")
+
+def iterations(entries):
+    return [entry["iteration"] for entry in entries]
+
+def test_between_finds_entries_appended_out_of_timestamp_order(any_ledger):
+    # A slower writer appends an entry stamped before ones already recorded
+    any_ledger.append_many([make_entry(1), make_entry(3), make_entry(2), make_entry(4)])
+    assert iterations(any_ledger.between("2026-10-02T00:00:00", "2026-10-04T00:00:00")) == [2, 3]
+    assert iterations(any_ledger.between(end="2026-10-03T00:00:00")) == [1, 2]
+    assert iterations(any_ledger.between(start="2026-10-03T00:00:00")) == [3, 4]
+
+def test_queries(any_ledger):
+    any_ledger.append_many([make_entry(1), make_entry(2), make_entry(3, lane="product")])
+    assert any_ledger.count() == 3
+    assert iterations(any_ledger.tail(2)) == [2, 3]
+    assert iterations(any_ledger.find_iteration(2)) == [2]
+    assert any_ledger.stats()["successful"] == 1
+    assert any_ledger.iterations_for(lane="marketing", university="asu") == 2
+    assert iterations(any_ledger.iter_entries()) == [1, 2, 3]
+
+def test_segments_roll_over_and_records_seek_into_them(tmp_path):
+    ledger = JSONLLedger(directory=tmp_path / "ledger", segment_max_bytes=1)
+    records = ledger.append_many([make_entry(iteration) for iteration in (1, 2, 3)])
+    assert len(ledger.segments()) == 3
+    assert [ledger.read(record)["iteration"] for record in records] == [1, 2, 3]
+
+def test_retention_drops_the_oldest_segments(tmp_path):
+    ledger = JSONLLedger(directory=tmp_path / "ledger", segment_max_bytes=1, max_segments=2)
+    ledger.append_many([make_entry(iteration) for iteration in (1, 2, 3)])
+    assert iterations(ledger.tail(10)) == [2, 3]
+
+def test_legacy_ledger_is_imported_once(tmp_path):
+    legacy_path = tmp_path / "ledger.json"
+    legacy_path.write_text(json.dumps([make_entry(1), make_entry(2)]))
+    ledger = JSONLLedger(directory=tmp_path / "ledger", legacy_path=legacy_path)
+    assert iterations(ledger.iter_entries()) == [1, 2]
+
+    ledger.append(make_entry(3))
+    reopened = JSONLLedger(directory=tmp_path / "ledger", legacy_path=legacy_path)
+    assert iterations(reopened.tail(10)) == [1, 2, 3]
+
+def test_unindexed_tail_is_recovered_and_torn_line_dropped(tmp_path):
+    ledger = JSONLLedger(directory=tmp_path / "ledger")
+    ledger.append(make_entry(1))
+    segment = ledger.segments()[-1]
+    # A writer died after its segment append but before the index line, then another mid-line
+    with open(segment, 'a') as f:
+        f.write(json.dumps(make_entry(2)) + "\n")
+        f.write('{"iteration": 3, "time')
+
+    ledger.append(make_entry(4))
+    reopened = JSONLLedger(directory=tmp_path / "ledger")
+    assert iterations(reopened.tail(10)) == [1, 2, 4]
+    assert len((tmp_path / "ledger" / INDEX_FILE).read_text().splitlines()) == 3
+
+def test_instances_sharing_a_directory_see_each_others_appends(tmp_path):
+    first = JSONLLedger(directory=tmp_path / "ledger")
+    second = JSONLLedger(directory=tmp_path / "ledger")
+    first.append(make_entry(1))
+    second.append(make_entry(2))
+    first.append(make_entry(3))
+    assert iterations(second.tail(10)) == [1, 2, 3]
+    assert [record["offset"] for record in first.index()] == [record["offset"] for record in second.index()]
+
+def test_rebuild_index_from_segments(tmp_path):
+    ledger = JSONLLedger(directory=tmp_path / "ledger", segment_max_bytes=1)
+    ledger.append_many([make_entry(iteration) for iteration in (1, 2)])
+    (tmp_path / "ledger" / INDEX_FILE).unlink()
+    ledger.rebuild_index()
+    assert iterations(JSONLLedger(directory=tmp_path / "ledger").tail(10)) == [1, 2]
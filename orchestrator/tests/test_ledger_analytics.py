@@ -0,0 +1,79 @@
+"""
+Tests for the streaming ledger report and the `ledger report` command
+"""
+import json
+import pytest
+from typer.testing import CliRunner
+
+from orchestrator import ledger as ledger_cli
+from orchestrator.tools.ledger import JSONLLedger
+from orchestrator.tools.ledger_analytics import LedgerReport
+
+def record(timestamp, run_id="run-1", iteration=1, lane="university_onboarding", success=True, university="asu"):
+    return {"timestamp": timestamp, "run_id": run_id, "iteration": iteration, "lane": lane,
+            "task": f"{lane}_task", "target_university": university, "success": success}
+
+RECORDS = [
+    record("2026-10-01T10:00:00", iteration=1),
+    record("2026-10-01T10:01:00", iteration=2, success=False),
+    record("2026-10-01T10:03:00", iteration=3, lane="product", university=None),
+    # Resumed the next day: not an iteration duration
+    record("2026-10-02T09:00:00", iteration=4, lane="product", university=None),
+    record("2026-10-02T09:00:30", run_id="run-2", iteration=1, lane="marketing", success=False)
+]
+
+def test_report_folds_lanes_decisions_and_durations():
+    report = LedgerReport(max_gap=3600).consume(iter(RECORDS))
+    summary = report.summary()
+    assert (summary["entries"], summary["successful"]) == (5, 3)
+    assert (summary["timed_iterations"], summary["mean_duration_s"]) == (2, 90.0)
+
+    lanes = {(row["lane"], row["target_university"]): row for row in report.lane_rows()}
+    assert lanes[("university_onboarding", "asu")]["success_rate"] == 0.5
+    assert lanes[("product", None)]["max_duration_s"] == 120.0
+    assert {row["lane"]: row["share"] for row in report.decision_rows()} == {
+        "university_onboarding": 0.4, "product": 0.4, "marketing": 0.2
+    }
+
+def test_trends_keep_a_rolling_window():
+    trends = LedgerReport(period="day", window=2).consume(RECORDS).trend_rows()
+    assert [(row["period"], row["entries"]) for row in trends] == [("2026-10-01", 3), ("2026-10-02", 2)]
+    assert trends[1]["success_rate"] == 0.5
+    assert trends[1]["rolling_success_rate"] == 3 / 5
+    assert [row["period"] for row in LedgerReport(period="week").consume(RECORDS).trend_rows()] == ["2026-W40"]
+
+def test_runs_without_run_id_are_timed_by_consecutive_iterations():
+    legacy = [
+        {**record("2026-10-01T10:00:00", iteration=1), "run_id": None},
+        {**record("2026-10-01T10:00:10", iteration=2), "run_id": None},
+        # A new run restarting at iteration 1
+        {**record("2026-10-01T10:00:20", iteration=1), "run_id": None}
+    ]
+    assert LedgerReport().consume(legacy).durations.count == 1
+
+def test_open_runs_stay_bounded():
+    report = LedgerReport(max_open_runs=3)
+    report.consume(record(f"2026-10-01T10:00:{n:02d}", run_id=f"run-{n}") for n in range(50))
+    assert len(report._open_runs) == 3
+
+def test_unknown_period_is_rejected():
+    with pytest.raises(ValueError):
+        LedgerReport(period="year")
+
+def test_report_command_streams_the_index(tmp_path, monkeypatch):
+    ledger = JSONLLedger(directory=tmp_path / "ledger")
+    ledger.append_many([{**item, "version": 2, "decision": {"lane": item["lane"], "task": item["task"],
+                                                            "target_university": item["target_university"]},
+                         "evaluation": {"success": item["success"]}} for item in RECORDS])
+    # The report must not load the whole index or parse entries
+    monkeypatch.setattr(ledger, "index", lambda: pytest.fail("index() loaded"))
+    monkeypatch.setattr(ledger, "read", lambda record: pytest.fail("entry parsed"))
+    monkeypatch.setattr(ledger_cli, "ledger", ledger)
+
+    result = CliRunner().invoke(ledger_cli.app, [
+        "report", "--since", "2026-10-01T10:01:00", "--json", str(tmp_path / "report.json"), "--csv", str(tmp_path / "csv")
+    ])
+    assert result.exit_code == 0, result.output
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["summary"]["entries"] == 4
+    assert sorted(path.name for path in (tmp_path / "csv").iterdir()) == ["decisions.csv", "lanes.csv", "trends.csv"]
@@ -0,0 +1,97 @@
+"""
+Tests for the SQLite ledger: running lane totals, reindexing and history import
+"""
+import sqlite3
+import pytest
+
+from orchestrator.tools.ledger import JSONLLedger
+from orchestrator.tools.ledger_sqlite import SQLiteLedger
+
+def make_entry(iteration, lane, university, success, version=2):
+    entry = {
+        "iteration": iteration,
+        "timestamp": f"2026-10-{iteration:02d}T10:00:00",
+        "run_id": "run-1",
+        "snapshot": {},
+        "decision": {"lane": lane, "task": f"{lane}_task", "target_university": university},
+        "actions": {},
+        "evaluation": {"success": success}
+    }
+    if version > 1:
+        entry["version"] = version
+    return entry
+
+ENTRIES = [
+    make_entry(1, "university_onboarding", "asu", True),
+    make_entry(2, "university_onboarding", "msu", False),
+    make_entry(3, "university_onboarding", "asu", True),
+    make_entry(4, "product", None, True),
+    make_entry(5, "marketing", "asu", True, version=1)
+]
+
+@pytest.fixture
+def sqlite_ledger(tmp_path):
+    ledger = SQLiteLedger(db_path=tmp_path / "ledger.sqlite")
+    ledger.append_many(ENTRIES)
+    return ledger
+
+def totals_from_entries(ledger):
+    """Lane totals recomputed with a full scan, for comparison"""
+    conn = sqlite3.connect(str(ledger.db_path))
+    try:
+        return sorted(conn.execute(
+            "SELECT COALESCE(lane, ''), COALESCE(task, ''), COALESCE(target_university, ''), COUNT(*), SUM(success) "
+            "FROM entries GROUP BY 1, 2, 3"
+        ).fetchall())
+    finally:
+        conn.close()
+
+def running_totals(ledger):
+    return sorted(
+        (stat["lane"] or "", stat["task"] or "", stat["target_university"] or "", stat["entries"], stat["successes"])
+        for stat in ledger.lane_stats()
+    )
+
+def test_running_totals_answer_progress_queries(sqlite_ledger):
+    assert sqlite_ledger.count() == 5
+    assert sqlite_ledger.stats()["successful"] == 3
+    assert sqlite_ledger.iterations_for(lane="university_onboarding") == 3
+    assert sqlite_ledger.iterations_for(lane="university_onboarding", university="asu") == 2
+    assert sqlite_ledger.iterations_for(university="asu") == 2
+    # The legacy entry's borrowed decision is not counted
+    assert sqlite_ledger.iterations_for(lane="marketing") == 0
+    assert running_totals(sqlite_ledger) == totals_from_entries(sqlite_ledger)
+
+def test_lane_stats_match_the_jsonl_backend(sqlite_ledger, tmp_path):
+    jsonl = JSONLLedger(directory=tmp_path / "ledger")
+    jsonl.append_many(ENTRIES)
+    key = lambda stat: (stat["lane"] or "", stat["target_university"] or "")
+    assert sorted(sqlite_ledger.lane_stats(), key=key) == sorted(jsonl.lane_stats(), key=key)
+    assert sqlite_ledger.stats() == jsonl.stats()
+
+def test_remove_takes_entries_out_of_the_totals(sqlite_ledger):
+    removed = sqlite_ledger.records_before("2026-10-03T00:00:00")
+    assert sqlite_ledger.remove(removed) == 2
+    # Removing again (another process got there first) changes nothing
+    assert sqlite_ledger.remove(removed) == 0
+    assert sqlite_ledger.count() == 3
+    assert running_totals(sqlite_ledger) == totals_from_entries(sqlite_ledger)
+
+def test_rebuild_index_recomputes_columns_and_totals(sqlite_ledger):
+    conn = sqlite3.connect(str(sqlite_ledger.db_path))
+    conn.execute("UPDATE entries SET lane = 'stale', success = 0")
+    conn.execute("UPDATE lane_totals SET entries = 99")
+    conn.commit()
+    conn.close()
+
+    sqlite_ledger.rebuild_index()
+    assert sqlite_ledger.iterations_for(lane="university_onboarding") == 3
+    assert sqlite_ledger.stats()["successful"] == 3
+    assert running_totals(sqlite_ledger) == totals_from_entries(sqlite_ledger)
+
+def test_default_ledger_imports_jsonl_history_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    JSONLLedger().append_many(ENTRIES[:2])
+    assert SQLiteLedger().count() == 2
+    # A second instance (or process) finds the history already there
+    assert SQLiteLedger().count() == 2
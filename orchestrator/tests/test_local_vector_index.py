@@ -0,0 +1,78 @@
+"""
+Tests for the offline local vector index: search, upserts, filters, removal and persistence
+"""
+import numpy as np
+import pytest
+
+from orchestrator.tools.local_vector_index import LocalVectorIndex
+
+DIMENSION = 16
+
+def vectors(count, seed=0):
+    return np.random.default_rng(seed).normal(size=(count, DIMENSION)).astype(np.float32)
+
+@pytest.fixture
+def index(tmp_path):
+    index = LocalVectorIndex(tmp_path / "vectors", model="hashing-16")
+    data = vectors(6)
+    index.add(
+        [f"m{n}" for n in range(6)], data,
+        [{"lane": "marketing" if n % 2 else "product", "success": n < 3, "iteration": n, "kind": "iteration"}
+         for n in range(6)]
+    )
+    return index
+
+def ids(results):
+    return [memory_id for memory_id, _, _ in results]
+
+def test_nearest_neighbour_comes_first_with_its_metadata(index):
+    [results] = index.search(vectors(6)[4], k=3)
+    memory_id, score, metadata = results[0]
+    assert memory_id == "m4" and score == pytest.approx(1.0, abs=0.01)
+    assert metadata["iteration"] == 4
+    assert len(results) == 3
+
+def test_batched_queries_match_single_queries(index):
+    data = vectors(6)
+    batch = index.search(data[:3], k=2)
+    assert [ids(results) for results in batch] == [ids(index.search(row, k=2)[0]) for row in data[:3]]
+
+def test_filters_only_score_matching_rows(index):
+    query = vectors(6)[4]
+    assert set(ids(index.search(query, k=10, filters={"lane": "marketing"})[0])) == {"m1", "m3", "m5"}
+    assert set(ids(index.search(query, k=10, filters={"lane": "marketing", "success": True})[0])) == {"m1"}
+    assert set(ids(index.search(query, k=10, filters={"iteration": [0, 5]})[0])) == {"m0", "m5"}
+    assert index.search(query, k=10, filters={"lane": "sales"}) == [[]]
+    with pytest.raises(ValueError):
+        index.search(query, filters={"run_id": "run-1"})
+
+def test_re_adding_an_id_replaces_it(index):
+    index.add(["m0"], vectors(1, seed=9), [{"lane": "marketing"}])
+    assert len(index) == 6
+    [results] = index.search(vectors(1, seed=9)[0], k=1, filters={"lane": "marketing"})
+    assert ids(results) == ["m0"]
+    assert "m0" not in ids(index.search(vectors(1, seed=9)[0], k=10, filters={"lane": "product"})[0])
+
+def test_remove_rewrites_the_files(index, tmp_path):
+    size = (tmp_path / "vectors" / "metadata.jsonl").stat().st_size
+    assert index.remove(["m1", "m2", "unknown"]) == 2
+    assert len(index) == 4
+    assert (tmp_path / "vectors" / "metadata.jsonl").stat().st_size < size
+    assert {"m1", "m2"}.isdisjoint(ids(index.search(vectors(6)[1], k=10)[0]))
+
+def test_index_is_shared_across_instances(index, tmp_path):
+    other = LocalVectorIndex(tmp_path / "vectors", model="hashing-16")
+    assert len(other) == 6
+    other.add(["m6"], vectors(1, seed=3))
+    # The first instance maps the rows appended by the second
+    assert ids(index.search(vectors(1, seed=3)[0], k=1)[0]) == ["m6"]
+
+def test_rejects_mismatched_models_dimensions_and_zero_vectors(index, tmp_path):
+    with pytest.raises(ValueError):
+        len(LocalVectorIndex(tmp_path / "vectors", model="text-embedding-3-small"))
+    with pytest.raises(ValueError):
+        index.add(["bad"], np.ones((1, DIMENSION + 1)))
+    with pytest.raises(ValueError):
+        index.add(["zero"], np.zeros((1, DIMENSION)))
+    with pytest.raises(ValueError):
+        index.search(np.ones(DIMENSION + 1))
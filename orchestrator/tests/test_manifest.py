@@ -0,0 +1,89 @@
+"""
+Tests for the observe manifest: cached listings and JSON, the racy window and persistence
+"""
+import json
+import os
+import pytest
+
+from orchestrator.tools import manifest as manifest_module
+from orchestrator.tools.manifest import FileManifest
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / "persona_data" / "university_config.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps({"universities": [{"id": "asu"}]}))
+    return path
+
+def age(path, seconds=10):
+    """Move a file's mtime into the past, out of the racy window"""
+    mtime_ns = os.stat(path).st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Paths read through Path.read_bytes"""
+    read_bytes = manifest_module.Path.read_bytes
+    paths = []
+
+    def counting_read_bytes(self):
+        paths.append(self)
+        return read_bytes(self)
+
+    monkeypatch.setattr(manifest_module.Path, "read_bytes", counting_read_bytes)
+    return paths
+
+def test_unchanged_file_is_parsed_once(tmp_path, config, reads):
+    age(config)
+    manifest = FileManifest(tmp_path / "manifest.json")
+    assert manifest.load_json(config) == manifest.load_json(config)
+    assert reads == [config]
+
+def test_callers_get_their_own_copy(tmp_path, config):
+    age(config)
+    manifest = FileManifest(tmp_path / "manifest.json")
+    manifest.load_json(config)["universities"].append({"id": "msu"})
+    assert manifest.load_json(config) == {"universities": [{"id": "asu"}]}
+    manifest.list_dir(config.parent).append("stray.json")
+    assert manifest.list_dir(config.parent) == ["university_config.json"]
+
+def test_file_modified_inside_the_racy_window_is_reread(tmp_path, config, reads):
+    manifest = FileManifest(tmp_path / "manifest.json")
+    manifest.load_json(config)
+    # Same size and mtime tick, different content: only the racy window catches it
+    stat = os.stat(config)
+    config.write_text(json.dumps({"universities": [{"id": "msu"}]}))
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert manifest.load_json(config) == {"universities": [{"id": "msu"}]}
+    assert len(reads) == 2
+
+def test_touched_file_keeps_its_parsed_data(tmp_path, config, reads, monkeypatch):
+    age(config)
+    manifest = FileManifest(tmp_path / "manifest.json")
+    manifest.load_json(config)
+    config.touch()
+    parsed = []
+    loads = manifest_module.json.loads
+    monkeypatch.setattr(manifest_module.json, "loads", lambda raw: parsed.append(raw) or loads(raw))
+    assert manifest.load_json(config) == {"universities": [{"id": "asu"}]}
+    # Re-hashed, not re-parsed
+    assert len(reads) == 2 and parsed == []
+
+def test_listing_follows_directory_changes(tmp_path, config):
+    manifest = FileManifest(tmp_path / "manifest.json")
+    assert manifest.list_dir(config.parent) == ["university_config.json"]
+    (config.parent / "asu_mba_executive.json").write_text("{}")
+    assert manifest.list_dir(config.parent) == ["asu_mba_executive.json", "university_config.json"]
+    assert manifest.list_dir(tmp_path / "missing") == []
+
+def test_manifest_persists_across_instances(tmp_path, config, reads):
+    age(config)
+    age(config.parent)
+    first = FileManifest(tmp_path / "manifest.json")
+    first.list_dir(config.parent)
+    first.load_json(config)
+    first.save()
+
+    second = FileManifest(tmp_path / "manifest.json")
+    assert second.load_json(config) == {"universities": [{"id": "asu"}]}
+    assert reads == [config]
@@ -0,0 +1,123 @@
+"""
+Tests for the write-behind memory writer: batching, flushing, retries and spill replay
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+from orchestrator.tools.memory_writer import MemoryWriter
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+class FlakySink:
+    """Sink that fails its first `failures` calls"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = 0
+        self.batches = []
+
+    def __call__(self, batch):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise OSError("disk full")
+        self.batches.append(list(batch))
+
+    @property
+    def items(self):
+        return [item for batch in self.batches for item in batch]
+
+def make_writer(sink, tmp_path, **kwargs):
+    kwargs = {"batch_size": 2, "linger": 0.0, "retries": 2, "backoff": 0.0, **kwargs}
+    return MemoryWriter(sink, spill_path=tmp_path / "memory-writer.spill.jsonl", **kwargs)
+
+@pytest.fixture(autouse=True)
+def write_behind(monkeypatch):
+    monkeypatch.setenv("ORDAE_MEMORY_WRITE_BEHIND", "true")
+    # Keep the test process's own signal handlers
+    monkeypatch.setattr(MemoryWriter, "_install_signal_handlers", lambda self: None)
+
+def test_flush_writes_everything_queued(tmp_path):
+    sink = FlakySink()
+    writer = make_writer(sink, tmp_path)
+    for iteration in range(5):
+        writer.submit({"iteration": iteration})
+    writer.flush()
+    assert sink.items == [{"iteration": iteration} for iteration in range(5)]
+    assert all(len(batch) <= 2 for batch in sink.batches)
+    assert writer.pending() == 0
+    writer.close()
+
+def test_close_writes_pending_items(tmp_path):
+    sink = FlakySink()
+    writer = make_writer(sink, tmp_path, linger=0.5, batch_size=10)
+    writer.submit({"iteration": 1})
+    writer.close()
+    assert sink.items == [{"iteration": 1}]
+
+def test_failed_batch_is_retried(tmp_path):
+    sink = FlakySink(failures=2)
+    writer = make_writer(sink, tmp_path)
+    writer.submit({"iteration": 1})
+    writer.close()
+    assert sink.items == [{"iteration": 1}]
+    assert writer.failed == 0
+    assert not (tmp_path / "memory-writer.spill.jsonl").exists()
+
+def test_persistent_failure_is_spilled_and_replayed_first(tmp_path):
+    writer = make_writer(FlakySink(failures=100), tmp_path)
+    writer.submit({"iteration": 1})
+    writer.submit({"iteration": 2})
+    writer.close()
+    assert writer.failed == writer.spilled == 2
+
+    sink = FlakySink()
+    restarted = make_writer(sink, tmp_path)
+    restarted.submit({"iteration": 3})
+    restarted.close()
+    # Spilled iterations come before anything newer, and the spill is gone once written
+    assert sink.items == [{"iteration": 1}, {"iteration": 2}, {"iteration": 3}]
+    assert list(tmp_path.iterdir()) == []
+
+def test_inline_writes_replay_the_spill_too(tmp_path, monkeypatch):
+    (tmp_path / "memory-writer.spill.jsonl").write_text('{"iteration": 1}\n{"iterat')
+    monkeypatch.setenv("ORDAE_MEMORY_WRITE_BEHIND", "false")
+    sink = FlakySink()
+    writer = make_writer(sink, tmp_path)
+    writer.submit({"iteration": 2})
+    # The torn last line of an interrupted spill is skipped
+    assert sink.items == [{"iteration": 1}, {"iteration": 2}]
+
+def test_restart_after_close_installs_hooks_once(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr("orchestrator.tools.memory_writer.atexit.register", registered.append)
+    writer = make_writer(FlakySink(), tmp_path)
+    writer.submit({"iteration": 1})
+    writer.close()
+    writer.submit({"iteration": 2})
+    writer.close()
+    assert registered == [writer.close]
+
+@pytest.mark.parametrize("exit_code", ["", "import os, signal; os.kill(os.getpid(), signal.SIGTERM)"])
+def test_queued_items_are_written_when_the_process_exits(tmp_path, exit_code):
+    # A normal exit runs the atexit hook, SIGTERM the signal handler
+    script = f"""
+import time
+from pathlib import Path
+from orchestrator.tools.memory_writer import MemoryWriter
+
+def slow_sink(batch):
+    time.sleep(0.05)
+    with open({str(tmp_path / "written.txt")!r}, "a") as f:
+        f.writelines(f"{{item}}\\n" for item in batch)
+
+writer = MemoryWriter(slow_sink, batch_size=2, spill_path=Path({str(tmp_path / "spill.jsonl")!r}))
+for item in range(6):
+    writer.submit(item)
+{exit_code}
+"""
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT), "ORDAE_MEMORY_WRITE_BEHIND": "true"}
+    subprocess.run([sys.executable, "-c", script], env=env, cwd=tmp_path, timeout=30)
+    assert (tmp_path / "written.txt").read_text().split() == [str(item) for item in range(6)]
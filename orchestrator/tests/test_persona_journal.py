@@ -0,0 +1,104 @@
+"""
+Tests for the per-iteration persona journal used to resume act
+"""
+import asyncio
+import sqlite3
+import pytest
+
+from orchestrator.nodes import act
+from orchestrator.tools.checkpoint import PersonaProgress
+
+UNIVERSITY_CONFIG = {
+    "universities": [{
+        "id": "asu",
+        "name": "Arizona State University",
+        "programs": [{"id": "mba", "name": "MBA", "target_personas": ["career_changer", "working_professional", "executive"]}]
+    }],
+    "persona_templates": {}
+}
+PERSONA_IDS = ["asu_mba_career_changer", "asu_mba_working_professional", "asu_mba_executive"]
+
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    progress = PersonaProgress(tmp_path / "checkpoints.sqlite")
+    monkeypatch.setattr(act, "persona_progress", progress)
+    monkeypatch.setattr(act, "load_university_rag_data", lambda university_id: {})
+    monkeypatch.setattr(act.supabase_integration, "is_connected", lambda: False)
+    return progress
+
+@pytest.fixture
+def persisted(monkeypatch):
+    """Persona ids written by persist_persona, in order"""
+    written = []
+    persist = act.persist_persona
+
+    def tracking_persist(persona_data, persona_data_dir, org_uuid=None):
+        written.append(persona_data["id"])
+        return persist(persona_data, persona_data_dir, org_uuid)
+
+    monkeypatch.setattr(act, "persist_persona", tracking_persist)
+    return written
+
+def interrupt_after(monkeypatch, count):
+    """Make persist_persona fail once `count` personas have been written"""
+    persist = act.persist_persona
+    written = []
+
+    def failing_persist(persona_data, persona_data_dir, org_uuid=None):
+        if len(written) == count:
+            raise KeyboardInterrupt
+        written.append(persona_data["id"])
+        return persist(persona_data, persona_data_dir, org_uuid)
+
+    monkeypatch.setattr(act, "persist_persona", failing_persist)
+
+def test_resume_skips_personas_finished_before_interrupt(journal, persisted, monkeypatch, tmp_path):
+    with monkeypatch.context() as patched:
+        interrupt_after(patched, 1)
+        with pytest.raises(KeyboardInterrupt):
+            act.create_university_personas("asu", UNIVERSITY_CONFIG, "run-1", iteration=1)
+    assert persisted == PERSONA_IDS[:1]
+    assert list(journal.completed("run-1", 1, "asu")) == PERSONA_IDS[:1]
+
+    actions = act.create_university_personas("asu", UNIVERSITY_CONFIG, "run-1", iteration=1)
+    # Each persona is written once across the interrupted and the resumed attempt
+    assert persisted == PERSONA_IDS
+    assert len(actions) == 3
+    assert all((tmp_path / "persona_data" / f"{persona_id}.json").exists() for persona_id in PERSONA_IDS)
+
+def test_journal_does_not_carry_into_later_iterations(journal, persisted):
+    act.create_university_personas("asu", UNIVERSITY_CONFIG, "run-1", iteration=1)
+    act.create_university_personas("asu", UNIVERSITY_CONFIG, "run-1", iteration=2)
+    assert persisted == PERSONA_IDS + PERSONA_IDS
+
+def test_deleted_persona_is_created_again(journal, persisted, tmp_path):
+    act.create_university_personas("asu", UNIVERSITY_CONFIG, "run-1", iteration=1)
+    (tmp_path / "persona_data" / "asu_mba_executive.json").unlink()
+
+    actions = act.create_university_personas("asu", UNIVERSITY_CONFIG, "run-1", iteration=1)
+    assert persisted == PERSONA_IDS + ["asu_mba_executive"]
+    assert len(actions) == 3
+    assert (tmp_path / "persona_data" / "asu_mba_executive.json").exists()
+
+def test_async_resume_recreates_deleted_persona(journal, persisted, tmp_path):
+    asyncio.run(act.acreate_university_personas("asu", UNIVERSITY_CONFIG, "run-1", iteration=1))
+    (tmp_path / "persona_data" / "asu_mba_career_changer.json").unlink()
+
+    actions = asyncio.run(act.acreate_university_personas("asu", UNIVERSITY_CONFIG, "run-1", iteration=1))
+    assert sorted(persisted) == sorted(PERSONA_IDS + ["asu_mba_career_changer"])
+    assert len(actions) == 3
+
+def test_unjournaled_runs_write_nothing(journal, tmp_path):
+    act.create_university_personas("asu", UNIVERSITY_CONFIG)
+    assert journal.completed("run-1", 1, "asu") == {}
+
+def test_legacy_journal_is_replaced(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "checkpoints.sqlite"))
+    conn.execute("CREATE TABLE persona_progress (run_id TEXT, university TEXT, persona_id TEXT, action TEXT, created_at TEXT)")
+    conn.execute("INSERT INTO persona_progress VALUES ('run-1', 'asu', 'asu_mba_executive', 'x', '2099-01-01')")
+    conn.commit()
+    conn.close()
+
+    progress = PersonaProgress(tmp_path / "checkpoints.sqlite")
+    assert progress.completed("run-1", 1, "asu") == {}
@@ -0,0 +1,104 @@
+"""
+Tests for the compiled RAG bundle: compile/validate, freshness checks and the rag CLI
+"""
+import os
+import time
+import pytest
+from typer.testing import CliRunner
+
+from orchestrator import rag
+from orchestrator.tools import rag_loader as loader_module
+from orchestrator.tools.rag_bundle import BUNDLE_FILE, MANIFEST_FILE, RAGBundle, compile_bundle
+from orchestrator.tools.rag_loader import RAGCache, RAGLoader
+
+VOICE = "tone: warm\npersona_specific_voice:\n  executive: concise\n"
+CATALOG = "programs:\n  - id: mba\n    name: MBA\ncertificates: []\n"
+
+@pytest.fixture
+def rag_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ORDAE_RAG_BUNDLE", "true")
+    rag_dir = tmp_path / "rag"
+    (rag_dir / "universities" / "asu").mkdir(parents=True)
+    (rag_dir / "program_catalog").mkdir()
+    (rag_dir / "universities" / "asu" / "voice_tone.yaml").write_text(VOICE)
+    (rag_dir / "program_catalog" / "asu_programs.yaml").write_text(CATALOG)
+    return rag_dir
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Fresh cache and bundle, as in a new process"""
+    def make():
+        cache = RAGCache()
+        monkeypatch.setattr(loader_module, "rag_cache", cache)
+        monkeypatch.setattr(loader_module, "rag_bundle", RAGBundle())
+        return cache
+    return make
+
+def test_compiled_bundle_serves_every_source(rag_dir, cache):
+    result = compile_bundle()
+    assert result["written"] and result["files"] == 2 and not result["errors"]
+    cache = cache()
+    loader = RAGLoader()
+    assert loader.load_university_voice_tone("asu")["tone"] == "warm"
+    assert loader.get_program_details("asu", "mba")["name"] == "MBA"
+    assert cache.bundle_loads == 2
+
+def test_touched_source_with_same_content_is_still_bundled(rag_dir, cache):
+    compile_bundle()
+    path = rag_dir / "universities" / "asu" / "voice_tone.yaml"
+    stamp = time.time() + 60
+    os.utime(path, (stamp, stamp))
+    cache = cache()
+    RAGLoader().load_university_voice_tone("asu")
+    assert cache.bundle_loads == 1
+
+@pytest.mark.parametrize("edited", ["tone: bold\n", VOICE.replace("warm", "calm")])
+def test_edited_source_is_parsed_from_yaml(rag_dir, cache, edited):
+    # The second edit keeps the size; the content hash catches it
+    compile_bundle()
+    (rag_dir / "universities" / "asu" / "voice_tone.yaml").write_text(edited)
+    cache = cache()
+    assert RAGLoader().load_university_voice_tone("asu")["tone"] in ("bold", "calm")
+    assert cache.bundle_loads == 0
+
+def test_new_source_is_parsed_from_yaml(rag_dir, cache):
+    compile_bundle()
+    (rag_dir / "universities" / "asu" / "brand_guidelines.yaml").write_text("colors: [maroon]\n")
+    cache = cache()
+    assert RAGLoader().load_university_brand_guidelines("asu") == {"colors": ["maroon"]}
+    assert cache.bundle_loads == 0
+
+def test_corrupt_bundle_is_ignored(rag_dir, cache, tmp_path):
+    compile_bundle()
+    bundle_path = tmp_path / "orchestrator" / "memory" / "rag_bundle" / BUNDLE_FILE
+    bundle_path.write_bytes(bundle_path.read_bytes()[:-1] + b"\x00")
+    cache = cache()
+    assert RAGLoader().load_university_voice_tone("asu")["tone"] == "warm"
+    assert cache.bundle_loads == 0
+
+def test_disabled_bundle_is_not_read(rag_dir, cache, monkeypatch):
+    compile_bundle()
+    monkeypatch.setenv("ORDAE_RAG_BUNDLE", "false")
+    cache = cache()
+    RAGLoader().load_university_voice_tone("asu")
+    assert cache.bundle_loads == 0
+
+def test_invalid_sources_block_the_compile(rag_dir, tmp_path):
+    (rag_dir / "program_catalog" / "msu_programs.yaml").write_text("programs:\n  - name: No id\n")
+    (rag_dir / "universities" / "asu" / "messaging_framework.yaml").write_text("key: [unclosed\n")
+    result = compile_bundle()
+    assert len(result["errors"]) == 2
+    assert not result["written"]
+    assert not (tmp_path / "orchestrator" / "memory" / "rag_bundle" / MANIFEST_FILE).exists()
+
+def test_cli_compile_and_status(rag_dir):
+    runner = CliRunner()
+    assert runner.invoke(rag.app, ["compile", "--check"]).exit_code == 0
+    assert not (rag_dir.parent / "orchestrator" / "memory" / "rag_bundle").exists()
+
+    assert runner.invoke(rag.app, ["compile"]).exit_code == 0
+    (rag_dir / "universities" / "asu" / "voice_tone.yaml").write_text("tone: bold\n")
+    result = runner.invoke(rag.app, ["status"])
+    assert result.exit_code == 0
+    assert "1 sources served from the bundle" in result.output
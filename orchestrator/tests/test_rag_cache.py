@@ -0,0 +1,86 @@
+"""
+Tests for the process-wide RAG cache: mtime invalidation, LRU bounds and sharing across loaders
+"""
+import os
+import time
+import pytest
+
+from orchestrator.tools import rag_loader as loader_module
+from orchestrator.tools.rag_bundle import RAGBundle
+from orchestrator.tools.rag_loader import RAGCache, RAGLoader
+
+def write_yaml(path, text, age=10):
+    """Write a YAML file dated `age` seconds ago, outside the racy window"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+@pytest.fixture(autouse=True)
+def no_bundle(tmp_path, monkeypatch):
+    # Every miss parses YAML
+    monkeypatch.setenv("ORDAE_RAG_BUNDLE", "false")
+    monkeypatch.setattr(loader_module, "rag_bundle", RAGBundle(tmp_path / "rag", tmp_path / "bundle"))
+
+def test_unchanged_file_is_a_hit(tmp_path):
+    cache = RAGCache()
+    path = write_yaml(tmp_path / "voice_tone.yaml", "tone: warm\n")
+    first = cache.load_yaml(path)
+    assert cache.load_yaml(path) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+@pytest.mark.parametrize("text", ["tone: bold\n", "tone: calm\n"])
+def test_changed_mtime_invalidates(tmp_path, text):
+    # "calm" keeps the size, so only the mtime tells the edit apart
+    cache = RAGCache()
+    path = write_yaml(tmp_path / "voice_tone.yaml", "tone: warm\n", age=20)
+    cache.load_yaml(path)
+    write_yaml(path, text)
+    assert cache.load_yaml(path) == {"tone": text.split()[1]}
+    assert cache.invalidations == 1
+
+def test_recently_modified_file_is_revalidated(tmp_path):
+    cache = RAGCache()
+    path = write_yaml(tmp_path / "voice_tone.yaml", "tone: warm\n", age=0)
+    cache.load_yaml(path)
+    cache.load_yaml(path)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+def test_deleted_file_returns_the_default(tmp_path):
+    cache = RAGCache()
+    path = write_yaml(tmp_path / "voice_tone.yaml", "tone: warm\n")
+    cache.load_yaml(path)
+    path.unlink()
+    assert cache.load_yaml(path, default={}) == {}
+    assert cache.stats()["entries"] == 0
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = RAGCache(max_entries=2)
+    a, b, c = (write_yaml(tmp_path / f"{name}.yaml", f"name: {name}\n") for name in "abc")
+    for path in (a, b, a, c):
+        cache.load_yaml(path)
+    assert cache.evictions == 1
+    cache.load_yaml(a)
+    assert cache.hits == 2
+    cache.load_yaml(b)
+    assert cache.misses == 4
+
+def test_byte_budget_bounds_the_cache(tmp_path):
+    cache = RAGCache(max_bytes=100)
+    for n in range(10):
+        cache.load_yaml(write_yaml(tmp_path / f"u{n}.yaml", f"text: {'x' * 30}\n"))
+    stats = cache.stats()
+    assert stats["bytes"] <= 100
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 8
+
+def test_loaders_share_the_process_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = RAGCache()
+    monkeypatch.setattr(loader_module, "rag_cache", cache)
+    write_yaml(tmp_path / "rag" / "universities" / "asu" / "voice_tone.yaml", "tone: warm\n")
+    # act builds a fresh loader per call
+    RAGLoader().load_university_voice_tone("asu")
+    assert RAGLoader().load_university_voice_tone("asu") == {"tone": "warm"}
+    assert cache.stats()["hit_rate"] == 0.5
@@ -0,0 +1,51 @@
+"""
+Tests for the time-ordered recency index behind retrieve_recent_memories
+"""
+import pytest
+
+from orchestrator.tools.recency_index import RECENCY_FILE, RecencyIndex
+
+def stamp(n):
+    return f"2026-10-01T10:00:{n:02d}"
+
+@pytest.fixture
+def recency(tmp_path):
+    index = RecencyIndex(tmp_path, capacity=10)
+    index.add([(f"m{n}", stamp(n), {"iteration": n}) for n in range(6)])
+    return index
+
+def ids(results):
+    return [memory_id for memory_id, _ in results]
+
+def test_latest_comes_newest_first(recency):
+    assert ids(recency.latest(3)) == ["m5", "m4", "m3"]
+    assert recency.latest(1)[0][1] == {"iteration": 5}
+
+def test_time_window(recency):
+    assert ids(recency.latest(10, since=stamp(2), until=stamp(4))) == ["m3", "m2"]
+    assert ids(recency.latest(10, until=stamp(1))) == ["m0"]
+
+def test_late_and_re_added_memories_take_their_place(recency):
+    # Written late by a slower process, but older than m1
+    recency.add([("late", "2026-10-01T10:00:00.5", {})])
+    assert ids(recency.latest(10, until=stamp(1))) == ["late", "m0"]
+    recency.add([("m0", stamp(59), {"iteration": 0})])
+    assert ids(recency.latest(1)) == ["m0"]
+    assert len(recency) == 7
+
+def test_removed_memories_are_forgotten(recency, tmp_path):
+    recency.remove(["m5", "m1"])
+    assert ids(recency.latest(10)) == ["m4", "m3", "m2", "m0"]
+    assert ids(RecencyIndex(tmp_path).latest(10)) == ["m4", "m3", "m2", "m0"]
+
+def test_capacity_bounds_memory_and_compacts_the_log(recency, tmp_path):
+    recency.add([(f"n{n}", stamp(10 + n), {}) for n in range(20)])
+    assert len(recency) == 10
+    assert ids(recency.latest(1)) == ["n19"]
+    # Expired lines are dropped from the log once it holds twice the capacity
+    assert len((tmp_path / RECENCY_FILE).read_text().splitlines()) <= 20
+
+def test_instances_share_the_log(recency, tmp_path):
+    other = RecencyIndex(tmp_path, capacity=10)
+    other.add([("m6", stamp(6), {})])
+    assert ids(recency.latest(1)) == ["m6"]
@@ -0,0 +1,33 @@
+"""
+Tests for the bounded state summaries that get embedded
+"""
+from orchestrator.tools.state_summary import summarize_state
+
+ENTRY = {
+    "iteration": 3,
+    "snapshot": {"missing_components": ["personas_for_asu"], "strategic_objectives": {"mission": "onboarding"}},
+    "decision": {"lane": "university_onboarding", "task": "create_university_personas", "target_university": "asu"},
+    "actions": {"status": "completed", "files_created": ["a", "b"]},
+    "evaluation": {"success": True, "recommendations": ["keep going"]}
+}
+
+def test_live_state_keeps_its_decision_and_outcome():
+    summary = summarize_state(ENTRY)
+    assert "lane: university_onboarding" in summary
+    assert "outcome: success" in summary
+    assert "files created: 2" in summary
+
+def test_evaluated_entry_keeps_its_decision_and_outcome():
+    assert summarize_state({**ENTRY, "version": 2}, ledger_entry=True) == summarize_state(ENTRY)
+
+def test_legacy_entry_leaves_out_the_other_iterations_decision():
+    summary = summarize_state(ENTRY, ledger_entry=True)
+    for borrowed in ("lane:", "outcome:", "status:", "recommendation:"):
+        assert borrowed not in summary
+    assert "files created: 0" in summary
+    assert "mission: onboarding" in summary
+    assert "missing: personas_for_asu" in summary
+
+def test_summary_stays_within_budget():
+    state = {**ENTRY, "snapshot": {"missing_components": [f"component_{n}" for n in range(100)]}}
+    assert len(summarize_state(state, budget=120)) <= 120
@@ -0,0 +1,73 @@
+"""
+Tests for batched embedding and upserts when storing many memories
+"""
+import threading
+import pytest
+
+from orchestrator.tools import vector_memory_store as store_module
+from orchestrator.tools.embeddings import HashingEmbeddingProvider
+from orchestrator.tools.vector_memory_store import VectorMemoryStore, chunk_texts
+
+def make_state(iteration):
+    return {
+        "version": 2,
+        "iteration": iteration,
+        "timestamp": f"2026-10-01T10:{iteration // 60:02d}:{iteration % 60:02d}",
+        "run_id": "run-1",
+        "snapshot": {"missing_components": [f"personas_for_uni{iteration}"]},
+        "decision": {"lane": "university_onboarding", "task": "create_university_personas",
+                     "target_university": f"uni{iteration}"},
+        "actions": {"files_created": ["a"]},
+        "evaluation": {"success": True}
+    }
+
+class FakePineconeIndex:
+    """Records upserted batches; the batch holding `fail_id` is rejected"""
+
+    def __init__(self, fail_id=None):
+        self.fail_id = fail_id
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def upsert(self, vectors):
+        if any(memory_id == self.fail_id for memory_id, _, _ in vectors):
+            raise RuntimeError("request too large")
+        with self._lock:
+            self.batches.append(vectors)
+
+@pytest.fixture
+def make_store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def build(index=None):
+        store = VectorMemoryStore()
+        store._embedding_provider, store._index, store._initialized = HashingEmbeddingProvider(32), index, True
+        return store
+    return build
+
+def test_chunks_respect_item_and_character_budgets():
+    assert list(chunk_texts(["a"] * 5, max_items=2, max_chars=100)) == [(0, 2), (2, 4), (4, 5)]
+    assert list(chunk_texts(["aaaa", "bbbb", "cc", "dddddddd"], max_items=10, max_chars=8)) == [(0, 2), (2, 3), (3, 4)]
+    assert list(chunk_texts([], max_items=2, max_chars=10)) == []
+
+def test_pinecone_path_batches_requests_and_reports_failed_upserts(make_store, monkeypatch):
+    monkeypatch.setattr(store_module, "EMBEDDING_BATCH_SIZE", 100)
+    monkeypatch.setattr(store_module, "UPSERT_BATCH_SIZE", 40)
+    index = FakePineconeIndex(fail_id="ordae-run-1-0")
+    store = make_store(index)
+
+    result = store.store_memories([make_state(iteration) for iteration in range(250)])
+    # 3 embedding requests; 100 + 100 + 50 vectors in upserts of at most 40
+    assert max(len(batch) for batch in index.batches) == 40
+    assert result["requests"] == 3 + 3 + 3 + 2
+    assert (result["backend"], result["stored"], result["failed"]) == ("pinecone", 210, 40)
+    # Only what was upserted is listed as recent
+    recent = store.recency_index(store.embedding_provider.model)
+    assert len(recent) == 210
+
+def test_local_path_adds_each_chunk_at_once(make_store, monkeypatch):
+    monkeypatch.setattr(store_module, "EMBEDDING_BATCH_SIZE", 64)
+    store = make_store()
+    result = store.store_memories([make_state(iteration) for iteration in range(150)])
+    assert (result["backend"], result["stored"], result["requests"]) == ("local", 150, 3)
+    assert len(store.local_index(store.embedding_provider.model)) == 150
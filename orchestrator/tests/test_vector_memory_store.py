@@ -0,0 +1,102 @@
+"""
+Tests for VectorMemoryStore on the local backends (hashing embeddings, local index, ledger fallback)
+"""
+import pytest
+
+from orchestrator.tools import vector_memory_store as store_module
+from orchestrator.tools.blob_store import BlobStore
+from orchestrator.tools.ledger import JSONLLedger
+from orchestrator.tools.vector_memory_store import VectorMemoryStore
+
+def make_entry(iteration, lane, success, version=2):
+    entry = {
+        "iteration": iteration,
+        "timestamp": f"2026-10-0{iteration}T10:00:00",
+        "run_id": "run-1",
+        "snapshot": {},
+        "decision": {"lane": lane, "task": f"{lane}_task", "target_university": "asu"},
+        "actions": {},
+        "evaluation": {"success": success}
+    }
+    if version > 1:
+        entry["version"] = version
+    return entry
+
+@pytest.fixture
+def ledger_backend(tmp_path, monkeypatch):
+    ledger = JSONLLedger(directory=tmp_path / "ledger")
+    monkeypatch.setattr(store_module, "ledger", ledger)
+    monkeypatch.setattr(store_module, "blob_store", BlobStore(directory=tmp_path / "blobs"))
+    return ledger
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # Offline: hashing embeddings and local indexes under tmp_path
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("PINECONE_API_KEY", raising=False)
+    monkeypatch.setenv("ORDAE_EMBEDDING_PROVIDER", "hashing")
+    return VectorMemoryStore()
+
+@pytest.mark.parametrize("filters", [
+    {"lane": "marketing"}, {"task": "marketing_task"}, {"target_university": "asu"}, {"success": True}
+])
+def test_filtered_fallback_skips_legacy_entries(store, ledger_backend, filters, monkeypatch):
+    ledger_backend.append_many([
+        make_entry(1, "marketing", True, version=1),
+        make_entry(2, "marketing", True)
+    ])
+    # An index written before `ledger reindex` still holds the legacy entry's borrowed decision
+    records = ledger_backend.index()
+    stale = [{**record, "lane": "marketing", "task": "marketing_task", "target_university": "asu", "success": True}
+             for record in records]
+    monkeypatch.setattr(ledger_backend, "index", lambda: stale)
+    memories = store._fallback_local_retrieval(5, filters=filters)
+    assert [memory["iteration"] for memory in memories] == [2]
+
+def test_iteration_filter_still_matches_legacy_entries(store, ledger_backend):
+    ledger_backend.append_many([make_entry(1, "marketing", True, version=1), make_entry(2, "product", False)])
+    memories = store._fallback_local_retrieval(5, filters={"iteration": 1})
+    assert [memory["iteration"] for memory in memories] == [1]
+
+def test_recent_memories_come_newest_first_from_either_path(store, ledger_backend):
+    entries = [make_entry(iteration, "marketing", True) for iteration in (1, 2, 3)]
+    ledger_backend.append_many(entries)
+    # Nothing embedded yet: served by the ledger fallback
+    from_ledger = store.retrieve_recent_memories(limit=2)
+
+    store.store_memories(entries)
+    from_index = store.retrieve_recent_memories(limit=2)
+
+    assert [memory["iteration"] for memory in from_ledger] == [3, 2]
+    assert [memory["iteration"] for memory in from_index] == [3, 2]
+    assert set(from_ledger[0]) == set(from_index[0])
+    assert from_ledger[0]["id"] == from_index[0]["id"]
+    assert from_ledger[0]["state_summary"] == from_index[0]["state_summary"]
+
+def test_recent_memories_time_window_uses_the_fallback(store, ledger_backend):
+    ledger_backend.append_many([make_entry(iteration, "marketing", True) for iteration in (1, 2, 3)])
+    memories = store.retrieve_recent_memories(limit=5, since="2026-10-02T00:00:00", until="2026-10-03T00:00:00")
+    assert [memory["iteration"] for memory in memories] == [2]
+
+def test_search_memories_only_ranks_the_filtered_slice(store, ledger_backend):
+    entries = [make_entry(1, "marketing", True), make_entry(2, "university_onboarding", False),
+               make_entry(3, "university_onboarding", True), make_entry(4, "university_onboarding", False)]
+    entries[3]["decision"]["target_university"] = "msu"
+    store.store_memories(entries)
+
+    memories = store.search_memories(entries[0], lane="university_onboarding", target_university="asu", success=False)
+    assert [memory["iteration"] for memory in memories] == [2]
+    assert memories[0]["decision_type"] == "university_onboarding_task"
+    assert [memory["iteration"] for memory in store.search_memories("anything", limit=5, iteration=[1, 3])] in ([1, 3], [3, 1])
+
+def test_legacy_entries_carry_no_success_or_borrowed_lane(store):
+    metadata = store._memory_metadata(make_entry(1, "marketing", True, version=1), "text")
+    assert "success" not in metadata
+    assert metadata["lane"] == "unknown"
+
+def test_pinecone_filter_translation():
+    assert VectorMemoryStore._pinecone_filter({"lane": "marketing", "iteration": [1, 2]}) == {
+        "lane": {"$eq": "marketing"}, "iteration": {"$in": [1, 2]}
+    }
+    assert VectorMemoryStore._pinecone_filter({}) is None
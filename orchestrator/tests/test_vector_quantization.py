@@ -0,0 +1,114 @@
+"""
+Tests for quantized vector storage, legacy float32 indexes and the IVF search path
+"""
+import json
+import numpy as np
+import pytest
+
+from orchestrator.tools.local_vector_index import IVF_FILE, LocalVectorIndex, normalize_rows
+
+DIMENSION = 32
+
+def vectors(count, seed=0):
+    return np.random.default_rng(seed).normal(size=(count, DIMENSION)).astype(np.float32)
+
+def clustered(clusters=20, per_cluster=50, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, DIMENSION))
+    return (np.repeat(centers, per_cluster, axis=0)
+            + 0.3 * rng.normal(size=(clusters * per_cluster, DIMENSION))).astype(np.float32)
+
+def build(directory, data, **kwargs):
+    index = LocalVectorIndex(directory, **kwargs)
+    index.add([f"m{n}" for n in range(len(data))], data)
+    return index
+
+def test_int8_ranks_like_float32(tmp_path):
+    data, queries = vectors(200), vectors(20, seed=1)
+    exact = build(tmp_path / "f32", data, dtype="float32")
+    quantized = build(tmp_path / "i8", data, dtype="int8")
+    for expected, actual in zip(exact.search(queries, k=5), quantized.search(queries, k=5)):
+        assert actual[0][0] == expected[0][0]
+        expected_scores = dict((memory_id, score) for memory_id, score, _ in expected)
+        for memory_id, score, _ in actual:
+            if memory_id in expected_scores:
+                assert score == pytest.approx(expected_scores[memory_id], abs=0.01)
+
+@pytest.mark.parametrize("dtype,filename,itemsize", [
+    ("int8", "vectors.i8", 1), ("float16", "vectors.f16", 2), ("float32", "vectors.f32", 4)
+])
+def test_vector_file_size_follows_dtype(tmp_path, dtype, filename, itemsize):
+    build(tmp_path, vectors(50), dtype=dtype)
+    assert (tmp_path / filename).stat().st_size == 50 * DIMENSION * itemsize
+    assert (tmp_path / "scales.f32").stat().st_size == 50 * 4
+    assert json.loads((tmp_path / "header.json").read_text())["dtype"] == dtype
+
+def test_existing_index_keeps_its_dtype(tmp_path):
+    build(tmp_path, vectors(10), dtype="float16")
+    reopened = LocalVectorIndex(tmp_path, dtype="int8")
+    reopened.add(["extra"], vectors(1, seed=2))
+    assert len(reopened) == 11
+    assert not (tmp_path / "vectors.i8").exists()
+
+def test_legacy_float32_index_without_scales_is_read_and_extended(tmp_path):
+    # Written before quantization: no dtype in the header and no scales file
+    data = normalize_rows(vectors(10))
+    (tmp_path / "header.json").write_text(json.dumps({"dimension": DIMENSION, "model": None}))
+    (tmp_path / "vectors.f32").write_bytes(data.tobytes())
+    (tmp_path / "metadata.jsonl").write_text("".join(json.dumps({"id": f"m{n}", "metadata": {}}) + "\n" for n in range(10)))
+
+    index = LocalVectorIndex(tmp_path, dtype="int8")
+    [results] = index.search(data[3], k=1)
+    assert results[0][0] == "m3"
+    assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    index.add(["m10"], vectors(1, seed=5))
+    assert (tmp_path / "scales.f32").stat().st_size == 11 * 4
+    [results] = LocalVectorIndex(tmp_path).search(data[7], k=1)
+    assert results[0][0] == "m7"
+
+def test_ivf_recall_matches_exact_search(tmp_path):
+    data, queries = clustered(), clustered(seed=1)[::50]
+    exact = build(tmp_path / "exact", data, ivf_threshold=10 ** 6)
+    approximate = build(tmp_path / "ivf", data, ivf_threshold=100, nprobe=4)
+    hits = total = 0
+    for expected, actual in zip(exact.search(queries, k=10), approximate.search(queries, k=10)):
+        hits += len({memory_id for memory_id, _, _ in expected} & {memory_id for memory_id, _, _ in actual})
+        total += len(expected)
+    assert (tmp_path / "ivf" / IVF_FILE).exists()
+    assert hits / total >= 0.9
+
+def test_ivf_is_persisted_and_reloaded(tmp_path, monkeypatch):
+    data = clustered()
+    build(tmp_path, data, ivf_threshold=100, nprobe=4).search(data[0], k=1)
+    assert (tmp_path / IVF_FILE).exists()
+
+    reopened = LocalVectorIndex(tmp_path, ivf_threshold=100, nprobe=4)
+    monkeypatch.setattr(reopened, "_build_ivf", lambda: pytest.fail("IVF was rebuilt instead of loaded"))
+    [results] = reopened.search(data[120], k=1)
+    assert results[0][0] == "m120"
+
+def test_ivf_covers_rows_added_after_it_was_built(tmp_path):
+    data = clustered()
+    index = build(tmp_path, data, ivf_threshold=100, nprobe=4)
+    index.search(data[0], k=1)
+    late = vectors(1, seed=4)
+    index.add(["late"], late)
+    [results] = index.search(late, k=1)
+    assert results[0][0] == "late"
+
+def test_interrupted_add_is_truncated(tmp_path):
+    build(tmp_path, vectors(5), dtype="int8")
+    # Vector and scale bytes written, metadata line never appended
+    with open(tmp_path / "vectors.i8", "ab") as f:
+        f.write(b"\x01" * DIMENSION)
+    with open(tmp_path / "scales.f32", "ab") as f:
+        f.write(np.ones(1, dtype=np.float32).tobytes())
+
+    reopened = LocalVectorIndex(tmp_path)
+    assert len(reopened) == 5
+    reopened.add(["m5"], vectors(1, seed=3))
+    assert (tmp_path / "vectors.i8").stat().st_size == 6 * DIMENSION
+    assert (tmp_path / "scales.f32").stat().st_size == 6 * 4
+    [results] = reopened.search(vectors(1, seed=3), k=1)
+    assert results[0][0] == "m5"
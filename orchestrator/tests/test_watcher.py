@@ -0,0 +1,89 @@
+"""
+Tests for the watch-mode input watcher and change classification
+"""
+import threading
+import time
+import pytest
+
+from orchestrator.tools import watcher as watcher_module
+from orchestrator.tools.watcher import InputWatcher, classify_changes
+
+@pytest.fixture
+def inputs(tmp_path):
+    (tmp_path / "persona_data").mkdir()
+    (tmp_path / "persona_data" / "asu_mba_executive.json").write_text("{}")
+    (tmp_path / "rag" / "universities" / "asu").mkdir(parents=True)
+    (tmp_path / "rag" / "universities" / "asu" / "voice_tone.yaml").write_text("tone: warm\n")
+    return tmp_path
+
+@pytest.fixture
+def polling_watcher(inputs, monkeypatch):
+    # Force the polling fallback even where watchfiles is installed
+    monkeypatch.setattr(InputWatcher, "_open_event_stream", lambda self: None)
+    watcher = InputWatcher([inputs / "persona_data", inputs / "rag"], poll_interval=0.01, debounce=0.1)
+    watcher.rebaseline()
+    return watcher
+
+def in_background(*steps, delay=0.05):
+    """Run file changes on a thread, `delay` apart"""
+    def run():
+        for step in steps:
+            time.sleep(delay)
+            step()
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+def test_poll_reports_a_burst_once_it_settles(polling_watcher, inputs):
+    persona = inputs / "persona_data" / "asu_mba_executive.json"
+    added = inputs / "rag" / "universities" / "asu" / "messaging_framework.yaml"
+    thread = in_background(
+        lambda: persona.write_text('{"edited": 1}'),
+        lambda: added.write_text("pillars: []\n"),
+        lambda: persona.write_text('{"edited": 2}')
+    )
+    changed = polling_watcher.wait_for_changes()
+    thread.join()
+    assert changed == sorted([str(persona), str(added)])
+
+def test_poll_reports_deletions(polling_watcher, inputs):
+    persona = inputs / "persona_data" / "asu_mba_executive.json"
+    thread = in_background(persona.unlink)
+    assert polling_watcher.wait_for_changes() == [str(persona)]
+    thread.join()
+
+def test_rebaseline_accepts_own_writes(polling_watcher, inputs):
+    (inputs / "persona_data" / "AB_PLAN.md").write_text("plan")
+    polling_watcher.rebaseline()
+    assert polling_watcher._changed_paths(polling_watcher.scan()) == []
+
+def test_poll_relists_only_changed_directories(polling_watcher, inputs, monkeypatch):
+    scandir = watcher_module.os.scandir
+    listed = []
+    monkeypatch.setattr(watcher_module.os, "scandir", lambda path: listed.append(path) or scandir(path))
+
+    (inputs / "persona_data" / "asu_mba_executive.json").write_text('{"edited": 1}')
+    polling_watcher.scan()
+    assert listed == []
+
+    new_file = inputs / "persona_data" / "asu_mba_new.json"
+    new_file.write_text("{}")
+    assert str(new_file) in polling_watcher.scan()
+    assert listed == [str(inputs / "persona_data")]
+
+def test_classify_changes(inputs):
+    persona_dir = inputs / "persona_data"
+    (persona_dir / "asu_online_mba_executive.json").write_text("{}")
+    changed = [
+        str(inputs / "rag" / "universities" / "msu" / "voice_tone.yaml"),
+        str(inputs / "rag" / "program_catalog" / "osu_programs.yaml"),
+        # Deleted persona of the longer id; an edited one needs no rebuild
+        str(persona_dir / "asu_online_mba_career_changer.json"),
+        str(persona_dir / "asu_online_mba_executive.json"),
+    ]
+    universities, other = classify_changes(changed, ["asu", "asu_online", "msu", "osu"], inputs)
+    assert universities == {"msu", "osu", "asu_online"}
+    assert not other
+
+    _, other = classify_changes([str(persona_dir / "university_config.json")], ["asu"], inputs)
+    assert other
@@ -0,0 +1,172 @@
+"""
+Content-addressed blob store for ORDAE memory
+Large, rarely changing sub-objects (university config, strategic objectives,
+persona file lists) are stored once, keyed by the hash of their canonical
+JSON, and ledger entries keep only {"$blob": "sha256:..."} references.
+Blobs no ledger entry references any more are deleted by sweep()
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+from .tracing import tracer
+
+REF_KEY = "$blob"
+
+# Seconds a remembered reference is trusted without touching its blob file
+MEMO_SECONDS = 600
+# Blobs written or reused this recently survive a sweep: their entry may still be queued
+SWEEP_GRACE_SECONDS = 3600
+
+def get_blob_dir() -> Path:
+    """Directory holding one file per blob, fanned out by hash prefix"""
+    return Path.cwd() / "orchestrator" / "memory" / "blobs"
+
+def is_blob_ref(value: Any) -> bool:
+    """Check whether a value is a blob reference"""
+    return isinstance(value, dict) and len(value) == 1 and REF_KEY in value
+
+def iter_refs(value: Any) -> Iterator[str]:
+    """Digests of the blob references inside a value"""
+    if is_blob_ref(value):
+        yield value[REF_KEY].split(":", 1)[1]
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_refs(item)
+
+def referenced_blobs(entries: Iterable[Dict[str, Any]]) -> Set[str]:
+    """Digests referenced by a stream of stored entries"""
+    return {digest for entry in entries for digest in iter_refs(entry)}
+
+class LazyView(dict):
+    """
+    Dict view of a stored entry that loads referenced blobs on first access (as private copies)
+    Iteration and serialization see the raw references; use BlobStore.resolve for a full copy
+    """
+
+    def __init__(self, data: Dict[str, Any], store: "BlobStore"):
+        super().__init__(data)
+        self._store = store
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if is_blob_ref(value):
+            value = self._store.resolve(value)
+            super().__setitem__(key, value)
+        elif isinstance(value, dict) and not isinstance(value, LazyView):
+            value = LazyView(value, self._store)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+class BlobStore:
+    """Write-once JSON blobs addressed by sha256, with an LRU of loaded values"""
+
+    def __init__(self, directory: Optional[Path] = None, cache_size: int = 128):
+        self.directory = directory or get_blob_dir()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        # Last reference per object identity: an object stored again unchanged
+        # (e.g. a snapshot compacted once more on a retried write) skips re-serialization
+        self._memo: Dict[int, Tuple[Any, Dict[str, str], float]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / f"{digest[2:]}.json"
+
+    def put(self, value: Any) -> Dict[str, str]:
+        """Store a JSON-serializable value, returning its reference; existing blobs are not rewritten"""
+        now = time.monotonic()
+        memo = self._memo.get(id(value))
+        # Memo hits are re-checked now and then, so a reused blob's mtime stays within the sweep grace period
+        if memo is not None and memo[0] is value and now - memo[2] < MEMO_SECONDS:
+            return memo[1]
+
+        payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._path(digest)
+        try:
+            # Reused: mark it as recently referenced for sweep()
+            os.utime(path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+            tracer.count("io")
+
+        ref = {REF_KEY: f"sha256:{digest}"}
+        with self._lock:
+            if len(self._memo) > self.cache_size:
+                self._memo.clear()
+            self._memo[id(value)] = (value, ref, now)
+        return ref
+
+    def get(self, ref: Dict[str, str]) -> Any:
+        """Load the value behind a reference; the result is shared with the cache, treat it as read-only"""
+        digest = ref[REF_KEY].split(":", 1)[1]
+        with self._lock:
+            if digest in self._cache:
+                self._cache.move_to_end(digest)
+                return self._cache[digest]
+
+        with open(self._path(digest), 'rb') as f:
+            value = json.loads(f.read())
+        tracer.count("io")
+
+        with self._lock:
+            self._cache[digest] = value
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return value
+
+    def lazy(self, entry: Dict[str, Any]) -> LazyView:
+        """Wrap an entry so referenced sub-objects load only when accessed"""
+        return LazyView(entry, self)
+
+    def resolve(self, value: Any) -> Any:
+        """Return a copy of value with every blob reference replaced by (a copy of) its content"""
+        if is_blob_ref(value):
+            return self.resolve(self.get(value))
+        if isinstance(value, dict):
+            return {key: self.resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.resolve(item) for item in value]
+        return value
+
+    def sweep(self, referenced: Set[str], grace_seconds: float = SWEEP_GRACE_SECONDS) -> int:
+        """
+        Delete blobs whose digest is not in `referenced` (see referenced_blobs); blobs
+        written or reused within grace_seconds are kept. Returns the number deleted
+        """
+        if not self.directory.exists():
+            return 0
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for path in self.directory.glob("*/*"):
+            digest = path.parent.name + path.name.split(".", 1)[0]
+            try:
+                if digest in referenced or path.stat().st_mtime >= cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed += 1
+            with self._lock:
+                self._cache.pop(digest, None)
+        if removed:
+            with self._lock:
+                self._memo.clear()
+        return removed
+
+# Global instance
+blob_store = BlobStore()
@@ -0,0 +1,172 @@
+"""
+Durable checkpointing for ORDAE runs
+Node-level state goes through langgraph's SQLite checkpointer, persona-level
+progress inside act is journaled per iteration so resuming an interrupted
+iteration skips the personas it already finished. Checkpoints and journal rows
+of runs older than ORDAE_CHECKPOINT_TTL_DAYS (default 14, 0 = keep forever)
+are pruned whenever the database is opened
+"""
+import sqlite3
+import threading
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+from rich.console import Console
+from .config import get_setting
+from .tracing import tracer
+
+console = Console()
+
+def get_checkpoint_db_path() -> Path:
+    """Location of the shared checkpoint database"""
+    return Path.cwd() / "orchestrator" / "memory" / "checkpoints.sqlite"
+
+# Run ids start with their start time, which is what checkpoint pruning compares
+RUN_ID_TIME_FORMAT = "%Y%m%d-%H%M%S"
+RUN_ID_GLOB = "[0-9][0-9][0-9][0-9][0-9][0-9][0-9][0-9]-[0-9][0-9][0-9][0-9][0-9][0-9]-*"
+
+def new_run_id() -> str:
+    """Create a sortable, unique run id used as the langgraph thread id"""
+    return f"{datetime.now().strftime(RUN_ID_TIME_FORMAT)}-{uuid.uuid4().hex[:6]}"
+
+def checkpoint_ttl_days() -> float:
+    """Days a run stays resumable (ORDAE_PERSONA_PROGRESS_TTL_DAYS is still honored)"""
+    return float(get_setting("ORDAE_CHECKPOINT_TTL_DAYS", get_setting("ORDAE_PERSONA_PROGRESS_TTL_DAYS", "14")))
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=30.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+def prune_checkpoints(conn: sqlite3.Connection, ttl_days: Optional[float] = None) -> int:
+    """Delete langgraph checkpoints of runs started before the TTL; returns the number of checkpoints deleted"""
+    ttl_days = checkpoint_ttl_days() if ttl_days is None else ttl_days
+    if ttl_days <= 0:
+        return 0
+    cutoff = (datetime.now() - timedelta(days=ttl_days)).strftime(RUN_ID_TIME_FORMAT)
+    deleted = 0
+    for table in ("writes", "checkpoints"):
+        try:
+            deleted = conn.execute(
+                f"DELETE FROM {table} WHERE thread_id GLOB ? AND thread_id < ?", (RUN_ID_GLOB, cutoff)
+            ).rowcount
+        except sqlite3.OperationalError:
+            # The saver creates its tables on first use
+            return 0
+    conn.commit()
+    return deleted
+
+@contextmanager
+def open_checkpointer(db_path: Optional[Path] = None):
+    """
+    Open a SQLite-backed langgraph checkpointer, pruning expired runs; the connection closes on exit
+    Yields None when langgraph-checkpoint-sqlite is not installed
+    """
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError:
+        console.print("⚠️  langgraph-checkpoint-sqlite not installed - running without checkpoints")
+        yield None
+        return
+
+    conn = _connect(db_path or get_checkpoint_db_path())
+    try:
+        prune_checkpoints(conn)
+        yield SqliteSaver(conn)
+    finally:
+        conn.close()
+
+@asynccontextmanager
+async def open_async_checkpointer(db_path: Optional[Path] = None):
+    """
+    Async counterpart of open_checkpointer for graphs run with ainvoke
+    Yields None when the aiosqlite-based saver is not installed
+    """
+    try:
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError:
+        console.print("⚠️  langgraph-checkpoint-sqlite[aio] not installed - running without checkpoints")
+        yield None
+        return
+
+    db_path = db_path or get_checkpoint_db_path()
+    conn = _connect(db_path)
+    try:
+        prune_checkpoints(conn)
+    finally:
+        conn.close()
+    async with AsyncSqliteSaver.from_conn_string(str(db_path)) as saver:
+        yield saver
+
+class PersonaProgress:
+    """Journal of personas completed per iteration of a checkpointed run, committed after every persona"""
+
+    def __init__(self, db_path: Optional[Path] = None, ttl_days: Optional[float] = None):
+        self.db_path = db_path or get_checkpoint_db_path()
+        # Runs older than this can no longer be usefully resumed; their journal rows are pruned
+        self.ttl_days = ttl_days if ttl_days is not None else checkpoint_ttl_days()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = _connect(self.db_path)
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(persona_progress)")]
+            if columns and "iteration" not in columns:
+                # Journals keyed by run only cannot tell which iteration they belong to
+                self._conn.execute("DROP TABLE persona_progress")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS persona_progress (
+                    run_id TEXT NOT NULL,
+                    iteration INTEGER NOT NULL,
+                    university TEXT NOT NULL,
+                    persona_id TEXT NOT NULL,
+                    action TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (run_id, iteration, persona_id)
+                )"""
+            )
+            self._conn.commit()
+            self._prune()
+        return self._conn
+
+    def _prune(self) -> int:
+        """Delete journal rows older than the TTL (0 keeps them forever); returns the number deleted"""
+        if self.ttl_days <= 0:
+            return 0
+        cutoff = (datetime.now() - timedelta(days=self.ttl_days)).isoformat()
+        deleted = self._conn.execute("DELETE FROM persona_progress WHERE created_at < ?", (cutoff,)).rowcount
+        self._conn.commit()
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def completed(self, run_id: str, iteration: int, university_id: str) -> Dict[str, str]:
+        """Personas already finished for a university in this iteration of the run, mapped to their action"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT persona_id, action FROM persona_progress WHERE run_id = ? AND iteration = ? AND university = ?",
+                (run_id, iteration, university_id)
+            ).fetchall()
+        return dict(rows)
+
+    def record(self, run_id: str, iteration: int, university_id: str, persona_id: str, action: str) -> None:
+        """Mark a persona as done so resuming this iteration does not recreate it"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO persona_progress VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, iteration, university_id, persona_id, action, datetime.now().isoformat())
+            )
+            conn.commit()
+        tracer.count("io")
+
+# Global instance
+persona_progress = PersonaProgress()
@@ -0,0 +1,38 @@
+"""
+Shared configuration loader for ORDAE tools
+Parses the project .env once per process instead of once per client module
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+ENV_FILE = Path(__file__).parent.parent.parent / ".env"
+
+_env_values: Optional[Dict[str, str]] = None
+_env_lock = threading.Lock()
+
+def load_env() -> Dict[str, str]:
+    """Parse .env on first call and export its values to os.environ"""
+    global _env_values
+    if _env_values is not None:
+        return _env_values
+
+    with _env_lock:
+        if _env_values is None:
+            values = {}
+            if ENV_FILE.exists():
+                with open(ENV_FILE, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line and not line.startswith('#') and '=' in line:
+                            key, value = line.split('=', 1)
+                            values[key] = value.strip('"\'')
+            os.environ.update(values)
+            _env_values = values
+    return _env_values
+
+def get_setting(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read a setting from the environment, with .env loaded first"""
+    load_env()
+    return os.getenv(name, default)
@@ -0,0 +1,295 @@
+"""
+Memory consolidation for ORDAE
+Ledger entries older than the iterations TTL are folded into episode records,
+one per mission, target university and month, holding counts, outcomes and
+representative states. The raw entries and their vector memories are then
+removed (with the blobs only they referenced), and episodes past the episodes
+TTL are dropped, so storage and retrieval cost stay flat while the long-term
+signal is kept. Entries recorded before evaluate ran (ledger version 1) hold
+another iteration's decision and outcome; they are folded with an unknown
+outcome and no lane, task or university.
+
+Namespaces and their TTLs (days, 0 = keep forever):
+- iterations: raw ledger entries and vector memories (ORDAE_MEMORY_TTL_ITERATIONS_DAYS, 30)
+- episodes: consolidated episode records (ORDAE_MEMORY_TTL_EPISODES_DAYS, 0)
+"""
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .blob_store import blob_store, referenced_blobs
+from .config import get_setting
+from .ledger import entry_fields, entry_is_evaluated, ledger, record_key
+from .ledger_analytics import parse_timestamp, period_key
+from .locking import InterProcessLock
+from .state_summary import join_fragments, summarize_state
+from .tracing import tracer
+
+NAMESPACE_TTLS = {
+    "iterations": ("ORDAE_MEMORY_TTL_ITERATIONS_DAYS", "30"),
+    "episodes": ("ORDAE_MEMORY_TTL_EPISODES_DAYS", "0")
+}
+
+# Characters of state summary kept per representative state, and of episode text embedded
+REPRESENTATIVE_BUDGET = 300
+EPISODE_TEXT_BUDGET = 1000
+
+def get_episodes_path() -> Path:
+    """File holding consolidated episode records"""
+    return Path.cwd() / "orchestrator" / "memory" / "episodes.json"
+
+def namespace_ttl(namespace: str, days: Optional[float] = None) -> Optional[timedelta]:
+    """TTL of a memory namespace (`days` overrides the setting), or None when it is kept forever"""
+    if days is None:
+        setting, default = NAMESPACE_TTLS[namespace]
+        days = float(get_setting(setting, default))
+    return timedelta(days=days) if days > 0 else None
+
+def episode_key(entry: Dict[str, Any]) -> Tuple[str, str, str]:
+    """(mission, target university, month) an entry belongs to"""
+    objectives = (entry.get("snapshot") or {}).get("strategic_objectives")
+    mission = objectives.get("mission") if isinstance(objectives, dict) else None
+    university = entry_fields(entry)["target_university"]
+    moment = parse_timestamp(entry.get("timestamp")) or datetime.now()
+    return mission or "none", university or "none", period_key(moment, "month")
+
+def episode_id(mission: str, university: str, period: str) -> str:
+    return f"episode-{mission}-{university}-{period}"
+
+def new_episode(mission: str, university: str, period: str) -> Dict[str, Any]:
+    return {
+        "id": episode_id(mission, university, period),
+        "kind": "episode",
+        "mission": mission,
+        "target_university": university,
+        "period": period,
+        "first_timestamp": None,
+        "last_timestamp": None,
+        "last_iteration": None,
+        "iterations": 0,
+        "successes": 0,
+        "failures": 0,
+        # legacy entries, whose outcome belongs to another iteration
+        "unknown": 0,
+        "lanes": {},
+        "tasks": {},
+        # first state, latest success and latest failure
+        "representatives": {}
+    }
+
+def representative(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact stand-in for a raw entry inside an episode"""
+    fields = entry_fields(entry)
+    return {
+        "timestamp": fields["timestamp"],
+        "iteration": fields["iteration"],
+        "run_id": fields["run_id"],
+        "lane": fields["lane"],
+        "task": fields["task"],
+        "success": fields["success"],
+        "summary": summarize_state(entry, REPRESENTATIVE_BUDGET, ledger_entry=True)
+    }
+
+def fold_entry(episode: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """Add one ledger entry to an episode's counts and representatives"""
+    fields = entry_fields(entry)
+    evaluated = entry_is_evaluated(entry)
+    timestamp = fields["timestamp"] or ""
+    episode["iterations"] += 1
+    if evaluated:
+        episode["successes" if fields["success"] else "failures"] += 1
+    else:
+        episode["unknown"] = episode.get("unknown", 0) + 1
+    for key, value in (("lanes", fields["lane"]), ("tasks", fields["task"])):
+        episode[key][value or "unknown"] = episode[key].get(value or "unknown", 0) + 1
+    if not episode["first_timestamp"] or timestamp < episode["first_timestamp"]:
+        episode["first_timestamp"] = timestamp
+    if not episode["last_timestamp"] or timestamp >= episode["last_timestamp"]:
+        episode["last_timestamp"], episode["last_iteration"] = timestamp, fields["iteration"]
+
+    representatives = episode["representatives"]
+    first = representatives.get("first")
+    if first is None or timestamp < (first["timestamp"] or ""):
+        representatives["first"] = representative(entry)
+    if not evaluated:
+        return
+    latest = "last_success" if fields["success"] else "last_failure"
+    if representatives.get(latest) is None or timestamp >= (representatives[latest]["timestamp"] or ""):
+        representatives[latest] = representative(entry)
+
+def _most_common(counts: Dict[str, int]) -> str:
+    return Counter(counts).most_common(1)[0][0] if counts else "unknown"
+
+def iter_episode_fragments(episode: Dict[str, Any]) -> Iterator[str]:
+    """`label: value` fragments of an episode, most important first"""
+    yield f"ORDAE episode {episode['period']}"
+    yield f"mission: {episode['mission']}"
+    yield f"target_university: {episode['target_university']}"
+    yield f"iterations: {episode['iterations']}"
+    yield f"successes: {episode['successes']}"
+    yield f"failures: {episode['failures']}"
+    if episode.get("unknown"):
+        yield f"unknown outcome: {episode['unknown']}"
+    for lane, count in Counter(episode["lanes"]).most_common():
+        yield f"lane: {lane} x{count}"
+    for task, count in Counter(episode["tasks"]).most_common():
+        yield f"task: {task} x{count}"
+    for role in ("last_failure", "last_success", "first"):
+        state = episode["representatives"].get(role)
+        if state:
+            yield f"{role.replace('_', ' ')}: {state['summary']}"
+
+def episode_text(episode: Dict[str, Any]) -> str:
+    """Bounded text embedded for an episode"""
+    return join_fragments(iter_episode_fragments(episode), EPISODE_TEXT_BUDGET)
+
+def episode_metadata(episode: Dict[str, Any]) -> Dict[str, Any]:
+    """Vector metadata for an episode, with the same filterable fields as iteration memories"""
+    metadata = {
+        "timestamp": episode["last_timestamp"],
+        "iteration": episode["last_iteration"],
+        "kind": "episode",
+        "run_id": "",
+        "lane": _most_common(episode["lanes"]),
+        "task": _most_common(episode["tasks"]),
+        "target_university": episode["target_university"],
+        # An episode counts as successful when most of its evaluated iterations were
+        "success": episode["successes"] >= episode["failures"],
+        "system_id": "ordae-main",
+        "mission": episode["mission"],
+        "period": episode["period"],
+        "iterations": episode["iterations"],
+        "successes": episode["successes"],
+        "decision_type": _most_common(episode["tasks"])
+    }
+    if not episode["successes"] and not episode["failures"]:
+        # Only legacy entries: like their iteration memories, no success to filter on
+        del metadata["success"]
+    return metadata
+
+class EpisodeStore:
+    """Episode records by id, plus the ledger records folded into them but not yet removed"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_episodes_path()
+        self.lock = InterProcessLock(self.path.with_suffix(".lock"))
+
+    def load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"folded": [], "episodes": {}}
+        tracer.count("io")
+        return state
+
+    def save(self, state: Dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2, default=str)
+        os.replace(tmp_path, self.path)
+        tracer.count("io")
+
+    def episodes(self, mission: Optional[str] = None, university: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Episodes, oldest period first, optionally for one mission and/or university"""
+        return sorted(
+            (
+                episode for episode in self.load()["episodes"].values()
+                if (mission is None or episode["mission"] == mission)
+                and (university is None or episode["target_university"] == university)
+            ),
+            key=lambda episode: (episode["period"], episode["mission"], episode["target_university"])
+        )
+
+class MemoryConsolidator:
+    """Rolls expired ledger entries into episodes and enforces the namespace TTLs"""
+
+    def __init__(self, episode_store: Optional[EpisodeStore] = None, ledger_backend: Any = None,
+                 blobs: Any = None):
+        self.episode_store = episode_store or EpisodeStore()
+        self.ledger = ledger_backend or ledger
+        self.blob_store = blobs or blob_store
+
+    def run(self, iterations_ttl_days: Optional[float] = None, episodes_ttl_days: Optional[float] = None,
+            vectors: bool = True, dry_run: bool = False, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Consolidate entries older than the iterations TTL and drop episodes older than the
+        episodes TTL (days; None uses the namespace setting, 0 keeps forever). Episodes are saved before any raw data is
+        removed, along with the keys of the records they fold, so a record left behind by a run
+        that stopped before removing it is never folded twice
+        """
+        now = now or datetime.now()
+        iterations_ttl = namespace_ttl("iterations", iterations_ttl_days)
+        episodes_ttl = namespace_ttl("episodes", episodes_ttl_days)
+        stats = {
+            "cutoff": None, "entries_consolidated": 0, "entries_already_folded": 0, "entries_removed": 0,
+            "episodes_updated": 0, "episodes_expired": 0, "episodes_total": 0, "vectors_removed": 0,
+            "blobs_removed": 0, "entries_unknown_outcome": 0
+        }
+
+        with self.episode_store.lock:
+            state = self.episode_store.load()
+            episodes = state["episodes"]
+            folded = set(state.get("folded") or [])
+            # Stores saved before folded keys existed: their timestamp watermark is honoured one last time
+            watermark = state.get("watermark", "") if "folded" not in state else ""
+
+            records: List[Dict[str, Any]] = []
+            updated: Dict[str, Dict[str, Any]] = {}
+            if iterations_ttl is not None:
+                stats["cutoff"] = (now - iterations_ttl).isoformat()
+                records = self.ledger.records_before(stats["cutoff"])
+                for record in records:
+                    if record_key(record) in folded or (watermark and (record.get("timestamp") or "") <= watermark):
+                        # Folded by an earlier run that stopped before removing it
+                        stats["entries_already_folded"] += 1
+                        continue
+                    entry = self.ledger.read(record)
+                    if entry is None:
+                        continue
+                    entry = self.blob_store.resolve(entry)
+                    key = episode_key(entry)
+                    episode = episodes.setdefault(episode_id(*key), new_episode(*key))
+                    fold_entry(episode, entry)
+                    updated[episode["id"]] = episode
+                    stats["entries_consolidated"] += 1
+                    stats["entries_unknown_outcome"] += 0 if entry_is_evaluated(entry) else 1
+                # Keys of records already removed are dropped, so the list only holds what removal still owes
+                state["folded"] = [record_key(record) for record in records]
+                state.pop("watermark", None)
+
+            expired = []
+            if episodes_ttl is not None:
+                episode_cutoff = (now - episodes_ttl).isoformat()
+                expired = [
+                    expired_id for expired_id, episode in episodes.items()
+                    if (episode["last_timestamp"] or "") < episode_cutoff
+                ]
+                for expired_id in expired:
+                    del episodes[expired_id]
+                    updated.pop(expired_id, None)
+
+            stats["episodes_updated"] = len(updated)
+            stats["episodes_expired"] = len(expired)
+            stats["episodes_total"] = len(episodes)
+            stats["updated"] = sorted(updated.values(), key=lambda episode: (episode["period"], episode["id"]))
+            if dry_run:
+                return stats
+
+            self.episode_store.save(state)
+
+        if vectors and (updated or expired or records):
+            from .vector_memory_store import vector_memory_store
+            if updated:
+                vector_memory_store.store_episodes(list(updated.values()))
+            stats["vectors_removed"] = vector_memory_store.forget_states(records) + vector_memory_store.remove_memories(expired)
+        stats["entries_removed"] = self.ledger.remove(records) if records else 0
+        if stats["entries_removed"]:
+            stats["blobs_removed"] = self.blob_store.sweep(referenced_blobs(self.ledger.iter_entries()))
+        return stats
+
+# Global instance
+memory_consolidator = MemoryConsolidator()
@@ -0,0 +1,177 @@
+"""
+Persistent embedding cache for ORDAE memory
+Embeddings are stored in SQLite keyed by (model, sha256 of the text), so a
+repeated state text costs neither an API round-trip nor tokens. The cache is
+bounded to a maximum number of vectors with least-recently-used eviction, and
+hit/miss counters are kept in the database so any process can report them
+"""
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .config import get_setting
+from .tracing import tracer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    dimension INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, text_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+def get_embedding_cache_path() -> Path:
+    """Location of the embedding cache database"""
+    return Path.cwd() / "orchestrator" / "memory" / "embedding_cache.sqlite"
+
+class EmbeddingCache:
+    """SQLite-backed LRU of float32 embeddings keyed by model and text hash"""
+
+    def __init__(self, db_path: Optional[Path] = None, max_entries: Optional[int] = None):
+        self.db_path = db_path or get_embedding_cache_path()
+        self.max_entries = max_entries or int(get_setting("ORDAE_EMBEDDING_CACHE_MAX_ENTRIES", "20000"))
+        self.hits = 0
+        self.misses = 0
+        self._entries: Optional[int] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                for statement in SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+            self._entries = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def _bump(self, conn: sqlite3.Connection, name: str) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) ON CONFLICT (name) DO UPDATE SET value = value + 1",
+            (name,)
+        )
+
+    def get(self, model: str, text_hash: str) -> Optional[List[float]]:
+        """Cached embedding, refreshing its recency, or None on a miss"""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT vector FROM embeddings WHERE model = ? AND text_hash = ?", (model, text_hash)
+            ).fetchone()
+            with conn:
+                if row is None:
+                    self.misses += 1
+                    self._bump(conn, "misses")
+                else:
+                    self.hits += 1
+                    self._bump(conn, "hits")
+                    conn.execute(
+                        "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                        (time.time(), model, text_hash)
+                    )
+        tracer.count("io")
+        if row is None:
+            return None
+        vector = array("f")
+        vector.frombytes(row[0])
+        return vector.tolist()
+
+    def get_many(self, model: str, text_hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """Cached embeddings for many hashes at once, keyed by hash; absent hashes are misses"""
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(text_hashes))
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                # Stay well under SQLite's bound-parameter limit
+                for start in range(0, len(unique), 500):
+                    chunk = unique[start:start + 500]
+                    placeholders = ", ".join("?" for _ in chunk)
+                    for text_hash, blob in conn.execute(
+                        f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                        (model, *chunk)
+                    ):
+                        vector = array("f")
+                        vector.frombytes(blob)
+                        found[text_hash] = vector.tolist()
+                    conn.execute(
+                        f"UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash IN ({placeholders})",
+                        (time.time(), model, *chunk)
+                    )
+                hits, misses = len(found), len(unique) - len(found)
+                self.hits += hits
+                self.misses += misses
+                conn.executemany(
+                    "INSERT INTO counters (name, value) VALUES (?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+                    [("hits", hits), ("misses", misses)]
+                )
+        tracer.count("io")
+        return found
+
+    def put(self, model: str, text_hash: str, embedding: Sequence[float]) -> None:
+        """Store an embedding, evicting the least recently used ones beyond max_entries"""
+        self.put_many(model, [(text_hash, embedding)])
+
+    def put_many(self, model: str, items: Sequence[Tuple[str, Sequence[float]]]) -> None:
+        """Store (text_hash, embedding) pairs in one transaction, then evict beyond max_entries"""
+        now = time.time()
+        rows = [(model, text_hash, len(embedding), array("f", embedding).tobytes(), now) for text_hash, embedding in items]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, dimension, vector, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._entries += len(rows)
+                if self._entries > self.max_entries:
+                    # Evict a little extra so eviction does not run on every insert
+                    self._entries = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+                    excess = self._entries - self.max_entries
+                    if excess > 0:
+                        excess += self.max_entries // 20
+                        conn.execute(
+                            "DELETE FROM embeddings WHERE rowid IN "
+                            "(SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+                            (excess,)
+                        )
+                        self._entries = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        tracer.count("io")
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters, for this process and across all processes"""
+        with self._lock:
+            conn = self._connection()
+            entries = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+        total_hits, total_misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / (self.hits + self.misses) if self.hits + self.misses else 0,
+            "total_hits": total_hits,
+            "total_misses": total_misses,
+            "total_hit_rate": total_hits / (total_hits + total_misses) if total_hits + total_misses else 0
+        }
+
+# Global instance
+embedding_cache = EmbeddingCache()
@@ -0,0 +1,104 @@
+"""
+Embedding providers for ORDAE memory
+A provider names the vector space it produces (`model`) and its `dimension`;
+every stored vector is tagged with both, and each model gets its own index, so
+memories never mix embedding spaces. Selected with ORDAE_EMBEDDING_PROVIDER:
+
+- hashing: signed feature hashing over word unigrams and bigrams, NumPy on
+  CPU, no network, deterministic across processes
+- openai: OpenAI embeddings (ORDAE_EMBEDDING_MODEL, default ada-002)
+- auto (default): openai when an API key is configured, else hashing
+"""
+import hashlib
+import re
+from typing import TYPE_CHECKING, List, Optional, Sequence
+import numpy as np
+from .config import get_setting
+
+if TYPE_CHECKING:
+    import openai
+
+HASHING_DIMENSION = 512
+
+OPENAI_EMBEDDING_MODEL = "text-embedding-ada-002"
+OPENAI_MODEL_DIMENSIONS = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+def _features(text: str) -> List[str]:
+    tokens = _TOKEN.findall(text.lower())
+    return tokens + [f"{left} {right}" for left, right in zip(tokens, tokens[1:])]
+
+def hashing_embedding(text: str, dimension: int = HASHING_DIMENSION) -> np.ndarray:
+    """Unit-length float32 vector of hashed, signed feature counts (zero only for empty text)"""
+    vector = np.zeros(dimension, dtype=np.float32)
+    for feature in _features(text):
+        digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+        # Low bits pick the bucket, the top bit the sign, so collisions tend to cancel
+        vector[digest % dimension] += 1.0 if digest >> 63 else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+class EmbeddingProvider:
+    """Maps texts to vectors; a text that cannot be embedded maps to None, never to a placeholder"""
+
+    model = ""
+    dimension = 0
+    # Remote providers are worth caching; local ones are cheaper to recompute
+    cacheable = False
+
+    def embed(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        raise NotImplementedError
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """Local feature-hashing embeddings"""
+
+    def __init__(self, dimension: int = HASHING_DIMENSION):
+        self.dimension = dimension
+        self.model = f"hashing-{dimension}"
+
+    def embed(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        embeddings = []
+        for text in texts:
+            vector = hashing_embedding(text, self.dimension)
+            embeddings.append(vector.tolist() if vector.any() else None)
+        return embeddings
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """OpenAI embeddings, one request per call"""
+
+    cacheable = True
+
+    def __init__(self, client: "openai.OpenAI", model: str = OPENAI_EMBEDDING_MODEL):
+        if model not in OPENAI_MODEL_DIMENSIONS:
+            raise ValueError(f"Unknown OpenAI embedding model: {model}")
+        self.client = client
+        self.model = model
+        self.dimension = OPENAI_MODEL_DIMENSIONS[model]
+
+    def embed(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        if not texts:
+            return []
+        try:
+            response = self.client.embeddings.create(model=self.model, input=list(texts))
+            return [item.embedding for item in response.data]
+        except Exception as e:
+            print(f"❌ Error creating embeddings for {len(texts)} texts: {e}")
+            return [None] * len(texts)
+
+def create_embedding_provider(openai_client: Optional["openai.OpenAI"] = None) -> EmbeddingProvider:
+    """Provider chosen by ORDAE_EMBEDDING_PROVIDER (auto, openai or hashing)"""
+    name = get_setting("ORDAE_EMBEDDING_PROVIDER", "auto")
+    if name == "auto":
+        name = "openai" if openai_client else "hashing"
+    if name == "hashing":
+        return HashingEmbeddingProvider(int(get_setting("ORDAE_HASHING_DIMENSION", str(HASHING_DIMENSION))))
+    if name == "openai":
+        if not openai_client:
+            raise ValueError("ORDAE_EMBEDDING_PROVIDER=openai requires OPENAI_API_KEY")
+        return OpenAIEmbeddingProvider(openai_client, get_setting("ORDAE_EMBEDDING_MODEL", OPENAI_EMBEDDING_MODEL))
+    raise ValueError(f"Unknown embedding provider: {name}")
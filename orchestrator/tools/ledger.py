@@ -0,0 +1,455 @@
+"""
+Append-only JSONL ledger for ORDAE memory
+Entries are appended as single lines to rotating segment files, with a side
+index (iteration, timestamp, segment, offset) so readers can seek to recent or
+specific entries without parsing the whole history
+
+Several ORDAE processes may share one ledger directory: every write happens
+under an exclusive lock on ledger.lock, and each process re-syncs its cached
+index from index.jsonl before appending, so no process overwrites another's
+entries or index records
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+from .config import get_setting
+from .locking import InterProcessLock
+from .tracing import tracer
+
+SEGMENT_PREFIX = "segment-"
+INDEX_FILE = "index.jsonl"
+LOCK_FILE = "ledger.lock"
+
+# Version 2 entries are recorded after evaluate. Version 1 entries (no "version" key)
+# were recorded between observe and decide, so their decision and evaluation are the
+# previous iteration's
+ENTRY_VERSION = 2
+
+def entry_is_evaluated(entry: Dict[str, Any]) -> bool:
+    """Whether an entry's decision and evaluation belong to its own iteration"""
+    return entry.get("version", 1) >= ENTRY_VERSION
+
+def entry_fields(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Queryable fields of a ledger entry, shared by every backend's index
+    Version 1 entries index no lane, task, university or success, since theirs
+    belong to a different iteration
+    """
+    evaluated = entry_is_evaluated(entry)
+    decision = (entry.get("decision") or {}) if evaluated else {}
+    evaluation = (entry.get("evaluation") or {}) if evaluated else {}
+    return {
+        "iteration": entry.get("iteration"),
+        "timestamp": entry.get("timestamp"),
+        "run_id": entry.get("run_id"),
+        "lane": decision.get("lane"),
+        "task": decision.get("task"),
+        "target_university": decision.get("target_university"),
+        "success": bool(evaluation.get("success", False))
+    }
+
+def record_key(record: Dict[str, Any]) -> str:
+    """
+    Identity of an index record on either backend (SQLite row id, or JSONL segment
+    and offset); run, iteration and timestamp keep it unique if a row id is reused
+    """
+    location = record["id"] if "id" in record else f"{record['segment']}@{record['offset']}"
+    return f"{location}|{record.get('run_id') or ''}|{record.get('iteration')}|{record.get('timestamp') or ''}"
+
+def summarize_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Overall counts and success rate from index records"""
+    successful = sum(1 for record in records if record.get("success"))
+    return {
+        "entries": len(records),
+        "successful": successful,
+        "success_rate": successful / len(records) if records else 0,
+        "first_timestamp": records[0].get("timestamp") if records else None,
+        "last_timestamp": records[-1].get("timestamp") if records else None
+    }
+
+def get_ledger_dir() -> Path:
+    """Directory holding ledger segments and their index"""
+    return Path.cwd() / "orchestrator" / "memory" / "ledger"
+
+def get_legacy_ledger_path() -> Path:
+    """The original read-all/rewrite-all ledger, imported once on first use"""
+    return Path.cwd() / "orchestrator" / "memory" / "ledger.json"
+
+class JSONLLedger:
+    """Segmented, append-only ledger with a seekable index and segment retention"""
+
+    def __init__(self, directory: Optional[Path] = None, segment_max_bytes: Optional[int] = None,
+                 max_segments: Optional[int] = None, legacy_path: Optional[Path] = None):
+        self.directory = directory or get_ledger_dir()
+        self.segment_max_bytes = segment_max_bytes or int(get_setting("ORDAE_LEDGER_SEGMENT_BYTES", str(4 * 1024 * 1024)))
+        # Retention policy: oldest segments beyond this count are deleted
+        self.max_segments = max_segments or int(get_setting("ORDAE_LEDGER_MAX_SEGMENTS", "32"))
+        # Only the default ledger adopts the legacy ledger.json
+        self.legacy_path = legacy_path or (get_legacy_ledger_path() if directory is None else None)
+        self._index: Optional[List[Dict[str, Any]]] = None
+        # How much of index.jsonl (identified by inode) the cached index reflects
+        self._index_pos = 0
+        self._index_inode: Optional[int] = None
+        self._lock = threading.RLock()
+        self._exclusive = InterProcessLock(self.directory / LOCK_FILE)
+
+    # Segment and index housekeeping
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{number:06d}.jsonl"
+
+    def segments(self) -> List[Path]:
+        """Segment files, oldest first"""
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob(f"{SEGMENT_PREFIX}*.jsonl"))
+
+    @staticmethod
+    def _segment_number(path: Path) -> int:
+        return int(path.stem[len(SEGMENT_PREFIX):])
+
+    @staticmethod
+    def _index_record(entry: Dict[str, Any], segment: str, offset: int, length: int) -> Dict[str, Any]:
+        return {
+            **entry_fields(entry),
+            "segment": segment,
+            "offset": offset,
+            "length": length
+        }
+
+    def _sync_index(self) -> List[Dict[str, Any]]:
+        """Bring the cached index up to date with index.jsonl, reading only what other processes added"""
+        index_path = self.directory / INDEX_FILE
+        try:
+            stat = os.stat(index_path)
+        except FileNotFoundError:
+            self._index, self._index_pos, self._index_inode = [], 0, None
+            return self._index
+
+        if self._index is None or stat.st_ino != self._index_inode or stat.st_size < self._index_pos:
+            # First load, or the index was rewritten (retention, rebuild) by some process
+            self._index, self._index_pos, self._index_inode = [], 0, stat.st_ino
+        if stat.st_size == self._index_pos:
+            return self._index
+
+        with open(index_path, 'rb') as f:
+            f.seek(self._index_pos)
+            data = f.read(stat.st_size - self._index_pos)
+        tracer.count("io")
+        # A concurrent append may still be mid-line; consume complete lines only
+        complete = data[:data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                self._index.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        self._index_pos += len(complete)
+        return self._index
+
+    def _load_index(self) -> List[Dict[str, Any]]:
+        index = self._sync_index()
+        if not index and self.legacy_path is not None and self.legacy_path.exists() and not self.segments():
+            with self._exclusive:
+                self._prepare_write()
+        return self._index
+
+    def _adopt_legacy_ledger(self) -> None:
+        """First use of the default ledger: import ledger.json before streaming (nothing to do once segments exist)"""
+        if self.legacy_path is not None and self.legacy_path.exists() and not self.segments():
+            with self._lock:
+                self._load_index()
+
+    def _prepare_write(self) -> None:
+        """Sync state written by other processes; call with the exclusive lock held"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        index = self._sync_index()
+        if not index and not self.segments():
+            self._import_legacy_ledger()
+        else:
+            self._recover_tail()
+
+    def _scan_segment(self, segment: Path, start: int) -> List[Dict[str, Any]]:
+        """Index complete lines of a segment from a byte offset, dropping a torn final line"""
+        records = []
+        with open(segment, 'r+b') as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partial write from an interrupted append; later appends must not extend it
+                    f.truncate(offset)
+                    break
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    offset += len(line)
+                    continue
+                records.append(self._index_record(entry, segment.name, offset, len(line)))
+                offset += len(line)
+        return records
+
+    def _recover_tail(self) -> None:
+        """Index entries appended to the newest segment after the index was last written"""
+        segments = self.segments()
+        if not segments:
+            return
+        newest = segments[-1]
+        indexed_end = 0
+        for record in reversed(self._index):
+            if record["segment"] == newest.name:
+                indexed_end = record["offset"] + record["length"]
+                break
+        if newest.stat().st_size > indexed_end:
+            missing = self._scan_segment(newest, indexed_end)
+            if missing:
+                self._index.extend(missing)
+                self._append_index_lines(missing)
+
+    def rebuild_index(self) -> None:
+        """Recreate the index from the segment files"""
+        with self._exclusive:
+            records = []
+            for segment in self.segments():
+                records.extend(self._scan_segment(segment, 0))
+            self._write_index(records)
+
+    def _write_index(self, records: List[Dict[str, Any]]) -> None:
+        index_path = self.directory / INDEX_FILE
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, index_path)
+        tracer.count("io")
+        stat = os.stat(index_path)
+        self._index, self._index_pos, self._index_inode = records, stat.st_size, stat.st_ino
+
+    def _append_index_lines(self, records: List[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(record) + "\n" for record in records).encode("utf-8")
+        with open(self.directory / INDEX_FILE, 'ab') as f:
+            f.write(data)
+        tracer.count("io")
+        if self._index_inode is None:
+            self._index_inode = os.stat(self.directory / INDEX_FILE).st_ino
+        self._index_pos += len(data)
+
+    def _import_legacy_ledger(self) -> None:
+        if self.legacy_path is None or not self.legacy_path.exists():
+            return
+        try:
+            with open(self.legacy_path, 'r') as f:
+                legacy_entries = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        for entry in legacy_entries:
+            self._append_unlocked(entry)
+
+    def _drop_segments(self, names: Set[str]) -> int:
+        """Delete segments and their index records; returns the number of entries dropped"""
+        kept = [record for record in self._index if record["segment"] not in names]
+        dropped = len(self._index) - len(kept)
+        self._write_index(kept)
+        for name in names:
+            (self.directory / name).unlink(missing_ok=True)
+        return dropped
+
+    def _apply_retention(self) -> None:
+        segments = self.segments()
+        expired = segments[:-self.max_segments] if len(segments) > self.max_segments else []
+        if expired:
+            self._drop_segments({segment.name for segment in expired})
+
+    # Writing
+
+    def _append_unlocked(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        segments = self.segments()
+        segment = segments[-1] if segments else self._segment_path(1)
+        if segment.exists() and segment.stat().st_size >= self.segment_max_bytes:
+            segment = self._segment_path(self._segment_number(segment) + 1)
+
+        line = (json.dumps(entry, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+        with open(segment, 'ab') as f:
+            offset = f.tell()
+            f.write(line)
+        tracer.count("io")
+
+        record = self._index_record(entry, segment.name, offset, len(line))
+        self._index.append(record)
+        self._append_index_lines([record])
+
+        if not segments or segment != segments[-1]:
+            self._apply_retention()
+        return record
+
+    def append(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Append one entry; cost is independent of the ledger size, safe across processes"""
+        with self._exclusive:
+            self._prepare_write()
+            return self._append_unlocked(entry)
+
+    def append_many(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Append a batch of entries under one lock acquisition"""
+        with self._exclusive:
+            self._prepare_write()
+            return [self._append_unlocked(entry) for entry in entries]
+
+    # Reading
+
+    def location(self, record: Dict[str, Any]) -> Path:
+        """File holding the entry an index record points at"""
+        return self.directory / record["segment"]
+
+    def count(self) -> int:
+        """Number of retained entries"""
+        with self._lock:
+            return len(self._load_index())
+
+    def index(self) -> List[Dict[str, Any]]:
+        """Index records (iteration, timestamp, success, segment, offset), oldest first"""
+        with self._lock:
+            return list(self._load_index())
+
+    def read(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Seek to and parse the entry an index record points at"""
+        segment = self.directory / record["segment"]
+        try:
+            with open(segment, 'rb') as f:
+                f.seek(record["offset"])
+                line = f.read(record["length"])
+        except FileNotFoundError:
+            return None
+        tracer.count("io")
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Most recent `limit` entries, oldest first"""
+        records = self.index()[-limit:] if limit > 0 else []
+        return [entry for entry in (self.read(record) for record in records) if entry is not None]
+
+    def find_iteration(self, iteration: int) -> List[Dict[str, Any]]:
+        """All entries recorded for an iteration number"""
+        return [
+            entry for entry in (self.read(record) for record in self.index() if record["iteration"] == iteration)
+            if entry is not None
+        ]
+
+    def between(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Entries with start <= timestamp < end (ISO strings), oldest first
+        Concurrent writers can append out of timestamp order, so the whole index is scanned
+        """
+        matches = [
+            record for record in self.index()
+            if (not start or (record["timestamp"] or "") >= start)
+            and (not end or (record["timestamp"] or "") < end)
+        ]
+        matches.sort(key=lambda record: record["timestamp"] or "")
+        return [entry for entry in (self.read(record) for record in matches) if entry is not None]
+
+    # Query API (shared with SQLiteLedger)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, successes and success rate"""
+        return summarize_records(self.index())
+
+    def lane_stats(self) -> List[Dict[str, Any]]:
+        """Entries and successes per (lane, task, target_university)"""
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for record in self.index():
+            key = (record.get("lane"), record.get("task"), record.get("target_university"))
+            group = groups.setdefault(key, {
+                "lane": key[0], "task": key[1], "target_university": key[2], "entries": 0, "successes": 0
+            })
+            group["entries"] += 1
+            group["successes"] += 1 if record.get("success") else 0
+        return sorted(groups.values(), key=lambda group: group["entries"], reverse=True)
+
+    def iterations_for(self, lane: Optional[str] = None, university: Optional[str] = None) -> int:
+        """How many iterations were spent on a lane and/or target university"""
+        return sum(
+            1 for record in self.index()
+            if (lane is None or record.get("lane") == lane)
+            and (university is None or record.get("target_university") == university)
+        )
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream index records straight from index.jsonl, oldest first, without caching them"""
+        self._adopt_legacy_ledger()
+        index_path = self.directory / INDEX_FILE
+        try:
+            f = open(index_path, 'r')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Stream every retained entry from the segment files, oldest first, one line at a time; the index is not read"""
+        self._adopt_legacy_ledger()
+        for segment in self.segments():
+            try:
+                f = open(segment, 'r')
+            except FileNotFoundError:
+                continue
+            with f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        # An append still in progress
+                        break
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+    # Consolidation (shared with SQLiteLedger)
+
+    def records_before(self, cutoff: str) -> List[Dict[str, Any]]:
+        """
+        Index records that remove() can drop for a cutoff (ISO timestamp): every record
+        of each sealed segment whose entries are all older than the cutoff
+        """
+        with self._lock:
+            index = self._load_index()
+            segments = self.segments()
+            active = segments[-1].name if segments else None
+            newest: Dict[str, str] = {}
+            for record in index:
+                newest[record["segment"]] = max(newest.get(record["segment"], ""), record["timestamp"] or "")
+            return [
+                record for record in index
+                if record["segment"] != active and newest[record["segment"]] < cutoff
+            ]
+
+    def remove(self, records: List[Dict[str, Any]]) -> int:
+        """Delete the (sealed) segments holding these records; returns the number of entries removed"""
+        names = {record["segment"] for record in records}
+        with self._exclusive:
+            self._prepare_write()
+            segments = self.segments()
+            # New entries go to the active segment, so it is never removed
+            names.discard(segments[-1].name if segments else None)
+            return self._drop_segments(names) if names else 0
+
+def create_ledger():
+    """Ledger for the configured backend (ORDAE_LEDGER_BACKEND=jsonl|sqlite)"""
+    backend = get_setting("ORDAE_LEDGER_BACKEND", "jsonl")
+    if backend == "sqlite":
+        from .ledger_sqlite import SQLiteLedger
+        return SQLiteLedger()
+    if backend != "jsonl":
+        raise ValueError(f"Unknown ledger backend: {backend}")
+    return JSONLLedger()
+
+# Global instance
+ledger = create_ledger()
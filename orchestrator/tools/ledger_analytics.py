@@ -0,0 +1,224 @@
+"""
+Streaming analytics over the ORDAE ledger
+Folds ledger records one at a time into per-lane success rates, decision
+distributions and per-period duration trends; memory depends on the number of
+lanes, periods and concurrently open runs, never on the size of the ledger
+"""
+import csv
+import json
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PERIODS = ("day", "week", "month")
+
+def period_key(moment: datetime, period: str) -> str:
+    """Bucket label for a timestamp: 2025-01-31, 2025-W05 or 2025-01"""
+    if period == "week":
+        year, week, _ = moment.isocalendar()
+        return f"{year}-W{week:02d}"
+    if period == "month":
+        return moment.strftime("%Y-%m")
+    return moment.strftime("%Y-%m-%d")
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """ISO timestamp from a ledger record, or None when missing or malformed"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+class RunningStat:
+    """Count, mean, min and max of a stream of numbers"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+class LedgerReport:
+    """Single-pass aggregator for ledger records (see entry_fields for the record shape)"""
+
+    def __init__(self, period: str = "day", window: int = 7, max_gap: float = 3600.0, max_open_runs: int = 1024):
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period: {period} (expected one of {', '.join(PERIODS)})")
+        self.period = period
+        # Trailing number of periods in the rolling success rate
+        self.window = window
+        # Gaps longer than this (e.g. a run resumed the next day) are not iteration durations
+        self.max_gap = max_gap
+        self.max_open_runs = max_open_runs
+
+        self.entries = 0
+        self.successes = 0
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+        self.durations = RunningStat()
+        self.lanes: Dict[Tuple, Dict[str, Any]] = {}
+        self.decisions: Dict[Tuple, int] = {}
+        self.periods: Dict[str, Dict[str, Any]] = {}
+        # Last (timestamp, iteration) per run, bounded so interleaved runs cannot grow it without limit
+        self._open_runs: "OrderedDict[Any, Tuple[datetime, Any]]" = OrderedDict()
+
+    def _duration(self, record: Dict[str, Any], moment: Optional[datetime]) -> Optional[float]:
+        """Seconds since the previous entry of the same run; legacy entries without a run_id
+        count as one run when their iteration numbers are consecutive"""
+        if moment is None:
+            return None
+        run_key = record.get("run_id")
+        iteration = record.get("iteration")
+        previous = self._open_runs.pop(run_key, None)
+        self._open_runs[run_key] = (moment, iteration)
+        if len(self._open_runs) > self.max_open_runs:
+            self._open_runs.popitem(last=False)
+
+        if previous is None:
+            return None
+        if run_key is None and not (isinstance(iteration, int) and previous[1] == iteration - 1):
+            return None
+        seconds = (moment - previous[0]).total_seconds()
+        return seconds if 0 <= seconds <= self.max_gap else None
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold one ledger record into the aggregates"""
+        success = bool(record.get("success"))
+        timestamp = record.get("timestamp")
+        moment = parse_timestamp(timestamp)
+        duration = self._duration(record, moment)
+
+        self.entries += 1
+        self.successes += 1 if success else 0
+        if timestamp:
+            self.first_timestamp = self.first_timestamp or timestamp
+            self.last_timestamp = timestamp
+        if duration is not None:
+            self.durations.add(duration)
+
+        lane, task, university = record.get("lane"), record.get("task"), record.get("target_university")
+        group = self.lanes.get((lane, task, university))
+        if group is None:
+            group = self.lanes[(lane, task, university)] = {"entries": 0, "successes": 0, "durations": RunningStat()}
+        group["entries"] += 1
+        group["successes"] += 1 if success else 0
+        if duration is not None:
+            group["durations"].add(duration)
+
+        self.decisions[(lane, task)] = self.decisions.get((lane, task), 0) + 1
+
+        if moment is not None:
+            key = period_key(moment, self.period)
+            bucket = self.periods.get(key)
+            if bucket is None:
+                bucket = self.periods[key] = {
+                    "entries": 0, "successes": 0, "durations": RunningStat()
+                }
+            bucket["entries"] += 1
+            bucket["successes"] += 1 if success else 0
+            if duration is not None:
+                bucket["durations"].add(duration)
+
+    def consume(self, records: Iterable[Dict[str, Any]]) -> "LedgerReport":
+        """Fold a stream of records; returns self for chaining"""
+        for record in records:
+            self.add(record)
+        return self
+
+    # Results
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "entries": self.entries,
+            "successful": self.successes,
+            "success_rate": self.successes / self.entries if self.entries else 0,
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+            "timed_iterations": self.durations.count,
+            "mean_duration_s": self.durations.mean
+        }
+
+    def lane_rows(self) -> List[Dict[str, Any]]:
+        rows = [
+            {
+                "lane": lane,
+                "task": task,
+                "target_university": university,
+                "entries": group["entries"],
+                "successes": group["successes"],
+                "success_rate": group["successes"] / group["entries"],
+                "mean_duration_s": group["durations"].mean,
+                "min_duration_s": group["durations"].minimum,
+                "max_duration_s": group["durations"].maximum
+            }
+            for (lane, task, university), group in self.lanes.items()
+        ]
+        return sorted(rows, key=lambda row: row["entries"], reverse=True)
+
+    def decision_rows(self) -> List[Dict[str, Any]]:
+        rows = [
+            {"lane": lane, "task": task, "count": count, "share": count / self.entries if self.entries else 0}
+            for (lane, task), count in self.decisions.items()
+        ]
+        return sorted(rows, key=lambda row: row["count"], reverse=True)
+
+    def trend_rows(self) -> List[Dict[str, Any]]:
+        rows = []
+        trailing: List[Dict[str, Any]] = []
+        for key in sorted(self.periods):
+            bucket = self.periods[key]
+            trailing = (trailing + [bucket])[-self.window:]
+            window_entries = sum(item["entries"] for item in trailing)
+            rows.append({
+                "period": key,
+                "entries": bucket["entries"],
+                "successes": bucket["successes"],
+                "success_rate": bucket["successes"] / bucket["entries"],
+                "rolling_success_rate": sum(item["successes"] for item in trailing) / window_entries,
+                "mean_duration_s": bucket["durations"].mean,
+                "max_duration_s": bucket["durations"].maximum
+            })
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "period": self.period,
+            "window": self.window,
+            "summary": self.summary(),
+            "lanes": self.lane_rows(),
+            "decisions": self.decision_rows(),
+            "trends": self.trend_rows()
+        }
+
+    def write_json(self, path: Path) -> Path:
+        """Write the full report as one JSON document"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def write_csv(self, directory: Path) -> List[Path]:
+        """Write lanes.csv, decisions.csv and trends.csv into a directory"""
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        for name, rows in (("lanes", self.lane_rows()), ("decisions", self.decision_rows()), ("trends", self.trend_rows())):
+            path = directory / f"{name}.csv"
+            with open(path, 'w', newline='') as f:
+                if rows:
+                    writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+                    writer.writeheader()
+                    writer.writerows(rows)
+            written.append(path)
+        return written
@@ -0,0 +1,328 @@
+"""
+SQLite ledger backend for ORDAE memory
+Same interface as JSONLLedger, with indexed columns for iteration, timestamp,
+lane, task, target university and success, plus running per-lane totals so
+progress queries stay in milliseconds on very large ledgers
+
+Concurrent processes rely on WAL mode plus a busy timeout; writes take the
+write lock up front (BEGIN IMMEDIATE) so they queue instead of failing
+"""
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from .ledger import JSONLLedger, entry_fields
+from .tracing import tracer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    iteration INTEGER,
+    timestamp TEXT,
+    run_id TEXT,
+    lane TEXT,
+    task TEXT,
+    target_university TEXT,
+    success INTEGER NOT NULL DEFAULT 0,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_iteration ON entries (iteration);
+CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries (timestamp);
+CREATE INDEX IF NOT EXISTS idx_entries_lane_university ON entries (lane, target_university);
+CREATE INDEX IF NOT EXISTS idx_entries_success ON entries (success);
+CREATE TABLE IF NOT EXISTS lane_totals (
+    lane TEXT NOT NULL DEFAULT '',
+    task TEXT NOT NULL DEFAULT '',
+    target_university TEXT NOT NULL DEFAULT '',
+    entries INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (lane, task, target_university)
+);
+"""
+
+COLUMNS = "id, iteration, timestamp, run_id, lane, task, target_university, success"
+
+# Seconds a writer waits for another process's transaction before giving up
+BUSY_TIMEOUT = 30.0
+
+def get_ledger_db_path() -> Path:
+    """Location of the SQLite ledger"""
+    return Path.cwd() / "orchestrator" / "memory" / "ledger.sqlite"
+
+class SQLiteLedger:
+    """Ledger stored in SQLite; a drop-in replacement for JSONLLedger"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or get_ledger_db_path()
+        # Only the default ledger carries over history from the default JSONL ledger
+        self.import_history = db_path is None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._write_transaction(conn):
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            # First use: carry over history from the JSONL ledger (which imports ledger.json itself);
+            # checked inside the write transaction so concurrent processes import only once
+            if self.import_history and conn.execute("SELECT 1 FROM entries LIMIT 1").fetchone() is None:
+                for entry in JSONLLedger().iter_entries():
+                    self._insert(conn, entry)
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    @contextmanager
+    def _write_transaction(conn: sqlite3.Connection):
+        """Transaction holding the database write lock from its first statement"""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    @staticmethod
+    def _record(row: sqlite3.Row) -> Dict[str, Any]:
+        record = dict(row)
+        record["success"] = bool(record["success"])
+        return record
+
+    def _insert(self, conn: sqlite3.Connection, entry: Dict[str, Any]) -> Dict[str, Any]:
+        fields = entry_fields(entry)
+        body = json.dumps(entry, separators=(",", ":"), default=str)
+        cursor = conn.execute(
+            "INSERT INTO entries (iteration, timestamp, run_id, lane, task, target_university, success, body) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (fields["iteration"], fields["timestamp"], fields["run_id"], fields["lane"], fields["task"],
+             fields["target_university"], int(fields["success"]), body)
+        )
+        conn.execute(
+            "INSERT INTO lane_totals (lane, task, target_university, entries, successes) VALUES (?, ?, ?, 1, ?) "
+            "ON CONFLICT (lane, task, target_university) DO UPDATE SET "
+            "entries = entries + 1, successes = successes + excluded.successes",
+            (fields["lane"] or "", fields["task"] or "", fields["target_university"] or "", int(fields["success"]))
+        )
+        return {"id": cursor.lastrowid, **fields}
+
+    # Writing
+
+    def append(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert one entry and update the running lane totals in one transaction"""
+        with self._lock:
+            conn = self._connection()
+            with self._write_transaction(conn):
+                record = self._insert(conn, entry)
+        tracer.count("io")
+        return record
+
+    def append_many(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert a batch of entries in one transaction"""
+        with self._lock:
+            conn = self._connection()
+            with self._write_transaction(conn):
+                records = [self._insert(conn, entry) for entry in entries]
+        tracer.count("io")
+        return records
+
+    # Reading
+
+    def location(self, record: Dict[str, Any]) -> Path:
+        """File holding the entry an index record points at"""
+        return self.db_path
+
+    def count(self) -> int:
+        """Number of stored entries"""
+        with self._lock:
+            row = self._connection().execute("SELECT COALESCE(SUM(entries), 0) FROM lane_totals").fetchone()
+        return row[0]
+
+    def index(self) -> List[Dict[str, Any]]:
+        """Index records for every entry, oldest first"""
+        with self._lock:
+            rows = self._connection().execute(f"SELECT {COLUMNS} FROM entries ORDER BY id").fetchall()
+        return [self._record(row) for row in rows]
+
+    def read(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Load the entry an index record points at"""
+        with self._lock:
+            row = self._connection().execute("SELECT body FROM entries WHERE id = ?", (record["id"],)).fetchone()
+        return json.loads(row["body"]) if row else None
+
+    def _bodies(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        tracer.count("io")
+        return [json.loads(row["body"]) for row in rows]
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Most recent `limit` entries, oldest first"""
+        if limit <= 0:
+            return []
+        return list(reversed(self._bodies("SELECT body FROM entries ORDER BY id DESC LIMIT ?", (limit,))))
+
+    def find_iteration(self, iteration: int) -> List[Dict[str, Any]]:
+        """All entries recorded for an iteration number"""
+        return self._bodies("SELECT body FROM entries WHERE iteration = ? ORDER BY id", (iteration,))
+
+    def between(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entries with start <= timestamp < end (ISO strings)"""
+        clauses, params = [], []
+        if start:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end:
+            clauses.append("timestamp < ?")
+            params.append(end)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._bodies(f"SELECT body FROM entries {where} ORDER BY timestamp, id", tuple(params))
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Stream every entry, oldest first, in id-ordered pages"""
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._connection().execute(
+                    "SELECT id, body FROM entries WHERE id > ? ORDER BY id LIMIT 1000", (last_id,)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield json.loads(row["body"])
+            last_id = rows[-1]["id"]
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream index records, oldest first, in id-ordered pages"""
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._connection().execute(
+                    f"SELECT {COLUMNS} FROM entries WHERE id > ? ORDER BY id LIMIT 1000", (last_id,)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._record(row)
+            last_id = rows[-1]["id"]
+
+    # Query API
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, successes and success rate from the running totals"""
+        with self._lock:
+            conn = self._connection()
+            entries, successful = conn.execute(
+                "SELECT COALESCE(SUM(entries), 0), COALESCE(SUM(successes), 0) FROM lane_totals"
+            ).fetchone()
+            first = conn.execute("SELECT timestamp FROM entries ORDER BY id LIMIT 1").fetchone()
+            last = conn.execute("SELECT timestamp FROM entries ORDER BY id DESC LIMIT 1").fetchone()
+        return {
+            "entries": entries,
+            "successful": successful,
+            "success_rate": successful / entries if entries else 0,
+            "first_timestamp": first[0] if first else None,
+            "last_timestamp": last[0] if last else None
+        }
+
+    def lane_stats(self) -> List[Dict[str, Any]]:
+        """Entries and successes per (lane, task, target_university)"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT lane, task, target_university, entries, successes FROM lane_totals ORDER BY entries DESC"
+            ).fetchall()
+        return [
+            {key: (row[key] or None) if key in ("lane", "task", "target_university") else row[key] for key in row.keys()}
+            for row in rows
+        ]
+
+    def iterations_for(self, lane: Optional[str] = None, university: Optional[str] = None) -> int:
+        """How many iterations were spent on a lane and/or target university"""
+        clauses, params = [], []
+        if lane is not None:
+            clauses.append("lane = ?")
+            params.append(lane)
+        if university is not None:
+            clauses.append("target_university = ?")
+            params.append(university)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            row = self._connection().execute(f"SELECT COALESCE(SUM(entries), 0) FROM lane_totals {where}", params).fetchone()
+        return row[0]
+
+    def rebuild_index(self) -> None:
+        """Recompute the indexed columns and lane totals from the stored entries"""
+        with self._lock:
+            conn = self._connection()
+            with self._write_transaction(conn):
+                last_id = 0
+                while True:
+                    rows = conn.execute(
+                        "SELECT id, body FROM entries WHERE id > ? ORDER BY id LIMIT 1000", (last_id,)
+                    ).fetchall()
+                    if not rows:
+                        break
+                    updates = []
+                    for row in rows:
+                        fields = entry_fields(json.loads(row["body"]))
+                        updates.append((fields["iteration"], fields["timestamp"], fields["run_id"], fields["lane"],
+                                        fields["task"], fields["target_university"], int(fields["success"]), row["id"]))
+                    conn.executemany(
+                        "UPDATE entries SET iteration = ?, timestamp = ?, run_id = ?, lane = ?, task = ?, "
+                        "target_university = ?, success = ? WHERE id = ?", updates
+                    )
+                    last_id = rows[-1]["id"]
+                conn.execute("DELETE FROM lane_totals")
+                conn.execute(
+                    "INSERT INTO lane_totals (lane, task, target_university, entries, successes) "
+                    "SELECT COALESCE(lane, ''), COALESCE(task, ''), COALESCE(target_university, ''), COUNT(*), SUM(success) "
+                    "FROM entries GROUP BY 1, 2, 3"
+                )
+        tracer.count("io")
+
+    # Consolidation
+
+    def records_before(self, cutoff: str) -> List[Dict[str, Any]]:
+        """Index records of entries older than a cutoff (ISO timestamp), oldest first"""
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT {COLUMNS} FROM entries WHERE timestamp < ? ORDER BY id", (cutoff,)
+            ).fetchall()
+        return [self._record(row) for row in rows]
+
+    def remove(self, records: List[Dict[str, Any]]) -> int:
+        """Delete entries and take them out of the running lane totals; returns the number removed"""
+        ids = [record["id"] for record in records]
+        removed = 0
+        with self._lock:
+            conn = self._connection()
+            with self._write_transaction(conn):
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    # Totals are adjusted from the rows actually deleted, in case another process got there first
+                    groups = conn.execute(
+                        "SELECT COALESCE(lane, ''), COALESCE(task, ''), COALESCE(target_university, ''), "
+                        f"COUNT(*), SUM(success) FROM entries WHERE id IN ({placeholders}) GROUP BY 1, 2, 3",
+                        chunk
+                    ).fetchall()
+                    conn.executemany(
+                        "UPDATE lane_totals SET entries = entries - ?, successes = successes - ? "
+                        "WHERE lane = ? AND task = ? AND target_university = ?",
+                        [(entries, successes, lane, task, university) for lane, task, university, entries, successes in groups]
+                    )
+                    removed += conn.execute(f"DELETE FROM entries WHERE id IN ({placeholders})", chunk).rowcount
+                conn.execute("DELETE FROM lane_totals WHERE entries <= 0")
+        tracer.count("io")
+        return removed
@@ -0,0 +1,463 @@
+"""
+Local vector index for ORDAE memory
+Unit-normalized embeddings are stored quantized (ORDAE_VECTOR_DTYPE: int8 with
+a float32 scale per row by default, or float16) in a flat file that is
+memory-mapped rather than loaded, next to a JSONL metadata table of which only
+line offsets (and posting lists of the filterable fields) are kept in memory.
+Search is batched cosine top-k in NumPy over blocks of the mapped matrix;
+filtered queries only score the matching rows. Once the index holds
+ivf_threshold vectors, unfiltered queries go through an IVF coarse quantizer
+(spherical k-means) and only score the nprobe closest clusters
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .config import get_setting
+from .locking import InterProcessLock
+from .tracing import tracer
+
+HEADER_FILE = "header.json"
+SCALES_FILE = "scales.f32"
+METADATA_FILE = "metadata.jsonl"
+IVF_FILE = "ivf.npz"
+LOCK_FILE = "index.lock"
+
+# Storage dtype -> vector file; indexes written before quantization are float32
+VECTOR_FILES = {"int8": "vectors.i8", "float16": "vectors.f16", "float32": "vectors.f32"}
+# Metadata fields with posting lists; filtered searches only score matching rows
+FILTER_FIELDS = ("lane", "task", "target_university", "success", "iteration", "kind")
+# Rows dequantized per block while scanning, bounds the float32 working set
+SCAN_BLOCK_ROWS = 65536
+def get_vector_dir() -> Path:
+    """Directory holding one local vector index per embedding model"""
+    return Path.cwd() / "orchestrator" / "memory" / "vectors"
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length; all-zero rows are rejected since they match nothing"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    if np.any(norms == 0):
+        raise ValueError("Cannot index a zero vector")
+    return (matrix / norms).astype(np.float32, copy=False)
+
+def matches_filters(metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Whether metadata equals each filter value (or is one of a list of values)"""
+    for field, value in filters.items():
+        allowed = value if isinstance(value, (list, tuple, set)) else [value]
+        if field not in metadata or metadata[field] not in allowed:
+            return False
+    return True
+
+def quantize_rows(matrix: np.ndarray, dtype: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode unit rows as `dtype` plus the float32 per-row scale that decodes them"""
+    if dtype == "int8":
+        # Symmetric per-row scaling: the largest component maps to +-127
+        scales = (np.abs(matrix).max(axis=1) / 127.0).astype(np.float32)
+        return np.round(matrix / scales[:, None]).astype(np.int8), scales
+    if dtype not in VECTOR_FILES:
+        raise ValueError(f"Unknown vector dtype: {dtype}")
+    return matrix.astype(dtype), np.ones(len(matrix), dtype=np.float32)
+
+class LocalVectorIndex:
+    """Append-only, disk-persisted cosine index; later rows with the same id replace earlier ones"""
+
+    def __init__(self, directory: Path, model: Optional[str] = None, ivf_threshold: Optional[int] = None,
+                 nprobe: Optional[int] = None, dtype: Optional[str] = None):
+        self.directory = directory
+        # Embedding model the vectors come from; recorded in the header and checked on open
+        self.model = model
+        self.ivf_threshold = ivf_threshold or int(get_setting("ORDAE_VECTOR_IVF_THRESHOLD", "10000"))
+        self.nprobe = nprobe or int(get_setting("ORDAE_VECTOR_NPROBE", "8"))
+        # Storage dtype for new indexes; an existing index keeps the one in its header
+        self.dtype = dtype or get_setting("ORDAE_VECTOR_DTYPE", "int8")
+        if self.dtype not in VECTOR_FILES:
+            raise ValueError(f"Unknown vector dtype: {self.dtype}")
+        self.dimension: Optional[int] = None
+        self._lock = threading.RLock()
+        self._exclusive = InterProcessLock(self.directory / LOCK_FILE)
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget all loaded rows, e.g. after the files were rewritten by remove()"""
+        # Read-only maps over rows [0, _count) of the vector and scale files
+        self._vectors: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._count = 0
+        self._live = np.zeros(0, dtype=bool)
+        self._ids: List[str] = []
+        # Byte offset of each row's metadata line; metadata is read back only for results
+        self._metadata_offsets = np.zeros(0, dtype=np.int64)
+        self._rows_by_id: Dict[str, int] = {}
+        # field -> value -> rows holding it, for FILTER_FIELDS
+        self._postings: Dict[str, Dict[Any, List[int]]] = {field: {} for field in FILTER_FIELDS}
+        self._metadata_pos = 0
+        self._metadata_inode: Optional[int] = None
+        # IVF state: centroids, per-row cluster assignment, rows sorted by cluster and cluster offsets
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._ivf_built_rows = 0
+        self._ivf_order: Optional[np.ndarray] = None
+        self._ivf_offsets: Optional[np.ndarray] = None
+
+    # Loading
+
+    def _load_header(self) -> Optional[int]:
+        if self.dimension is None:
+            try:
+                with open(self.directory / HEADER_FILE, 'r') as f:
+                    header = json.load(f)
+                dimension = header["dimension"]
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                return None
+            if self.model and header.get("model") and header["model"] != self.model:
+                raise ValueError(f"Index at {self.directory} holds {header['model']} vectors, not {self.model}")
+            self.dtype = header.get("dtype", "float32")
+            self.dimension = dimension
+        return self.dimension
+
+    @property
+    def vectors_path(self) -> Path:
+        return self.directory / VECTOR_FILES[self.dtype]
+
+    def _row_bytes(self) -> int:
+        return self.dimension * np.dtype(self.dtype).itemsize
+
+    def _stored_rows(self) -> int:
+        """Rows fully present in both the vector and the scale file"""
+        try:
+            vector_rows = self.vectors_path.stat().st_size // self._row_bytes()
+        except FileNotFoundError:
+            return 0
+        if self.dtype == "float32":
+            # Indexes from before quantization have no scales file
+            return vector_rows
+        try:
+            return min(vector_rows, (self.directory / SCALES_FILE).stat().st_size // 4)
+        except FileNotFoundError:
+            return 0
+
+    def _map(self, rows: int) -> None:
+        """Map the first `rows` rows; the OS pages them in on demand"""
+        self._vectors = np.memmap(self.vectors_path, dtype=self.dtype, mode='r', shape=(rows, self.dimension))
+        if self.dtype == "float32" and not (self.directory / SCALES_FILE).exists():
+            self._scales = np.ones(rows, dtype=np.float32)
+        else:
+            self._scales = np.memmap(self.directory / SCALES_FILE, dtype=np.float32, mode='r', shape=(rows,))
+
+    def _decode(self, rows: Any) -> np.ndarray:
+        """float32 vectors for a row slice or index array"""
+        return self._vectors[rows].astype(np.float32) * self._scales[rows][:, None]
+
+    def _reserve(self, rows: int) -> None:
+        if rows <= len(self._live):
+            return
+        capacity = max(rows, 2 * len(self._live), 64)
+        live = np.zeros(capacity, dtype=bool)
+        live[:self._count] = self._live[:self._count]
+        offsets = np.zeros(capacity, dtype=np.int64)
+        offsets[:self._count] = self._metadata_offsets[:self._count]
+        self._live, self._metadata_offsets = live, offsets
+
+    def _sync(self) -> None:
+        """Map rows other processes (or this one) appended since the last sync"""
+        if self._load_header() is None:
+            return
+        try:
+            stat = os.stat(self.directory / METADATA_FILE)
+        except FileNotFoundError:
+            return
+        if stat.st_ino != self._metadata_inode or stat.st_size < self._metadata_pos:
+            # First load, or remove() rewrote the index
+            if self._metadata_inode is not None:
+                self._reset()
+            self._metadata_inode = stat.st_ino
+        try:
+            with open(self.directory / METADATA_FILE, 'rb') as f:
+                f.seek(self._metadata_pos)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # Rows become visible once their metadata line is complete
+        complete = data[:data.rfind(b"\n") + 1]
+        if not complete:
+            return
+        lines = complete.splitlines()
+        tracer.count("io")
+
+        start = self._count
+        count = min(start + len(lines), self._stored_rows())
+        if count == start:
+            return
+        self._reserve(count)
+        position = self._metadata_pos
+        for row, line in enumerate(lines[:count - start], start):
+            record = json.loads(line)
+            previous = self._rows_by_id.get(record["id"])
+            if previous is not None:
+                self._live[previous] = False
+            self._rows_by_id[record["id"]] = row
+            self._live[row] = True
+            self._ids.append(record["id"])
+            metadata = record.get("metadata", {})
+            for field, postings in self._postings.items():
+                if field in metadata:
+                    postings.setdefault(metadata[field], []).append(row)
+            self._metadata_offsets[row] = position
+            position += len(line) + 1
+        self._count = count
+        self._metadata_pos = position
+        self._map(count)
+
+        if self._centroids is not None:
+            self._assign_new_rows()
+
+    def _read_metadata(self, rows: Sequence[int]) -> List[Dict[str, Any]]:
+        """Metadata of the given rows, read from the metadata table"""
+        metadatas = []
+        with open(self.directory / METADATA_FILE, 'rb') as f:
+            for row in rows:
+                f.seek(int(self._metadata_offsets[row]))
+                metadatas.append(json.loads(f.readline()).get("metadata", {}))
+        tracer.count("io")
+        return metadatas
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._sync()
+            return len(self._rows_by_id)
+
+    # Writing
+
+    def add(self, ids: Sequence[str], vectors: Any, metadatas: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        """Append a batch of vectors with their ids and metadata; returns the number added"""
+        if not ids:
+            return 0
+        matrix = normalize_rows(np.asarray(vectors, dtype=np.float32).reshape(len(ids), -1))
+        metadatas = metadatas or [{} for _ in ids]
+
+        with self._lock, self._exclusive:
+            dimension = self._load_header()
+            if dimension is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.directory / f"{HEADER_FILE}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump({"dimension": matrix.shape[1], "model": self.model, "dtype": self.dtype}, f)
+                os.replace(tmp_path, self.directory / HEADER_FILE)
+                self.dimension = dimension = matrix.shape[1]
+            if matrix.shape[1] != dimension:
+                raise ValueError(f"Vector dimension {matrix.shape[1]} does not match index dimension {dimension}")
+
+            self._sync()
+            data, scales = quantize_rows(matrix, self.dtype)
+            scales_path = self.directory / SCALES_FILE
+            # Drop vector rows left without metadata by an interrupted add
+            for path, row_bytes in ((self.vectors_path, self._row_bytes()), (scales_path, 4)):
+                if path.exists() and path.stat().st_size > self._count * row_bytes:
+                    os.truncate(path, self._count * row_bytes)
+            if self.dtype == "float32" and self._count and not scales_path.exists():
+                # Pre-quantization index: start its scales file with unit scales
+                with open(scales_path, 'wb') as f:
+                    f.write(np.ones(self._count, dtype=np.float32).tobytes())
+
+            lines = "".join(
+                json.dumps({"id": memory_id, "metadata": metadata}, default=str) + "\n"
+                for memory_id, metadata in zip(ids, metadatas)
+            )
+            with open(self.vectors_path, 'ab') as f:
+                f.write(data.tobytes())
+            with open(scales_path, 'ab') as f:
+                f.write(scales.tobytes())
+            with open(self.directory / METADATA_FILE, 'ab') as f:
+                f.write(lines.encode("utf-8"))
+            tracer.count("io", 3)
+            self._sync()
+        return len(ids)
+
+    def remove(self, ids: Sequence[str]) -> int:
+        """
+        Drop memories by id; the files are rewritten without them (and without
+        superseded rows), so disk use shrinks. Returns the number removed
+        """
+        with self._lock, self._exclusive:
+            self._sync()
+            doomed = [self._rows_by_id[memory_id] for memory_id in set(ids) if memory_id in self._rows_by_id]
+            if not doomed:
+                return 0
+            keep = self._live[:self._count].copy()
+            keep[doomed] = False
+            self._rewrite(np.flatnonzero(keep))
+            return len(doomed)
+
+    def _rewrite(self, rows: np.ndarray) -> None:
+        """Replace the index files with just the given rows; the metadata table is replaced last"""
+        paths = [self.vectors_path, self.directory / SCALES_FILE, self.directory / METADATA_FILE]
+        vectors_tmp, scales_tmp, metadata_tmp = tmp_paths = [path.with_name(f"{path.name}.{os.getpid()}.tmp") for path in paths]
+        with open(vectors_tmp, 'wb') as vectors, open(scales_tmp, 'wb') as scales:
+            for start in range(0, len(rows), SCAN_BLOCK_ROWS):
+                block = rows[start:start + SCAN_BLOCK_ROWS]
+                vectors.write(np.ascontiguousarray(self._vectors[block]).tobytes())
+                scales.write(np.asarray(self._scales[block], dtype=np.float32).tobytes())
+        with open(self.directory / METADATA_FILE, 'rb') as source, open(metadata_tmp, 'wb') as metadata:
+            for row in rows:
+                source.seek(int(self._metadata_offsets[row]))
+                metadata.write(source.readline())
+        # Clusters refer to old row numbers; they are rebuilt on demand
+        (self.directory / IVF_FILE).unlink(missing_ok=True)
+        for path, tmp_path in zip(paths, tmp_paths):
+            os.replace(tmp_path, path)
+        tracer.count("io", 3)
+        self._reset()
+        self._sync()
+
+    # IVF
+
+    def _kmeans(self, sample: np.ndarray, clusters: int, iterations: int = 10) -> np.ndarray:
+        rng = np.random.default_rng(0)
+        centroids = sample[rng.choice(len(sample), clusters, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            # Re-seed empty clusters from random sample rows
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            norms[empty] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+        return centroids
+
+    def _assign(self, start: int, stop: int) -> np.ndarray:
+        assignments = np.empty(stop - start, dtype=np.int32)
+        for block in range(start, stop, 8192):
+            end = min(block + 8192, stop)
+            assignments[block - start:end - start] = np.argmax(self._decode(slice(block, end)) @ self._centroids.T, axis=1)
+        return assignments
+
+    def _assign_new_rows(self) -> None:
+        known = len(self._assignments)
+        if known < self._count:
+            self._assignments = np.concatenate([self._assignments, self._assign(known, self._count)])
+            self._ivf_order = None
+
+    def _load_ivf(self) -> bool:
+        try:
+            with np.load(self.directory / IVF_FILE) as data:
+                centroids, assignments = data["centroids"], data["assignments"]
+        except (FileNotFoundError, OSError, KeyError, ValueError):
+            return False
+        if centroids.shape[1] != self.dimension or len(assignments) > self._count:
+            return False
+        self._centroids, self._assignments = centroids, assignments.astype(np.int32)
+        self._ivf_built_rows = len(assignments)
+        self._ivf_order = None
+        self._assign_new_rows()
+        return True
+
+    def _build_ivf(self) -> None:
+        clusters = int(min(4096, self._count, max(16, np.sqrt(self._count))))
+        rng = np.random.default_rng(0)
+        sample = self._decode(np.sort(rng.choice(self._count, min(self._count, 50 * clusters), replace=False)))
+        self._centroids = self._kmeans(sample, clusters)
+        self._assignments = self._assign(0, self._count)
+        self._ivf_built_rows = self._count
+        self._ivf_order = None
+
+        tmp_path = self.directory / f"ivf.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, centroids=self._centroids, assignments=self._assignments)
+        os.replace(tmp_path, self.directory / IVF_FILE)
+        tracer.count("io")
+
+    def _ensure_ivf(self) -> None:
+        """(Re)build the coarse quantizer when missing or after the index doubled in size"""
+        if self._centroids is None:
+            self._load_ivf()
+        if self._centroids is None or self._count > 2 * self._ivf_built_rows:
+            self._build_ivf()
+        if self._ivf_order is None:
+            self._ivf_order = np.argsort(self._assignments, kind="stable")
+            self._ivf_offsets = np.searchsorted(
+                self._assignments[self._ivf_order], np.arange(len(self._centroids) + 1)
+            )
+
+    def _candidates(self, query: np.ndarray) -> np.ndarray:
+        closest = np.argsort(self._centroids @ query)[::-1][:self.nprobe]
+        return np.concatenate([
+            self._ivf_order[self._ivf_offsets[cluster]:self._ivf_offsets[cluster + 1]] for cluster in closest
+        ])
+
+    # Searching
+
+    def _filtered_rows(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Live rows matching every filter, from the posting lists"""
+        rows: Optional[np.ndarray] = None
+        for field, value in filters.items():
+            if field not in self._postings:
+                raise ValueError(f"Cannot filter on {field}; filterable fields: {', '.join(FILTER_FIELDS)}")
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            matching = np.unique(np.fromiter(
+                (row for item in values for row in self._postings[field].get(item, ())), dtype=np.int64
+            ))
+            rows = matching if rows is None else np.intersect1d(rows, matching, assume_unique=True)
+        if rows is None:
+            rows = np.arange(self._count)
+        return rows[self._live[rows]]
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        if len(scores) > k:
+            top = np.argpartition(scores, -k)[-k:]
+        else:
+            top = np.arange(len(scores))
+        return top[np.argsort(scores[top])[::-1]]
+
+    def search(self, queries: Any, k: int = 5,
+               filters: Optional[Dict[str, Any]] = None) -> List[List[Tuple[str, float, Dict[str, Any]]]]:
+        """
+        Cosine top-k for one query vector or a batch; returns (id, score, metadata) per query
+        With filters ({field: value or list of values}), only rows matching all of them are scored
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        with self._lock:
+            self._sync()
+            if self._count == 0 or k <= 0:
+                return [[] for _ in queries]
+            if queries.shape[1] != self.dimension:
+                raise ValueError(f"Query dimension {queries.shape[1]} does not match index dimension {self.dimension}")
+            queries = normalize_rows(queries)
+            live = self._live[:self._count]
+
+            if filters:
+                # Pre-filter: score just the matching slice, exactly
+                rows = self._filtered_rows(filters)
+                scores = np.empty((len(rows), len(queries)), dtype=np.float32)
+                for start in range(0, len(rows), SCAN_BLOCK_ROWS):
+                    block = rows[start:start + SCAN_BLOCK_ROWS]
+                    scores[start:start + len(block)] = self._decode(block) @ queries.T
+                candidate_sets = [(rows, scores[:, column]) for column in range(len(queries))]
+            elif self._count < self.ivf_threshold:
+                # Exact: blockwise matrix products score every row for the whole batch
+                scores = np.empty((self._count, len(queries)), dtype=np.float32)
+                for start in range(0, self._count, SCAN_BLOCK_ROWS):
+                    block = slice(start, min(start + SCAN_BLOCK_ROWS, self._count))
+                    scores[block] = (self._vectors[block].astype(np.float32) @ queries.T) * self._scales[block][:, None]
+                scores[~live] = -np.inf
+                candidate_sets = [(np.arange(self._count), scores[:, column]) for column in range(len(queries))]
+            else:
+                self._ensure_ivf()
+                candidate_sets = []
+                for query in queries:
+                    rows = self._candidates(query)
+                    rows = rows[live[rows]]
+                    rows = np.sort(rows)
+                    candidate_sets.append((rows, self._decode(rows) @ query))
+
+            results = []
+            for rows, scores in candidate_sets:
+                top = [i for i in self._top_k(scores, k) if np.isfinite(scores[i])]
+                metadatas = self._read_metadata([rows[i] for i in top])
+                results.append([
+                    (self._ids[rows[i]], float(scores[i]), metadata) for i, metadata in zip(top, metadatas)
+                ])
+            return results
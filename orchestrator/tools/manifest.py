@@ -0,0 +1,126 @@
+"""
+File-state manifest for incremental observation
+Persists directory listings and parsed JSON inputs keyed by mtime, size and
+content hash so observe only re-lists changed directories and reparses
+changed files, across runs and within long-running processes
+"""
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from .tracing import tracer
+
+MANIFEST_VERSION = 1
+
+# A cached entry is only trusted when it was recorded this long after the last
+# modification; otherwise a change in the same timestamp tick could be missed
+RACY_WINDOW_NS = 1_000_000_000
+
+def get_manifest_path() -> Path:
+    """Location of the persisted observe manifest"""
+    return Path.cwd() / "orchestrator" / "memory" / "observe_manifest.json"
+
+class FileManifest:
+    """mtime/size/hash manifest with cached directory listings and parsed JSON"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_manifest_path()
+        self._dirs: Dict[str, Dict[str, Any]] = {}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            tracer.count("io")
+        except (json.JSONDecodeError, OSError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self._dirs = data.get("dirs", {})
+            self._files = data.get("files", {})
+
+    @staticmethod
+    def _trusted(entry: Dict[str, Any], mtime_ns: int) -> bool:
+        return entry.get("mtime_ns") == mtime_ns and entry.get("recorded_ns", 0) - mtime_ns > RACY_WINDOW_NS
+
+    def list_dir(self, directory: Path) -> List[str]:
+        """Entry names of a directory, re-listed only when the directory mtime changed"""
+        with self._lock:
+            self._load()
+            key = str(directory)
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except FileNotFoundError:
+                if self._dirs.pop(key, None) is not None:
+                    self._dirty = True
+                return []
+
+            entry = self._dirs.get(key)
+            if entry and self._trusted(entry, mtime_ns):
+                return list(entry["entries"])
+
+            names = sorted(os.listdir(directory))
+            tracer.count("io")
+            self._dirs[key] = {"mtime_ns": mtime_ns, "recorded_ns": time.time_ns(), "entries": names}
+            self._dirty = True
+            return list(names)
+
+    def load_json(self, path: Path) -> Any:
+        """
+        Parsed JSON for a file, reparsed only when its content changed
+        Callers get their own copy, so mutating it never alters the cache
+        """
+        with self._lock:
+            self._load()
+            key = str(path)
+            stat = os.stat(path)
+            entry = self._files.get(key)
+            if entry and entry.get("size") == stat.st_size and self._trusted(entry, stat.st_mtime_ns):
+                return copy.deepcopy(entry["data"])
+
+            raw = path.read_bytes()
+            tracer.count("io")
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry and entry.get("sha256") == digest:
+                # Touched but unchanged: keep the parsed data, refresh the stat
+                data = entry["data"]
+            else:
+                data = json.loads(raw)
+
+            self._files[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "recorded_ns": time.time_ns(),
+                "data": data
+            }
+            self._dirty = True
+            return copy.deepcopy(data)
+
+    def save(self) -> None:
+        """Persist the manifest atomically when anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump({"version": MANIFEST_VERSION, "dirs": self._dirs, "files": self._files}, f)
+            os.replace(tmp_path, self.path)
+            tracer.count("io")
+            self._dirty = False
+
+# Global instance
+observe_manifest = FileManifest()
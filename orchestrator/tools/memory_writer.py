@@ -0,0 +1,195 @@
+"""
+Write-behind memory writer for the ORDAE loop
+Producers enqueue items and return immediately; a background thread drains the
+bounded queue in batches into a sink (ledger append, vector storage). Pending
+items are flushed on interpreter exit and on SIGTERM/SIGHUP, so nothing queued
+is lost on a normal shutdown; only a hard kill can drop the queue. A batch the
+sink keeps failing on is retried with backoff, then spilled to a JSONL file
+that is replayed (before anything newer) the next time the writer starts
+"""
+import atexit
+import json
+import os
+import queue
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+from .config import get_setting
+from .tracing import tracer
+
+_STOP = object()
+
+def get_spill_path(name: str) -> Path:
+    """File holding batches a writer could not write"""
+    return Path.cwd() / "orchestrator" / "memory" / f"{name}.spill.jsonl"
+
+class MemoryWriter:
+    """Bounded queue + batching background thread in front of a batch sink"""
+
+    def __init__(self, sink: Callable[[List[Any]], None], name: str = "memory-writer",
+                 max_queue: Optional[int] = None, batch_size: Optional[int] = None,
+                 linger: Optional[float] = None, retries: Optional[int] = None,
+                 backoff: Optional[float] = None, spill_path: Optional[Path] = None):
+        self.sink = sink
+        self.name = name
+        # A full queue blocks producers (backpressure) instead of growing without bound
+        self.max_queue = max_queue or int(get_setting("ORDAE_MEMORY_QUEUE_SIZE", "1000"))
+        self.batch_size = batch_size or int(get_setting("ORDAE_MEMORY_BATCH_SIZE", "64"))
+        # How long the writer waits for more items before writing a partial batch
+        self.linger = linger if linger is not None else float(get_setting("ORDAE_MEMORY_LINGER", "0.05"))
+        self.enabled = get_setting("ORDAE_MEMORY_WRITE_BEHIND", "true").lower() not in ("0", "false", "no")
+        # Failed batches are retried this many times, waiting backoff, 2 x backoff, ... seconds
+        self.retries = retries if retries is not None else int(get_setting("ORDAE_MEMORY_WRITE_RETRIES", "3"))
+        self.backoff = backoff if backoff is not None else float(get_setting("ORDAE_MEMORY_WRITE_BACKOFF", "0.5"))
+        self.spill_path = spill_path or get_spill_path(name)
+        self.written = 0
+        self.failed = 0
+        self.spilled = 0
+        self._replayed = False
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # atexit and signal hooks are installed on first start only; restarts after close() reuse them
+        self._hooks_installed = False
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+            if not self._hooks_installed:
+                atexit.register(self.close)
+                self._install_signal_handlers()
+                self._hooks_installed = True
+
+    def _install_signal_handlers(self) -> None:
+        """Flush before the default action of termination signals"""
+        for signum in (getattr(signal, "SIGTERM", None), getattr(signal, "SIGHUP", None)):
+            if signum is None:
+                continue
+            try:
+                previous = signal.getsignal(signum)
+
+                def handler(received, frame, previous=previous):
+                    self.close()
+                    if callable(previous):
+                        previous(received, frame)
+                    else:
+                        signal.signal(received, signal.SIG_DFL)
+                        os.kill(os.getpid(), received)
+
+                signal.signal(signum, handler)
+            except ValueError:
+                # Not the main thread: rely on atexit
+                return
+
+    def submit(self, item: Any) -> None:
+        """Queue an item for writing; writes inline when write-behind is disabled"""
+        if not self.enabled:
+            with self._lock:
+                self._replay_spilled()
+                self._write([item])
+            return
+        self._ensure_started()
+        self._queue.put(item)
+
+    def pending(self) -> int:
+        """Items queued or being written"""
+        return self._queue.unfinished_tasks
+
+    def _write(self, batch: List[Any]) -> None:
+        """Write a batch, retrying with backoff; a batch that still fails is spilled"""
+        for attempt in range(self.retries + 1):
+            try:
+                with tracer.span("memory_write", items=len(batch)):
+                    self.sink(batch)
+                self.written += len(batch)
+                return
+            except Exception as e:
+                print(f"❌ Memory writer failed to write {len(batch)} items (attempt {attempt + 1}): {e}")
+                if attempt < self.retries:
+                    time.sleep(self.backoff * 2 ** attempt)
+        self.failed += len(batch)
+        self._spill(batch)
+
+    def _spill(self, batch: List[Any]) -> None:
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spill_path, 'a') as f:
+                for item in batch:
+                    f.write(json.dumps(item, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            tracer.count("io")
+            self.spilled += len(batch)
+            print(f"💾 Spilled {len(batch)} items to {self.spill_path}; they are written on the next start")
+        except (OSError, TypeError, ValueError) as e:
+            print(f"❌ Could not spill {len(batch)} memory items, they are lost: {e}")
+
+    def _replay_spilled(self) -> None:
+        """Write batches spilled by an earlier run, once per writer"""
+        if self._replayed:
+            return
+        self._replayed = True
+        # Claim the file first, so two processes never replay the same batches
+        claimed = self.spill_path.with_suffix(f".{os.getpid()}.replay")
+        try:
+            os.replace(self.spill_path, claimed)
+        except FileNotFoundError:
+            return
+        items = []
+        with open(claimed, 'r') as f:
+            for line in f:
+                try:
+                    items.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn last line of a spill interrupted by a hard kill
+                    continue
+        tracer.count("io")
+        print(f"♻️  Replaying {len(items)} spilled memory items")
+        for start in range(0, len(items), self.batch_size):
+            # A batch that fails again is spilled again
+            self._write(items[start:start + self.batch_size])
+        claimed.unlink()
+
+    def _run(self) -> None:
+        self._replay_spilled()
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.linger
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Block until everything queued so far has been written"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending items and stop the background thread"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
@@ -0,0 +1,163 @@
+"""
+Precompiled RAG knowledge-base bundle
+`python -m orchestrator.rag compile` validates every YAML file under rag/ and
+writes them, parsed, into one pickle next to a manifest of each source's size,
+mtime and sha256. The RAG cache serves a file from the bundle while the source
+still matches its manifest record (by size and mtime, else by content hash) and
+parses the YAML otherwise, so a stale bundle is never worse than no bundle.
+The bundle is a local build artifact and is only loaded from orchestrator/memory
+"""
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import yaml
+from .config import get_setting
+from .tracing import tracer
+
+BUNDLE_VERSION = 1
+BUNDLE_FILE = "bundle.pickle"
+MANIFEST_FILE = "manifest.json"
+
+def get_rag_dir() -> Path:
+    return Path.cwd() / "rag"
+
+def get_bundle_dir() -> Path:
+    """Directory holding the compiled bundle and its manifest"""
+    return Path.cwd() / "orchestrator" / "memory" / "rag_bundle"
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def iter_sources(rag_dir: Path) -> Iterator[Path]:
+    """YAML files of the knowledge base, in a stable order"""
+    for path in sorted(rag_dir.rglob("*")):
+        if path.suffix in (".yaml", ".yml") and path.is_file():
+            yield path
+
+def validate_source(relative: str, data: Any) -> List[str]:
+    """Structural problems RAGLoader would trip over, as messages"""
+    if data is None:
+        return []
+    if not isinstance(data, dict):
+        return [f"{relative}: expected a mapping at the top level, got {type(data).__name__}"]
+    errors = []
+    if relative.startswith("program_catalog/"):
+        for section in ("programs", "certificates"):
+            items = data.get(section, [])
+            if not isinstance(items, list):
+                errors.append(f"{relative}: '{section}' must be a list")
+                continue
+            for position, item in enumerate(items):
+                if not isinstance(item, dict) or not item.get("id"):
+                    errors.append(f"{relative}: {section}[{position}] needs an 'id'")
+    return errors
+
+def compile_bundle(rag_dir: Optional[Path] = None, bundle_dir: Optional[Path] = None,
+                   write: bool = True) -> Dict[str, Any]:
+    """Parse and validate every source; unless there are errors (or write=False), write bundle then manifest"""
+    rag_dir = rag_dir or get_rag_dir()
+    bundle_dir = bundle_dir or get_bundle_dir()
+    files: Dict[str, Any] = {}
+    sources: Dict[str, Dict[str, Any]] = {}
+    errors: List[str] = []
+    source_bytes = 0
+
+    for path in iter_sources(rag_dir):
+        relative = path.relative_to(rag_dir).as_posix()
+        stat = os.stat(path)
+        try:
+            with open(path, 'r') as f:
+                data = yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            errors.append(f"{relative}: {e}")
+            continue
+        errors.extend(validate_source(relative, data))
+        files[relative] = data
+        sources[relative] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(path)}
+        source_bytes += stat.st_size
+
+    result = {"files": len(sources), "source_bytes": source_bytes, "errors": errors, "bundle_bytes": 0,
+              "bundle_path": bundle_dir / BUNDLE_FILE, "written": False}
+    if errors or not write:
+        return result
+
+    payload = pickle.dumps({"version": BUNDLE_VERSION, "files": files}, protocol=pickle.HIGHEST_PROTOCOL)
+    manifest = {
+        "version": BUNDLE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "bundle_sha256": hashlib.sha256(payload).hexdigest(),
+        "sources": sources
+    }
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    # The manifest is replaced last: a reader never pairs a new manifest with an old bundle
+    for name, data in ((BUNDLE_FILE, payload), (MANIFEST_FILE, json.dumps(manifest, indent=2).encode("utf-8"))):
+        tmp_path = bundle_dir / f"{name}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, bundle_dir / name)
+    tracer.count("io", 2)
+    result.update(bundle_bytes=len(payload), written=True)
+    return result
+
+class RAGBundle:
+    """Lazily loaded compiled bundle; lookup() only answers for sources that still match the manifest"""
+
+    def __init__(self, rag_dir: Optional[Path] = None, bundle_dir: Optional[Path] = None):
+        self.rag_dir = rag_dir or get_rag_dir()
+        self.bundle_dir = bundle_dir or get_bundle_dir()
+        self.enabled = get_setting("ORDAE_RAG_BUNDLE", "true").lower() not in ("0", "false", "no")
+        self._files: Optional[Dict[str, Any]] = None
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        """Read manifest and bundle once; a missing, mismatched or unreadable bundle counts as empty"""
+        if self._files is not None:
+            return
+        self._files = {}
+        try:
+            with open(self.bundle_dir / MANIFEST_FILE, 'r') as f:
+                manifest = json.load(f)
+            with open(self.bundle_dir / BUNDLE_FILE, 'rb') as f:
+                payload = f.read()
+        except (FileNotFoundError, OSError, json.JSONDecodeError):
+            return
+        tracer.count("io", 2)
+        if manifest.get("version") != BUNDLE_VERSION or hashlib.sha256(payload).hexdigest() != manifest.get("bundle_sha256"):
+            return
+        try:
+            bundle = pickle.loads(payload)
+        except Exception:
+            return
+        self._files = bundle.get("files", {})
+        self._sources = manifest.get("sources", {})
+
+    def lookup(self, path: Path, stat: os.stat_result) -> Tuple[bool, Any]:
+        """(True, parsed data) when the bundle holds an up-to-date copy of path, else (False, None)"""
+        if not self.enabled:
+            return False, None
+        try:
+            relative = path.relative_to(self.rag_dir).as_posix()
+        except ValueError:
+            return False, None
+        with self._lock:
+            self._load()
+        record = self._sources.get(relative)
+        if record is None or relative not in self._files or record["size"] != stat.st_size:
+            return False, None
+        # mtime moves on checkouts and touches; equal content is still fresh
+        if record["mtime_ns"] != stat.st_mtime_ns and file_sha256(path) != record["sha256"]:
+            return False, None
+        return True, self._files[relative]
+
+# Global instance
+rag_bundle = RAGBundle()
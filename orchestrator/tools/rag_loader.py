@@ -1,78 +1,140 @@
 """
 RAG Knowledge Base Loader for PersonaOps ORDAE System
 Loads university brand guidelines, program catalogs, and messaging frameworks
+Parsed YAML is kept in one process-wide cache shared by every loader,
+invalidated when a file's mtime or size changes and bounded by LRU eviction;
+misses are served from the compiled bundle (tools/rag_bundle.py) when it is fresh
 """
+import os
+import threading
+import time
 import yaml
 import json
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from rich.console import Console
+from .config import get_setting
+from .manifest import RACY_WINDOW_NS
+from .rag_bundle import rag_bundle
+from .tracing import tracer
 
 console = Console()
 
+class RAGCache:
+    """Thread-safe LRU of parsed YAML files keyed by path, validated against (mtime, size)"""
+    
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries or int(get_setting("ORDAE_RAG_CACHE_MAX_ENTRIES", "512"))
+        # Budget on the summed size of the cached source files, a proxy for parsed size
+        self.max_bytes = max_bytes or int(get_setting("ORDAE_RAG_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        # path -> (mtime_ns, size, recorded_ns, data), least recently used first
+        self._entries: "OrderedDict[str, Tuple[int, int, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        # Misses served from the compiled bundle instead of parsing YAML
+        self.bundle_loads = 0
+    
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+    
+    def load_yaml(self, path: Path, default: Any = None) -> Any:
+        """Parsed contents of a YAML file, or `default` when it does not exist; treat the result as read-only"""
+        key = str(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._drop(key)
+            return default
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            # Like the observe manifest, an entry recorded within the racy window of its mtime is re-validated
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size) and entry[2] - entry[0] > RACY_WINDOW_NS:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[3]
+            self.misses += 1
+            if entry is not None:
+                self.invalidations += 1
+        
+        # Loaded outside the lock so loads of different files do not serialize
+        recorded_ns = time.time_ns()
+        from_bundle, data = rag_bundle.lookup(path, stat)
+        if not from_bundle:
+            with open(path, 'r') as f:
+                data = yaml.safe_load(f)
+            tracer.count("io")
+        
+        with self._lock:
+            self.bundle_loads += 1 if from_bundle else 0
+            self._drop(key)
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, recorded_ns, data)
+            self._bytes += stat.st_size
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return data
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, cached source bytes and hit/miss/invalidation/eviction counts"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "bundle_loads": self.bundle_loads
+            }
+
+# Global instance
+rag_cache = RAGCache()
+
 class RAGLoader:
     """Loads and manages RAG knowledge base for ORDAE agents"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[RAGCache] = None):
         self.repo_root = Path.cwd()
         self.rag_dir = self.repo_root / "rag"
-        self._cache = {}
+        # Shared by all loaders, so parsed files survive across loader instances
+        self._cache = cache or rag_cache
+    
+    def _load(self, path: Path) -> Dict[str, Any]:
+        return self._cache.load_yaml(path, default={})
         
     def load_university_brand_guidelines(self, university_id: str) -> Dict[str, Any]:
         """Load brand guidelines for a specific university"""
-        cache_key = f"brand_{university_id}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-            
-        brand_file = self.rag_dir / "universities" / university_id / "brand_guidelines.yaml"
-        if brand_file.exists():
-            with open(brand_file, 'r') as f:
-                data = yaml.safe_load(f)
-                self._cache[cache_key] = data
-                return data
-        return {}
+        return self._load(self.rag_dir / "universities" / university_id / "brand_guidelines.yaml")
     
     def load_university_voice_tone(self, university_id: str) -> Dict[str, Any]:
         """Load voice and tone guidelines for a specific university"""
-        cache_key = f"voice_{university_id}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-            
-        voice_file = self.rag_dir / "universities" / university_id / "voice_tone.yaml"
-        if voice_file.exists():
-            with open(voice_file, 'r') as f:
-                data = yaml.safe_load(f)
-                self._cache[cache_key] = data
-                return data
-        return {}
+        return self._load(self.rag_dir / "universities" / university_id / "voice_tone.yaml")
     
     def load_university_messaging(self, university_id: str) -> Dict[str, Any]:
         """Load messaging framework for a specific university"""
-        cache_key = f"messaging_{university_id}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-            
-        messaging_file = self.rag_dir / "universities" / university_id / "messaging_framework.yaml"
-        if messaging_file.exists():
-            with open(messaging_file, 'r') as f:
-                data = yaml.safe_load(f)
-                self._cache[cache_key] = data
-                return data
-        return {}
+        return self._load(self.rag_dir / "universities" / university_id / "messaging_framework.yaml")
     
     def load_program_catalog(self, university_id: str) -> Dict[str, Any]:
         """Load program catalog for a specific university"""
-        cache_key = f"programs_{university_id}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-            
-        catalog_file = self.rag_dir / "program_catalog" / f"{university_id}_programs.yaml"
-        if catalog_file.exists():
-            with open(catalog_file, 'r') as f:
-                data = yaml.safe_load(f)
-                self._cache[cache_key] = data
-                return data
-        return {}
+        return self._load(self.rag_dir / "program_catalog" / f"{university_id}_programs.yaml")
     
     def get_program_details(self, university_id: str, program_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information for a specific program"""
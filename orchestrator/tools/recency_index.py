@@ -0,0 +1,137 @@
+"""
+Recency index for ORDAE vector memories
+Kept next to the vectors of each embedding model: an append-only log of
+(timestamp, id, metadata) plus an in-memory timestamp-sorted id list, so the
+last N memories (optionally within a time window) come back in O(log n + N)
+without a vector query. Only the newest `capacity` memories are retained
+"""
+import bisect
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .config import get_setting
+from .locking import InterProcessLock
+from .tracing import tracer
+
+RECENCY_FILE = "recency.jsonl"
+LOCK_FILE = "recency.lock"
+
+class RecencyIndex:
+    """Timestamp-sorted ids with their metadata; re-adding an id replaces its entry"""
+
+    def __init__(self, directory: Path, capacity: Optional[int] = None):
+        self.path = directory / RECENCY_FILE
+        self.capacity = capacity or int(get_setting("ORDAE_RECENCY_CAPACITY", "10000"))
+        # Sorted (timestamp, id) keys and the metadata behind each id
+        self._keys: List[Tuple[str, str]] = []
+        self._entries: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._lines = 0
+        self._pos = 0
+        self._inode: Optional[int] = None
+        self._lock = threading.RLock()
+        self._exclusive = InterProcessLock(directory / LOCK_FILE)
+
+    def _discard(self, memory_id: str) -> None:
+        previous = self._entries.pop(memory_id, None)
+        if previous is not None:
+            key = (previous[0], memory_id)
+            i = bisect.bisect_left(self._keys, key)
+            if i < len(self._keys) and self._keys[i] == key:
+                del self._keys[i]
+
+    def _insert(self, memory_id: str, timestamp: str, metadata: Dict[str, Any]) -> None:
+        self._discard(memory_id)
+        self._entries[memory_id] = (timestamp, metadata)
+        # Live writes arrive in time order, so this is almost always an append
+        bisect.insort(self._keys, (timestamp, memory_id))
+        if len(self._keys) > self.capacity:
+            for _, expired in self._keys[:len(self._keys) - self.capacity]:
+                del self._entries[expired]
+            del self._keys[:len(self._keys) - self.capacity]
+
+    def _sync(self) -> None:
+        """Apply log lines written since the last sync (by any process)"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._pos:
+            # First load, or the log was compacted
+            self._keys, self._entries, self._lines, self._pos, self._inode = [], {}, 0, 0, stat.st_ino
+        if stat.st_size == self._pos:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(self._pos)
+            data = f.read(stat.st_size - self._pos)
+        tracer.count("io")
+        complete = data[:data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("deleted"):
+                self._discard(record["id"])
+            else:
+                self._insert(record["id"], record["timestamp"], record.get("metadata", {}))
+            self._lines += 1
+        self._pos += len(complete)
+
+    def _compact(self) -> None:
+        """Rewrite the log with only the retained entries"""
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            for timestamp, memory_id in self._keys:
+                f.write(json.dumps({"id": memory_id, "timestamp": timestamp, "metadata": self._entries[memory_id][1]},
+                                   default=str) + "\n")
+        os.replace(tmp_path, self.path)
+        tracer.count("io")
+        stat = os.stat(self.path)
+        self._lines, self._pos, self._inode = len(self._keys), stat.st_size, stat.st_ino
+
+    def add(self, records: Sequence[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """Record (id, ISO timestamp, metadata) for stored memories"""
+        if not records:
+            return
+        self._append("".join(
+            json.dumps({"id": memory_id, "timestamp": timestamp, "metadata": metadata}, default=str) + "\n"
+            for memory_id, timestamp, metadata in records
+        ).encode("utf-8"))
+
+    def remove(self, ids: Sequence[str]) -> None:
+        """Forget memories; the deletion markers are dropped at the next compaction"""
+        if ids:
+            self._append("".join(json.dumps({"id": memory_id, "deleted": True}) + "\n" for memory_id in ids).encode("utf-8"))
+
+    def _append(self, data: bytes) -> None:
+        with self._lock, self._exclusive:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._sync()
+            with open(self.path, 'ab') as f:
+                f.write(data)
+            tracer.count("io")
+            self._sync()
+            # The log only holds superseded or expired lines beyond this point
+            if self._lines > 2 * self.capacity:
+                self._compact()
+
+    def latest(self, limit: int, since: Optional[str] = None, until: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Newest-first (id, metadata) for up to `limit` memories with since <= timestamp < until"""
+        with self._lock:
+            self._sync()
+            position = bisect.bisect_left(self._keys, (until, "")) if until else len(self._keys)
+            results = []
+            while position > 0 and len(results) < limit:
+                position -= 1
+                timestamp, memory_id = self._keys[position]
+                if since and timestamp < since:
+                    break
+                results.append((memory_id, self._entries[memory_id][1]))
+            return results
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._sync()
+            return len(self._keys)
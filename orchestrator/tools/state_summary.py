@@ -0,0 +1,94 @@
+"""
+Bounded text summaries of ORDAE states for embedding
+Emits the salient fields of a state (decision, outcome, mission, missing
+components, counts, evaluation feedback) most important first and stops at a
+character budget. Only those fields are visited, so the cost does not depend
+on how large the snapshot's configs or file listings grow. Ledger entries
+recorded before evaluate ran hold another iteration's decision, actions and
+evaluation; those parts are left out of their summaries
+"""
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator
+from .config import get_setting
+from .ledger import entry_is_evaluated
+
+# Longest single value emitted; keeps one verbose recommendation from using the whole budget
+MAX_VALUE_CHARS = 160
+# List items considered per field
+MAX_LIST_ITEMS = 20
+
+def _clip(value: Any) -> str:
+    text = " ".join(str(value).split())
+    return text if len(text) <= MAX_VALUE_CHARS else text[:MAX_VALUE_CHARS - 1] + "…"
+
+def _items(value: Any) -> Iterator[str]:
+    if isinstance(value, (list, tuple)):
+        for item in islice(value, MAX_LIST_ITEMS):
+            yield _clip(item)
+
+def _count(value: Any) -> int:
+    return len(value) if isinstance(value, (list, tuple, dict)) else 0
+
+def iter_state_fragments(state: Dict[str, Any], ledger_entry: bool = False) -> Iterator[str]:
+    """`label: value` fragments of a state (or, with ledger_entry, a stored entry), most important first"""
+    own_iteration = not ledger_entry or entry_is_evaluated(state)
+    snapshot = state.get("snapshot") or {}
+    decision = (state.get("decision") or {}) if own_iteration else {}
+    actions = (state.get("actions") or {}) if own_iteration else {}
+    evaluation = (state.get("evaluation") or {}) if own_iteration else {}
+    objectives = snapshot.get("strategic_objectives")
+    # Compacted ledger snapshots hold blob references in place of large dicts
+    objectives = objectives if isinstance(objectives, dict) else {}
+    persona_data = snapshot.get("persona_data") or {}
+    repo_state = snapshot.get("repo_state") or {}
+
+    yield f"ORDAE iteration {state.get('iteration', 1)}"
+    for key in ("lane", "task", "target_university"):
+        if decision.get(key):
+            yield f"{key}: {_clip(decision[key])}"
+    if evaluation:
+        yield f"outcome: {'success' if evaluation.get('success') else 'failure'}"
+    if actions.get("status"):
+        yield f"status: {_clip(actions['status'])}"
+    yield f"files created: {_count(actions.get('files_created'))}"
+    if objectives.get("mission"):
+        yield f"mission: {_clip(objectives['mission'])}"
+    if _count(decision.get("target_universities")) > 1:
+        yield f"pending universities: {', '.join(_items(decision['target_universities']))}"
+
+    missing = snapshot.get("missing_components") or []
+    yield f"missing components: {_count(missing)}"
+    for component in _items(missing):
+        yield f"missing: {component}"
+
+    if "file_count" in persona_data:
+        yield f"persona files: {persona_data['file_count']}"
+    for key in ("app_has_attribution_page", "ab_plan_exists"):
+        if key in repo_state:
+            yield f"{key}: {'yes' if repo_state[key] else 'no'}"
+    if evaluation.get("next_iteration_focus"):
+        yield f"next focus: {_clip(evaluation['next_iteration_focus'])}"
+    for result in _items(evaluation.get("validation_results")):
+        yield f"validation: {result}"
+    for recommendation in _items(evaluation.get("recommendations")):
+        yield f"recommendation: {recommendation}"
+    if decision.get("reasoning"):
+        yield f"reasoning: {_clip(decision['reasoning'])}"
+
+def join_fragments(fragments: Iterable[str], budget: int) -> str:
+    """Join fragments with " | " until the next one would exceed `budget` characters"""
+    parts, used = [], 0
+    for fragment in fragments:
+        cost = len(fragment) + (3 if parts else 0)
+        if used + cost > budget:
+            break
+        parts.append(fragment)
+        used += cost
+    return " | ".join(parts)
+
+def summarize_state(state: Dict[str, Any], budget: int = 0, ledger_entry: bool = False) -> str:
+    """Summary of a state (or ledger entry) within `budget` characters (default ORDAE_STATE_TEXT_BUDGET)"""
+    return join_fragments(
+        iter_state_fragments(state, ledger_entry),
+        budget or int(get_setting("ORDAE_STATE_TEXT_BUDGET", "1000"))
+    )
@@ -1,36 +1,43 @@
-import os
 import json
+import threading
 import uuid
-from typing import Dict, List, Any, Optional
-from supabase import create_client, Client
-from pathlib import Path
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+from .config import get_setting
+from .tracing import tracer
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 class SupabaseIntegration:
     def __init__(self):
-        self.client: Optional[Client] = None
-        self._initialize_client()
+        # The client (and the supabase package itself) is created on first use
+        self._client: Optional["Client"] = None
+        self._initialized = False
+        self._lock = threading.Lock()
+    
+    @property
+    def client(self) -> Optional["Client"]:
+        """Supabase client, initialized lazily on first access"""
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self._initialize_client()
+                    self._initialized = True
+        return self._client
     
     def _initialize_client(self):
         """Initialize Supabase client with environment variables"""
         try:
-            # Try to load from .env file in project root
-            env_file = Path(__file__).parent.parent.parent / ".env"
-            if env_file.exists():
-                with open(env_file, 'r') as f:
-                    for line in f:
-                        if line.strip() and not line.startswith('#'):
-                            key, value = line.strip().split('=', 1)
-                            os.environ[key] = value.strip('"\'')
-            
-            url = os.getenv('VITE_SUPABASE_URL')
+            url = get_setting('VITE_SUPABASE_URL')
             # Use service role key for ORDAE system to bypass RLS
-            key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('VITE_SUPABASE_ANON_KEY')
+            key = get_setting('SUPABASE_SERVICE_ROLE_KEY') or get_setting('VITE_SUPABASE_ANON_KEY')
             
             if not url or not key:
                 print("⚠️  Supabase credentials not found. Using local file storage.")
                 return
-                
-            self.client = create_client(url, key)
+            
+            from supabase import create_client
+            self._client = create_client(url, key)
             print("✅ Supabase client initialized successfully")
             
         except Exception as e:
@@ -51,6 +58,7 @@ class SupabaseIntegration:
             supabase_persona = self._transform_to_supabase_format(persona_data, user_id, org_uuid)
             
             # Insert persona into database
+            tracer.count("network")
             result = self.client.table('personas').insert(supabase_persona).execute()
             
             if result.data and len(result.data) > 0:
@@ -161,6 +169,7 @@ class SupabaseIntegration:
             return None
             
         try:
+            tracer.count("network")
             result = self.client.table('organizations').select('id').eq('subdomain', university_id).execute()
             if result.data and len(result.data) > 0:
                 return result.data[0]['id']
@@ -175,6 +184,7 @@ class SupabaseIntegration:
             return []
             
         try:
+            tracer.count("network")
             result = self.client.table('personas').select('*').eq('organization_id', org_id).execute()
             return result.data or []
         except Exception as e:
@@ -191,6 +201,7 @@ class SupabaseIntegration:
             university_name = university_data.get('name', 'Michigan State University')
             
             # Check if organization exists by subdomain
+            tracer.count("network")
             existing = self.client.table('organizations').select('id, subdomain').eq('subdomain', university_id).execute()
             
             if existing.data and len(existing.data) > 0:
@@ -206,6 +217,7 @@ class SupabaseIntegration:
                 'subdomain': university_id
             }
             
+            tracer.count("network")
             result = self.client.table('organizations').insert(org_data).execute()
             
             if result.data and len(result.data) > 0:
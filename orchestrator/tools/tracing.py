@@ -0,0 +1,140 @@
+"""
+Lightweight tracing for the ORDAE pipeline
+Nested spans record wall time, CPU time and I/O / network call counts, are
+appended to a JSONL trace file and summarized in a table at the end of a run
+"""
+import functools
+import inspect
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+_current_span: ContextVar[Optional[Dict[str, Any]]] = ContextVar("ordae_current_span", default=None)
+
+def get_trace_dir() -> Path:
+    """Directory holding one JSONL trace file per run"""
+    return Path.cwd() / "orchestrator" / "memory" / "traces"
+
+class Tracer:
+    """Collects spans for one run; a no-op until start() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.run_id: Optional[str] = None
+        self.trace_path: Optional[Path] = None
+        self.spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def start(self, run_id: str, trace_dir: Optional[Path] = None) -> Path:
+        """Enable tracing and direct spans to <trace_dir>/<run_id>.jsonl"""
+        trace_dir = trace_dir or get_trace_dir()
+        trace_dir.mkdir(parents=True, exist_ok=True)
+        self.enabled = True
+        self.run_id = run_id
+        self.trace_path = trace_dir / f"{run_id}.jsonl"
+        self.spans = []
+        return self.trace_path
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Record a nested span around a block of work"""
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _current_span.get()
+        record = {
+            "run_id": self.run_id,
+            "span_id": uuid.uuid4().hex[:16],
+            "parent_id": parent["span_id"] if parent else None,
+            "name": name,
+            "attributes": attributes,
+            "counts": {},
+            "start": time.time()
+        }
+        token = _current_span.set(record)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield record
+        except BaseException as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record["wall_ms"] = (time.perf_counter() - wall_start) * 1000
+            record["cpu_ms"] = (time.thread_time() - cpu_start) * 1000
+            _current_span.reset(token)
+            self._write(record)
+
+    def count(self, kind: str, amount: int = 1) -> None:
+        """Count an I/O or network call against the innermost open span"""
+        record = _current_span.get()
+        if record is not None:
+            counts = record["counts"]
+            counts[kind] = counts.get(kind, 0) + amount
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.spans.append(record)
+            with open(self.trace_path, 'a') as f:
+                f.write(json.dumps(record, default=str) + "\n")
+
+    def print_summary(self) -> None:
+        """Aggregate spans by name into a timing table"""
+        if not self.enabled or not self.spans:
+            return
+
+        totals: Dict[str, Dict[str, Any]] = {}
+        for record in self.spans:
+            total = totals.setdefault(record["name"], {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "counts": {}})
+            total["calls"] += 1
+            total["wall_ms"] += record["wall_ms"]
+            total["cpu_ms"] += record["cpu_ms"]
+            for kind, amount in record["counts"].items():
+                total["counts"][kind] = total["counts"].get(kind, 0) + amount
+
+        table = Table(title=f"ORDAE trace summary ({self.run_id})")
+        table.add_column("Span")
+        table.add_column("Calls", justify="right")
+        table.add_column("Wall (ms)", justify="right")
+        table.add_column("CPU (ms)", justify="right")
+        table.add_column("I/O", justify="right")
+        table.add_column("Network", justify="right")
+        for name, total in sorted(totals.items(), key=lambda item: item[1]["wall_ms"], reverse=True):
+            table.add_row(
+                name,
+                str(total["calls"]),
+                f"{total['wall_ms']:.1f}",
+                f"{total['cpu_ms']:.1f}",
+                str(total["counts"].get("io", 0)),
+                str(total["counts"].get("network", 0))
+            )
+        console.print(table)
+        console.print(f"🧵 Trace written to {self.trace_path}")
+
+def traced_node(name: str, node: Callable) -> Callable:
+    """Wrap a graph node (sync or async) in a span named after it"""
+    if inspect.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_wrapper(state):
+            with tracer.span(f"node:{name}"):
+                return await node(state)
+        return async_wrapper
+
+    @functools.wraps(node)
+    def wrapper(state):
+        with tracer.span(f"node:{name}"):
+            return node(state)
+    return wrapper
+
+# Global instance
+tracer = Tracer()
@@ -1,249 +1,550 @@
 """
 Vector Memory Store for ORDAE System using Pinecone
-Replaces JSON storage with semantic vector embeddings
+Replaces JSON storage with semantic vector embeddings; without Pinecone,
+memories go to a local NumPy vector index under orchestrator/memory/.
+Embeddings come from the configured provider (see tools/embeddings.py).
+Only vectors are written here; the ledger is written by the remember node,
+whose memory writer also calls store_memories when ORDAE_VECTOR_MEMORY is on
 """
-import os
-import json
 import hashlib
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 from datetime import datetime
 from pathlib import Path
-from pinecone import Pinecone, ServerlessSpec
-import openai
+from .config import get_setting
+from .ledger import ledger, entry_fields, entry_is_evaluated
+from .blob_store import blob_store
+from .embedding_cache import embedding_cache
+from .state_summary import summarize_state
+
+if TYPE_CHECKING:
+    import openai
+    from pinecone import Pinecone
+    from .embeddings import EmbeddingProvider
+    from .local_vector_index import LocalVectorIndex
+    from .recency_index import RecencyIndex
+
+# Vectors of the default OpenAI model keep the original Pinecone index name
+DEFAULT_EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# Request size limits for bulk storage: OpenAI accepts up to 2048 inputs and
+# ~300k tokens per embeddings request (budgeted at 4 characters per token);
+# Pinecone caps upserts at 2MB, about 100 vectors of 1536 dims with metadata
+EMBEDDING_BATCH_SIZE = 2048
+EMBEDDING_BATCH_CHARS = 1_000_000
+UPSERT_BATCH_SIZE = 100
+PINECONE_DELETE_BATCH_SIZE = 1000
+
+# Filterable fields taken from an iteration's decision and evaluation
+DECISION_FIELDS = ("lane", "task", "target_university", "success")
+
+def chunk_texts(texts: Sequence[str], max_items: int, max_chars: int) -> Iterator[Tuple[int, int]]:
+    """(start, end) ranges of texts that fit both an item and a character budget"""
+    start, chars = 0, 0
+    for end, text in enumerate(texts):
+        if end > start and (end - start >= max_items or chars + len(text) > max_chars):
+            yield start, end
+            start, chars = end, 0
+        chars += len(text)
+    if start < len(texts):
+        yield start, len(texts)
 
 class VectorMemoryStore:
     def __init__(self):
-        self.pc: Optional[Pinecone] = None
-        self.index = None
-        self.openai_client: Optional[openai.OpenAI] = None
+        # Clients (and the pinecone/openai packages) are created on first use
+        self._pc: Optional["Pinecone"] = None
+        self._index = None
+        self._openai_client: Optional["openai.OpenAI"] = None
+        self._embedding_provider: Optional["EmbeddingProvider"] = None
         self.index_name = "ordae-memory"
-        self._initialize_clients()
+        self._initialized = False
+        self._lock = threading.Lock()
+        # One local index per embedding model, so vectors of different models never mix
+        self._local_indexes: Dict[str, "LocalVectorIndex"] = {}
+        self._recency_indexes: Dict[str, "RecencyIndex"] = {}
+    
+    def _ensure_clients(self):
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self._initialize_clients()
+                    self._initialized = True
+    
+    @property
+    def pc(self) -> Optional["Pinecone"]:
+        self._ensure_clients()
+        return self._pc
+    
+    @property
+    def index(self):
+        self._ensure_clients()
+        return self._index
+    
+    @property
+    def openai_client(self) -> Optional["openai.OpenAI"]:
+        self._ensure_clients()
+        return self._openai_client
+    
+    @property
+    def embedding_provider(self) -> "EmbeddingProvider":
+        self._ensure_clients()
+        return self._embedding_provider
+    
+    def local_index(self, model: str) -> "LocalVectorIndex":
+        """Local vector index for an embedding model, opened on first use"""
+        from .local_vector_index import LocalVectorIndex, get_vector_dir
+        with self._lock:
+            if model not in self._local_indexes:
+                self._local_indexes[model] = LocalVectorIndex(get_vector_dir() / model, model=model)
+            return self._local_indexes[model]
+    
+    def recency_index(self, model: str) -> "RecencyIndex":
+        """Time-ordered index of stored memories for an embedding model (Pinecone or local)"""
+        from .local_vector_index import get_vector_dir
+        from .recency_index import RecencyIndex
+        with self._lock:
+            if model not in self._recency_indexes:
+                self._recency_indexes[model] = RecencyIndex(get_vector_dir() / model)
+            return self._recency_indexes[model]
+    
+    def _record_recent(self, ids: Sequence[str], metadatas: Sequence[Dict[str, Any]]) -> None:
+        self.recency_index(self.embedding_provider.model).add(
+            [(memory_id, metadata['timestamp'], metadata) for memory_id, metadata in zip(ids, metadatas)]
+        )
     
     def _initialize_clients(self):
-        """Initialize Pinecone and OpenAI clients"""
-        # Load environment variables
-        env_file = Path(__file__).parent.parent.parent / ".env"
-        if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    if line.strip() and not line.startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value.strip('"\'')
+        """Initialize OpenAI, the embedding provider and Pinecone"""
+        # Initialize OpenAI for embeddings
+        openai_key = get_setting('OPENAI_API_KEY')
+        if openai_key:
+            import openai
+            self._openai_client = openai.OpenAI(api_key=openai_key)
+            print("✅ OpenAI embeddings client initialized")
+        
+        from .embeddings import create_embedding_provider
+        self._embedding_provider = create_embedding_provider(self._openai_client)
+        print(f"✅ Embedding provider: {self._embedding_provider.model} ({self._embedding_provider.dimension} dims)")
         
         # Initialize Pinecone
-        pinecone_key = os.getenv('PINECONE_API_KEY')
+        pinecone_key = get_setting('PINECONE_API_KEY')
         if pinecone_key:
-            self.pc = Pinecone(api_key=pinecone_key)
+            from pinecone import Pinecone
+            self._pc = Pinecone(api_key=pinecone_key)
             self._setup_index()
             print("✅ Pinecone vector store initialized")
-        
-        # Initialize OpenAI for embeddings
-        openai_key = os.getenv('OPENAI_API_KEY')
-        if openai_key:
-            self.openai_client = openai.OpenAI(api_key=openai_key)
-            print("✅ OpenAI embeddings client initialized")
+    
+    def pinecone_index_name(self) -> str:
+        """One Pinecone index per embedding model, so dimensions and models never mix"""
+        model = self._embedding_provider.model
+        return self.index_name if model == DEFAULT_EMBEDDING_MODEL else f"{self.index_name}-{model}"
     
     def _setup_index(self):
         """Create or connect to Pinecone index"""
+        from pinecone import ServerlessSpec
+        index_name = self.pinecone_index_name()
         try:
             # Check if index exists
-            if self.index_name not in self.pc.list_indexes().names():
-                # Create index with 1536 dimensions (OpenAI ada-002 embedding size)
-                self.pc.create_index(
-                    name=self.index_name,
-                    dimension=1536,
+            if index_name not in self._pc.list_indexes().names():
+                # Sized for the configured embedding provider
+                self._pc.create_index(
+                    name=index_name,
+                    dimension=self._embedding_provider.dimension,
                     metric='cosine',
                     spec=ServerlessSpec(
                         cloud='aws',
                         region='us-east-1'
                     )
                 )
-                print(f"✅ Created Pinecone index: {self.index_name}")
+                print(f"✅ Created Pinecone index: {index_name}")
             
             # Connect to index
-            self.index = self.pc.Index(self.index_name)
-            print(f"✅ Connected to Pinecone index: {self.index_name}")
+            self._index = self._pc.Index(index_name)
+            print(f"✅ Connected to Pinecone index: {index_name}")
             
         except Exception as e:
             print(f"❌ Error setting up Pinecone index: {e}")
     
-    def _create_embedding(self, text: str) -> List[float]:
-        """Create embedding vector from text using OpenAI"""
-        if not self.openai_client:
-            return [0.0] * 1536  # Return zero vector as fallback
+    def _create_embedding(self, text: str) -> Optional[List[float]]:
+        """Embedding for one text, or None when the provider could not embed it"""
+        return self._create_embeddings([text])[0]
+    
+    def _create_embeddings(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Embeddings for a batch of texts; remote providers are only asked for texts not in the cache"""
+        provider = self.embedding_provider
+        if not provider.cacheable:
+            return provider.embed(texts)
         
+        hashes = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+        embeddings = embedding_cache.get_many(provider.model, hashes)
+        # First position of each uncached text; a text repeated within the batch is embedded once
+        first: Dict[str, int] = {}
+        for i, text_hash in enumerate(hashes):
+            if text_hash not in embeddings:
+                first.setdefault(text_hash, i)
+        missing = list(first.values())
+        if missing:
+            fresh = [
+                (hashes[i], embedding)
+                for i, embedding in zip(missing, provider.embed([texts[i] for i in missing]))
+                if embedding is not None
+            ]
+            embeddings.update(fresh)
+            embedding_cache.put_many(provider.model, fresh)
+        return [embeddings.get(text_hash) for text_hash in hashes]
+    
+    @staticmethod
+    def _state_timestamp(state: Dict[str, Any]) -> datetime:
+        """When the state was recorded (ledger entries carry it), else now"""
         try:
-            response = self.openai_client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=text
-            )
-            return response.data[0].embedding
-        except Exception as e:
-            print(f"❌ Error creating embedding: {e}")
-            return [0.0] * 1536
+            return datetime.fromisoformat(state["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return datetime.now()
+    
+    def _memory_id(self, state: Dict[str, Any]) -> str:
+        """Stable ID per run and iteration, so storing the same state again overwrites it"""
+        if state.get('run_id'):
+            return f"ordae-{state['run_id']}-{state.get('iteration', 1)}"
+        return f"ordae-{state.get('iteration', 1)}-{int(self._state_timestamp(state).timestamp())}"
+    
+    def _memory_metadata(self, state: Dict[str, Any], state_text: str, embedded: bool = True) -> Dict[str, Any]:
+        """
+        Metadata stored alongside a memory vector; lane, task, target_university, success and iteration are filterable
+        Entries recorded before evaluate ran (see entry_is_evaluated) carry no success, so success filters skip them.
+        Without `embedded` (ledger fallback rows) the embedding model is left out
+        """
+        fields = entry_fields(state)
+        evaluated = entry_is_evaluated(state)
+        metadata = {
+            'timestamp': self._state_timestamp(state).isoformat(),
+            'iteration': state.get('iteration', 1),
+            'kind': 'iteration',
+            'run_id': fields['run_id'] or '',
+            # Pinecone metadata cannot hold nulls
+            'lane': fields['lane'] or 'unknown',
+            'task': fields['task'] or 'unknown',
+            'target_university': fields['target_university'] or 'none',
+            'success': fields['success'],
+            'system_id': 'ordae-main',
+            'state_summary': state_text[:500],  # Store truncated text for reference
+            'snapshot_keys': list(state.get('snapshot', {}).keys()),
+            # Decisions carry a task rather than a type
+            'decision_type': fields['task'] or 'unknown',
+            'actions_count': len(state.get('actions', {})),
+            'evaluation_score': (state.get('evaluation') or {}).get('score', 0) if evaluated else 0
+        }
+        if embedded:
+            metadata['embedding_model'] = self.embedding_provider.model
+            metadata['embedding_dimension'] = self.embedding_provider.dimension
+        if not evaluated:
+            del metadata['success']
+        return metadata
+    
+    @classmethod
+    def _memory_from_match(cls, memory_id: str, score: float, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        return {'similarity_score': score, **cls._memory_from_metadata(memory_id, metadata)}
+    
+    @staticmethod
+    def _memory_from_metadata(memory_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': memory_id,
+            'timestamp': metadata.get('timestamp'),
+            'iteration': metadata.get('iteration'),
+            'kind': metadata.get('kind', 'iteration'),
+            'lane': metadata.get('lane'),
+            'task': metadata.get('task'),
+            'target_university': metadata.get('target_university'),
+            'success': metadata.get('success'),
+            'state_summary': metadata.get('state_summary'),
+            'decision_type': metadata.get('decision_type'),
+            'actions_count': metadata.get('actions_count'),
+            'evaluation_score': metadata.get('evaluation_score'),
+            'embedding_model': metadata.get('embedding_model')
+        }
     
     def store_memory(self, state: Dict[str, Any]) -> bool:
         """Store ORDAE state as vector embedding"""
-        if not self.index or not self.openai_client:
-            return self._fallback_local_storage(state)
+        if not self.index:
+            return self._store_local(state)
         
         try:
             # Create text representation of state for embedding
             state_text = self._state_to_text(state)
             
-            # Generate embedding
+            # Generate embedding; a failed embedding is never stored as a placeholder vector
             embedding = self._create_embedding(state_text)
+            if embedding is None:
+                print(f"❌ Could not embed iteration {state.get('iteration', 1)}; it stays in the ledger only")
+                return False
             
-            # Create unique ID based on iteration and timestamp
-            memory_id = f"ordae-{state.get('iteration', 1)}-{int(datetime.now().timestamp())}"
-            
-            # Prepare metadata
-            metadata = {
-                'timestamp': datetime.now().isoformat(),
-                'iteration': state.get('iteration', 1),
-                'system_id': 'ordae-main',
-                'state_summary': state_text[:500],  # Store truncated text for reference
-                'snapshot_keys': list(state.get('snapshot', {}).keys()),
-                'decision_type': state.get('decision', {}).get('type', 'unknown'),
-                'actions_count': len(state.get('actions', {})),
-                'evaluation_score': state.get('evaluation', {}).get('score', 0)
-            }
+            memory_id = self._memory_id(state)
+            metadata = self._memory_metadata(state, state_text)
             
             # Store in Pinecone
             self.index.upsert(
                 vectors=[(memory_id, embedding, metadata)]
             )
+            self._record_recent([memory_id], [metadata])
             
             print(f"✅ Memory stored as vector: iteration {state.get('iteration', 1)}")
             return True
             
         except Exception as e:
             print(f"❌ Error storing vector memory: {e}")
-            return self._fallback_local_storage(state)
+            return self._store_local(state)
+    
+    def store_memories(self, states: Sequence[Dict[str, Any]], max_workers: int = 4) -> Dict[str, Any]:
+        """
+        Store many ORDAE states as vectors, e.g. when backfilling from the ledger
+        Embedding requests and upserts are chunked to the largest allowed sizes and
+        pipelined on a thread pool; like store_memory, no ledger entries are written
+        """
+        started = time.perf_counter()
+        texts = [self._state_to_text(state) for state in states]
+        ids = [self._memory_id(state) for state in states]
+        metadatas = [self._memory_metadata(state, text) for state, text in zip(states, texts)]
+        backend, stored, requests = self._store_vectors(ids, texts, metadatas, max_workers)
+        
+        seconds = time.perf_counter() - started
+        return {
+            "backend": backend,
+            "states": len(states),
+            "stored": stored,
+            "failed": len(states) - stored,
+            "requests": requests,
+            "seconds": seconds,
+            "per_second": stored / seconds if seconds > 0 else 0.0
+        }
+    
+    def store_episodes(self, episodes: Sequence[Dict[str, Any]], max_workers: int = 4) -> int:
+        """Store consolidated episode records as memories (kind "episode"); returns how many were stored"""
+        from .consolidation import episode_metadata, episode_text
+        texts = [episode_text(episode) for episode in episodes]
+        metadatas = [
+            {**episode_metadata(episode), 'state_summary': text[:500], 'embedding_model': self.embedding_provider.model,
+             'embedding_dimension': self.embedding_provider.dimension}
+            for episode, text in zip(episodes, texts)
+        ]
+        return self._store_vectors([episode['id'] for episode in episodes], texts, metadatas, max_workers)[1]
     
-    def retrieve_similar_memories(self, query_state: Dict[str, Any], limit: int = 5) -> List[Dict[str, Any]]:
-        """Retrieve semantically similar memories using vector search"""
-        if not self.index or not self.openai_client:
-            return self._fallback_local_retrieval(limit)
+    def _store_vectors(self, ids: Sequence[str], texts: Sequence[str], metadatas: Sequence[Dict[str, Any]],
+                       max_workers: int) -> Tuple[str, int, int]:
+        """Embed and store in Pinecone or the local index; returns (backend, stored, requests)"""
+        if self.index:
+            backend, stored, requests = "pinecone", 0, 0
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # All embedding requests are queued first; upserts follow as each chunk's embeddings arrive
+                embedding_jobs = [
+                    (start, pool.submit(self._create_embeddings, texts[start:end]))
+                    for start, end in chunk_texts(texts, EMBEDDING_BATCH_SIZE, EMBEDDING_BATCH_CHARS)
+                ]
+                upsert_jobs = []
+                for start, job in embedding_jobs:
+                    requests += 1
+                    vectors = [
+                        (ids[start + offset], embedding, metadatas[start + offset])
+                        for offset, embedding in enumerate(job.result()) if embedding is not None
+                    ]
+                    for batch_start in range(0, len(vectors), UPSERT_BATCH_SIZE):
+                        batch = vectors[batch_start:batch_start + UPSERT_BATCH_SIZE]
+                        upsert_jobs.append((batch, pool.submit(self.index.upsert, vectors=batch)))
+                for batch, job in upsert_jobs:
+                    requests += 1
+                    try:
+                        job.result()
+                    except Exception as e:
+                        print(f"❌ Error upserting {len(batch)} vectors: {e}")
+                        continue
+                    self._record_recent([memory_id for memory_id, _, _ in batch], [metadata for _, _, metadata in batch])
+                    stored += len(batch)
+        else:
+            backend, stored, requests = "local", 0, 0
+            local_index = self.local_index(self.embedding_provider.model)
+            for start, end in chunk_texts(texts, EMBEDDING_BATCH_SIZE, EMBEDDING_BATCH_CHARS):
+                embedded = [
+                    (start + offset, embedding)
+                    for offset, embedding in enumerate(self._create_embeddings(texts[start:end]))
+                    if embedding is not None
+                ]
+                requests += 1
+                try:
+                    stored += local_index.add(
+                        [ids[i] for i, _ in embedded],
+                        [embedding for _, embedding in embedded],
+                        [metadatas[i] for i, _ in embedded]
+                    )
+                    self._record_recent([ids[i] for i, _ in embedded], [metadatas[i] for i, _ in embedded])
+                except Exception as e:
+                    print(f"❌ Error storing {len(embedded)} local vector memories: {e}")
+        return backend, stored, requests
+    
+    def remove_memories(self, ids: Sequence[str]) -> int:
+        """Delete memories by id from Pinecone, the local index and the recency index; returns local removals"""
+        ids = list(ids)
+        if not ids:
+            return 0
+        if self.index:
+            for start in range(0, len(ids), PINECONE_DELETE_BATCH_SIZE):
+                self.index.delete(ids=ids[start:start + PINECONE_DELETE_BATCH_SIZE])
+        model = self.embedding_provider.model
+        removed = self.local_index(model).remove(ids)
+        self.recency_index(model).remove(ids)
+        return removed
+    
+    def forget_states(self, states: Sequence[Dict[str, Any]]) -> int:
+        """Delete the memories stored for these states (or their ledger index records)"""
+        return self.remove_memories([self._memory_id(state) for state in states])
+    
+    def retrieve_similar_memories(self, query_state: Union[str, Dict[str, Any]], limit: int = 5,
+                                  filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve semantically similar memories using vector search
+        filters ({field: value or list of values} over lane, task, target_university,
+        success, iteration and kind) restrict the candidates before the top-k is taken
+        """
+        if not self.index:
+            return self._local_retrieval(query_state, limit, filters)
         
         try:
             # Create query embedding
-            query_text = self._state_to_text(query_state)
+            query_text = self._query_text(query_state)
             query_embedding = self._create_embedding(query_text)
+            if query_embedding is None:
+                return self._fallback_local_retrieval(limit, filters=filters)
             
-            # Search for similar vectors
+            # Search for similar vectors; Pinecone applies the metadata filter inside the search
             results = self.index.query(
                 vector=query_embedding,
                 top_k=limit,
-                include_metadata=True
+                include_metadata=True,
+                filter=self._pinecone_filter(filters)
             )
             
-            memories = []
-            for match in results.matches:
-                memory = {
-                    'id': match.id,
-                    'similarity_score': match.score,
-                    'timestamp': match.metadata.get('timestamp'),
-                    'iteration': match.metadata.get('iteration'),
-                    'state_summary': match.metadata.get('state_summary'),
-                    'decision_type': match.metadata.get('decision_type'),
-                    'actions_count': match.metadata.get('actions_count'),
-                    'evaluation_score': match.metadata.get('evaluation_score')
-                }
-                memories.append(memory)
+            memories = [self._memory_from_match(match.id, match.score, match.metadata) for match in results.matches]
             
             print(f"✅ Retrieved {len(memories)} similar memories")
             return memories
             
         except Exception as e:
             print(f"❌ Error retrieving vector memories: {e}")
-            return self._fallback_local_retrieval(limit)
+            return self._local_retrieval(query_state, limit, filters)
     
-    def retrieve_recent_memories(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Retrieve most recent memories by iteration number"""
-        if not self.index:
-            return self._fallback_local_retrieval(limit)
-        
+    def search_memories(self, query: Union[str, Dict[str, Any]], limit: int = 5, lane: Optional[str] = None,
+                        task: Optional[str] = None, target_university: Optional[str] = None,
+                        success: Optional[bool] = None, iteration: Optional[int] = None,
+                        kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Hybrid retrieval: metadata filters select the slice, vector similarity ranks it
+        e.g. search_memories("persona creation attempt", lane="university_onboarding",
+        target_university="asu", success=False) for similar failed onboarding attempts for asu
+        """
+        filters = {
+            field: value for field, value in (
+                ("lane", lane), ("task", task), ("target_university", target_university),
+                ("success", success), ("iteration", iteration), ("kind", kind)
+            ) if value is not None
+        }
+        return self.retrieve_similar_memories(query, limit, filters)
+    
+    @staticmethod
+    def _pinecone_filter(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if not filters:
+            return None
+        return {
+            field: {"$in": list(value)} if isinstance(value, (list, tuple, set)) else {"$eq": value}
+            for field, value in filters.items()
+        }
+    
+    def retrieve_recent_memories(self, limit: int = 10, since: Optional[str] = None,
+                                 until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent memories, newest first, optionally with since <= timestamp < until (ISO strings)"""
         try:
-            # Query with high iteration filter to get recent memories
-            results = self.index.query(
-                vector=[0.0] * 1536,  # Dummy vector for metadata-only search
-                top_k=limit,
-                include_metadata=True,
-                filter={'system_id': 'ordae-main'}
-            )
-            
-            # Sort by iteration descending
-            memories = []
-            for match in results.matches:
-                memory = {
-                    'id': match.id,
-                    'timestamp': match.metadata.get('timestamp'),
-                    'iteration': match.metadata.get('iteration'),
-                    'state_summary': match.metadata.get('state_summary'),
-                    'decision_type': match.metadata.get('decision_type'),
-                    'actions_count': match.metadata.get('actions_count'),
-                    'evaluation_score': match.metadata.get('evaluation_score')
-                }
-                memories.append(memory)
-            
-            # Sort by iteration number
-            memories.sort(key=lambda x: x.get('iteration', 0), reverse=True)
-            return memories[:limit]
-            
+            entries = self.recency_index(self.embedding_provider.model).latest(limit, since, until)
         except Exception as e:
             print(f"❌ Error retrieving recent memories: {e}")
-            return self._fallback_local_retrieval(limit)
+            entries = []
+        if not entries:
+            return self._fallback_local_retrieval(limit, since, until)
+        return [self._memory_from_metadata(memory_id, metadata) for memory_id, metadata in entries]
     
     def _state_to_text(self, state: Dict[str, Any]) -> str:
-        """Convert ORDAE state to text for embedding"""
-        parts = []
-        
-        # Add iteration context
-        parts.append(f"ORDAE Iteration {state.get('iteration', 1)}")
-        
-        # Add snapshot summary
-        snapshot = state.get('snapshot', {})
-        if snapshot:
-            parts.append(f"Observations: {json.dumps(snapshot, indent=None)[:200]}...")
-        
-        # Add decision summary
-        decision = state.get('decision', {})
-        if decision:
-            parts.append(f"Decision: {json.dumps(decision, indent=None)[:200]}...")
-        
-        # Add actions summary
-        actions = state.get('actions', {})
-        if actions:
-            parts.append(f"Actions: {json.dumps(actions, indent=None)[:200]}...")
-        
-        # Add evaluation summary
-        evaluation = state.get('evaluation', {})
-        if evaluation:
-            parts.append(f"Evaluation: {json.dumps(evaluation, indent=None)[:200]}...")
-        
-        return " | ".join(parts)
+        """Convert a stored ORDAE state (a ledger entry) to a bounded, field-level summary for embedding"""
+        return summarize_state(state, ledger_entry=True)
     
-    def _fallback_local_storage(self, state: Dict[str, Any]) -> bool:
-        """Fallback to local JSON storage"""
+    def _query_text(self, query: Union[str, Dict[str, Any]]) -> str:
+        """Queries are free text or a live state to find neighbours of"""
+        return query if isinstance(query, str) else summarize_state(query)
+    
+    def _store_local(self, state: Dict[str, Any]) -> bool:
+        """Index the state in the local vector store"""
+        stored = False
         try:
-            from ..nodes.remember import remember
-            remember(state)
-            return True
-        except:
-            return False
+            state_text = self._state_to_text(state)
+            embedding = self._create_embedding(state_text)
+            if embedding is None:
+                print(f"❌ Could not embed iteration {state.get('iteration', 1)}; skipping the local vector")
+            else:
+                memory_id, metadata = self._memory_id(state), self._memory_metadata(state, state_text)
+                self.local_index(self.embedding_provider.model).add([memory_id], [embedding], [metadata])
+                self._record_recent([memory_id], [metadata])
+                print(f"✅ Memory stored in local vector index: iteration {state.get('iteration', 1)}")
+                stored = True
+        except Exception as e:
+            print(f"❌ Error storing local vector memory: {e}")
+        return stored
     
-    def _fallback_local_retrieval(self, limit: int) -> List[Dict[str, Any]]:
-        """Fallback to local JSON retrieval"""
-        ledger_path = Path.cwd() / "orchestrator" / "memory" / "ledger.json"
-        if not ledger_path.exists():
-            return []
+    def _local_retrieval(self, query_state: Union[str, Dict[str, Any]], limit: int,
+                         filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Rank memories in the local vector index, falling back to the latest ledger entries"""
+        try:
+            embedding = self._create_embedding(self._query_text(query_state))
+            matches = [] if embedding is None else (
+                self.local_index(self.embedding_provider.model).search(embedding, limit, filters)[0]
+            )
+        except Exception as e:
+            print(f"❌ Error searching local vector memories: {e}")
+            matches = []
+        if not matches:
+            return self._fallback_local_retrieval(limit, filters=filters)
         
+        memories = [self._memory_from_match(memory_id, score, metadata) for memory_id, score, metadata in matches]
+        print(f"✅ Retrieved {len(memories)} similar memories from local index")
+        return memories
+    
+    def _memory_from_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Memory dict for a ledger entry, shaped like the ones the indexes return"""
+        metadata = self._memory_metadata(entry, self._state_to_text(entry), embedded=False)
+        return self._memory_from_metadata(self._memory_id(entry), metadata)
+    
+    def _fallback_local_retrieval(self, limit: int, since: Optional[str] = None, until: Optional[str] = None,
+                                  filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Fallback to the local ledger, seeking to the last entries (in a time window, matching filters) via its index
+        Returns memory dicts, newest first, like the index-backed paths
+        """
         try:
-            with open(ledger_path, 'r') as f:
-                ledger = json.load(f)
-            return ledger[-limit:] if ledger else []
-        except:
+            if filters:
+                from .local_vector_index import matches_filters
+                records = [
+                    record for record in ledger.index() if matches_filters({'kind': 'iteration', **record}, filters)
+                ]
+                # Index records of legacy entries may still hold another iteration's decision and outcome;
+                # like their vectors, they never match a filter on those fields
+                decision_filtered = any(field in DECISION_FIELDS for field in filters)
+                entries = []
+                for record in reversed(records):
+                    entry = ledger.read(record)
+                    if entry is not None and (not decision_filtered or entry_is_evaluated(entry)):
+                        entries.append(entry)
+                        if len(entries) == limit:
+                            break
+                entries.reverse()
+            else:
+                entries = ledger.between(since, until)[-limit:] if since or until else ledger.tail(limit)
+            return [self._memory_from_entry(blob_store.resolve(entry)) for entry in reversed(entries)]
+        except Exception as e:
+            print(f"❌ Error reading memories from the ledger: {e}")
             return []
 
 # Global instance
@@ -0,0 +1,159 @@
+"""
+Input watcher for the ORDAE watch daemon
+Detects changes under persona_data/ and rag/ with inotify (via watchfiles) when
+available, and debounces bursts. The polling fallback re-lists a directory only
+when its mtime changed (entries were added, removed or renamed) and otherwise
+just stats the files it already knows, so a poll costs one stat per input file
+"""
+import os
+import time
+from stat import S_ISDIR
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from rich.console import Console
+
+console = Console()
+
+FileStat = Tuple[int, int]
+# Directory mtime_ns -> (files, subdirectories) listed at that mtime
+Listing = Tuple[int, List[str], List[str]]
+
+def default_watch_paths() -> List[Path]:
+    """Inputs the observe and act nodes read"""
+    repo_root = Path.cwd()
+    return [
+        repo_root / "persona_data",
+        repo_root / "rag"
+    ]
+
+def classify_changes(changed: Iterable[str], university_ids: Iterable[str],
+                     repo_root: Optional[Path] = None) -> Tuple[Set[str], bool]:
+    """
+    Universities whose personas a burst of changes makes stale, and whether anything
+    else the loop reads changed. RAG sources belong to one university; a persona file
+    marks its university stale only when it was deleted, so hand edits are kept
+    """
+    repo_root = repo_root or Path.cwd()
+    # Longest id first, so "asu_online" is not mistaken for "asu"
+    ids = sorted(university_ids, key=len, reverse=True)
+    universities: Set[str] = set()
+    other = False
+    for path in changed:
+        try:
+            parts = Path(path).relative_to(repo_root).parts
+        except ValueError:
+            other = True
+            continue
+        if parts[:2] == ("rag", "universities") and len(parts) > 3:
+            universities.add(parts[2])
+        elif parts[:2] == ("rag", "program_catalog") and parts[-1].endswith("_programs.yaml"):
+            universities.add(parts[-1][:-len("_programs.yaml")])
+        elif parts[:1] == ("persona_data",) and len(parts) == 2:
+            owner = next((uni for uni in ids if parts[1].startswith(f"{uni}_")), None)
+            if owner is None:
+                other = True
+            elif not os.path.exists(path):
+                universities.add(owner)
+        else:
+            other = True
+    return universities, other
+
+class InputWatcher:
+    """Blocks until watched inputs change relative to a baseline snapshot"""
+
+    def __init__(self, paths: Optional[List[Path]] = None, poll_interval: float = 1.0, debounce: float = 2.0):
+        self.paths = paths or default_watch_paths()
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._baseline: Dict[str, FileStat] = {}
+        self._listings: Dict[str, Listing] = {}
+        self._events = self._open_event_stream()
+
+    def _open_event_stream(self):
+        """inotify-backed event stream, or None to poll"""
+        try:
+            import watchfiles
+        except ImportError:
+            console.print(f"👀 Watching inputs by polling every {self.poll_interval}s")
+            return None
+
+        existing = [str(path) for path in self.paths if path.exists()]
+        if not existing:
+            return None
+        console.print("👀 Watching inputs with filesystem notifications")
+        return watchfiles.watch(*existing, debounce=int(self.debounce * 1000))
+
+    def _list_dir(self, path: str, mtime_ns: int) -> Tuple[List[str], List[str]]:
+        """Files and subdirectories of a directory, re-listed only when its mtime moved"""
+        cached = self._listings.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        files, dirs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                (dirs if entry.is_dir(follow_symlinks=False) else files).append(entry.path)
+        self._listings[path] = (mtime_ns, files, dirs)
+        return files, dirs
+
+    def scan(self) -> Dict[str, FileStat]:
+        """Stat every watched file; (mtime_ns, size) per path"""
+        stats: Dict[str, FileStat] = {}
+        pending = [str(path) for path in self.paths]
+        seen_dirs = set()
+        while pending:
+            current = pending.pop()
+            try:
+                info = os.stat(current)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if not S_ISDIR(info.st_mode):
+                stats[current] = (info.st_mtime_ns, info.st_size)
+                continue
+            try:
+                files, dirs = self._list_dir(current, info.st_mtime_ns)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            seen_dirs.add(current)
+            pending.extend(files)
+            pending.extend(dirs)
+        # Forget listings of directories that went away
+        for path in set(self._listings) - seen_dirs:
+            del self._listings[path]
+        return stats
+
+    def rebaseline(self) -> None:
+        """Accept the current file state, e.g. after a run wrote its own outputs"""
+        self._baseline = self.scan()
+
+    def _changed_paths(self, current: Dict[str, FileStat]) -> List[str]:
+        changed = {path for path, stat in current.items() if self._baseline.get(path) != stat}
+        changed.update(path for path in self._baseline if path not in current)
+        return sorted(changed)
+
+    def _wait_for_event(self) -> None:
+        if self._events is None:
+            time.sleep(self.poll_interval)
+        else:
+            next(self._events)
+
+    def wait_for_changes(self) -> List[str]:
+        """Block until a burst of changes has settled and return the changed paths"""
+        while True:
+            self._wait_for_event()
+            current = self.scan()
+            if not self._changed_paths(current):
+                continue
+
+            # Debounce: wait until a full quiet period passes without further changes
+            while True:
+                time.sleep(self.debounce)
+                latest = self.scan()
+                if latest == current:
+                    break
+                current = latest
+
+            changed = self._changed_paths(current)
+            if changed:
+                return changed
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+PersonaOps vector memory CLI - maintenance and monitoring for ORDAE vector memories
+
+Usage: python -m orchestrator.vectors cache-stats
+       python -m orchestrator.vectors backfill-from-ledger [--since ISO] [--limit N]
+       python -m orchestrator.vectors consolidate [--iterations-ttl-days 30] [--dry-run]
+"""
+import time
+from typing import Optional
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from .tools.blob_store import blob_store
+from .tools.embedding_cache import embedding_cache
+from .tools.ledger import ledger
+
+console = Console()
+app = typer.Typer(help="Maintain the ORDAE vector memory")
+
+@app.callback()
+def main():
+    """PersonaOps ORDAE vector memory tools"""
+
+@app.command("cache-stats")
+def cache_stats():
+    """Show embedding cache size and lifetime hit/miss counts"""
+    stats = embedding_cache.stats()
+    table = Table(title="Embedding cache")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Entries", f"{stats['entries']} / {stats['max_entries']}")
+    table.add_row("Hits", str(stats["total_hits"]))
+    table.add_row("Misses", str(stats["total_misses"]))
+    table.add_row("Hit rate", f"{stats['total_hit_rate']:.0%}")
+    console.print(table)
+    console.print(f"💿 Cache location: {embedding_cache.db_path}")
+
+@app.command("backfill-from-ledger")
+def backfill_from_ledger(
+    since: Optional[str] = typer.Option(None, "--since", help="Only entries at or after this ISO timestamp"),
+    limit: Optional[int] = typer.Option(None, "--limit", min=1, help="Stop after this many entries"),
+    chunk_size: int = typer.Option(2048, "--chunk-size", min=1, help="Ledger entries handed to store_memories at a time"),
+    workers: int = typer.Option(4, "--workers", min=1, help="Concurrent embedding/upsert requests")
+):
+    """Embed historical ledger entries into the vector store in bulk"""
+    from .tools.vector_memory_store import vector_memory_store
+    
+    started = time.perf_counter()
+    totals = {"states": 0, "stored": 0, "failed": 0, "requests": 0}
+    backend = None
+    chunk = []
+    
+    def flush():
+        nonlocal backend
+        result = vector_memory_store.store_memories(chunk, max_workers=workers)
+        backend = result["backend"]
+        for key in totals:
+            totals[key] += result[key]
+        console.print(f"📥 {totals['states']} entries processed ({result['per_second']:.0f}/s in last chunk)")
+        chunk.clear()
+    
+    # Entries are streamed and stored chunk by chunk, so memory stays bounded
+    for entry in ledger.iter_entries():
+        if since and (entry.get("timestamp") or "") < since:
+            continue
+        if limit is not None and totals["states"] + len(chunk) >= limit:
+            break
+        chunk.append(blob_store.resolve(entry))
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+    
+    seconds = time.perf_counter() - started
+    table = Table(title=f"Backfill from ledger ({backend or 'nothing to do'})")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Entries", str(totals["states"]))
+    table.add_row("Stored", str(totals["stored"]))
+    table.add_row("Failed", str(totals["failed"]))
+    table.add_row("Requests", str(totals["requests"]))
+    table.add_row("Seconds", f"{seconds:.2f}")
+    table.add_row("Entries/s", f"{totals['stored'] / seconds:.0f}" if seconds > 0 else "-")
+    console.print(table)
+    if totals["failed"]:
+        raise typer.Exit(code=1)
+
+@app.command()
+def consolidate(
+    iterations_ttl_days: Optional[float] = typer.Option(
+        None, "--iterations-ttl-days", help="Consolidate entries older than this (default ORDAE_MEMORY_TTL_ITERATIONS_DAYS, 0 = never)"
+    ),
+    episodes_ttl_days: Optional[float] = typer.Option(
+        None, "--episodes-ttl-days", help="Drop episodes older than this (default ORDAE_MEMORY_TTL_EPISODES_DAYS, 0 = never)"
+    ),
+    skip_vectors: bool = typer.Option(False, "--skip-vectors", help="Leave vector memories untouched"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be consolidated without changing anything")
+):
+    """Roll old ledger entries and vector memories into per-mission, per-university episodes"""
+    from .tools.consolidation import memory_consolidator
+    
+    stats = memory_consolidator.run(
+        iterations_ttl_days=iterations_ttl_days, episodes_ttl_days=episodes_ttl_days,
+        vectors=not skip_vectors, dry_run=dry_run
+    )
+    
+    if stats["updated"]:
+        table = Table(title="Episodes updated" + (" (dry run)" if dry_run else ""))
+        table.add_column("Period")
+        table.add_column("Mission")
+        table.add_column("University")
+        table.add_column("Iterations", justify="right")
+        table.add_column("Successes", justify="right")
+        table.add_column("Failures", justify="right")
+        table.add_column("Unknown", justify="right")
+        for episode in stats["updated"]:
+            table.add_row(episode["period"], episode["mission"], episode["target_university"],
+                          str(episode["iterations"]), str(episode["successes"]), str(episode["failures"]),
+                          str(episode.get("unknown", 0)))
+        console.print(table)
+    
+    table = Table(title="Memory consolidation" + (" (dry run)" if dry_run else ""))
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Cutoff", stats["cutoff"] or "iterations kept forever")
+    table.add_row("Entries consolidated", str(stats["entries_consolidated"]))
+    table.add_row("Entries already in episodes", str(stats["entries_already_folded"]))
+    table.add_row("Entries with unknown outcome", str(stats["entries_unknown_outcome"]))
+    table.add_row("Ledger entries removed", str(stats["entries_removed"]))
+    table.add_row("Local vectors removed", str(stats["vectors_removed"]))
+    table.add_row("Blobs removed", str(stats["blobs_removed"]))
+    table.add_row("Episodes updated", str(stats["episodes_updated"]))
+    table.add_row("Episodes expired", str(stats["episodes_expired"]))
+    table.add_row("Episodes total", str(stats["episodes_total"]))
+    console.print(table)
+
+if __name__ == "__main__":
+    app()